@@ -125,14 +125,24 @@ if VTK9:
                                                vtkMultiBlockDataSet,
                                                vtkCompositeDataSet,
                                                vtkFieldData,
+                                               vtkPointSet,
                                                vtkPolyData,
                                                vtkPolyLine,
                                                vtkRectilinearGrid,
                                                vtkImageData,
                                                vtkStaticPointLocator,
+                                               vtkStaticCellLocator,
+                                               vtkCellLocatorStrategy,
+                                               vtkGenericCell,
                                                vtkSelectionNode,
                                                vtkSelection,
                                                VTK_HEXAHEDRON,
+                                               VTK_LINE,
+                                               VTK_PIXEL,
+                                               VTK_POLYGON,
+                                               VTK_POLYHEDRON,
+                                               VTK_POLY_LINE,
+                                               VTK_POLY_VERTEX,
                                                VTK_PYRAMID,
                                                VTK_QUAD,
                                                VTK_QUADRATIC_HEXAHEDRON,
@@ -143,6 +153,9 @@ if VTK9:
                                                VTK_QUADRATIC_WEDGE,
                                                VTK_TETRA,
                                                VTK_TRIANGLE,
+                                               VTK_TRIANGLE_STRIP,
+                                               VTK_VERTEX,
+                                               VTK_VOXEL,
                                                VTK_WEDGE)
     from vtkmodules.vtkRenderingAnnotation import (vtkScalarBarActor,
                                                    vtkCornerAnnotation,
@@ -221,7 +234,8 @@ if VTK9:
                                           vtkLookupTable,
                                           VTK_UNSIGNED_CHAR,
                                           vtkAbstractArray,
-                                          vtkDoubleArray)
+                                          vtkDoubleArray,
+                                          reference)
     from vtkmodules.vtkCommonMath import (vtkMatrix4x4,
                                           vtkMatrix3x3)
     from vtkmodules.vtkCommonTransforms import vtkTransform
@@ -255,6 +269,8 @@ if VTK9:
                                            vtkContourFilter,
                                            vtkMarchingCubes,
                                            vtkFlyingEdges3D,
+                                           vtkGridSynchronizedTemplates3D,
+                                           vtkRectilinearSynchronizedTemplates,
                                            vtkCellCenters,
                                            vtkConnectivityFilter,
                                            vtkCellDataToPointData,
@@ -328,7 +344,8 @@ if VTK9:
                                            vtkImageDifference,
                                            vtkImageFlip,
                                            vtkRTAnalyticSource)
-    from vtkmodules.vtkFiltersFlowPaths import vtkStreamTracer
+    from vtkmodules.vtkFiltersFlowPaths import (vtkStreamTracer,
+                                               vtkInterpolatedVelocityField)
     from vtkmodules.vtkCommonExecutionModel import vtkImageToStructuredGrid
     from vtkmodules.numpy_interface.dataset_adapter import (VTKObjectWrapper,
                                                             numpyTovtkDataArray,
@@ -399,6 +416,9 @@ else:  # pragma: no cover
 
     import vtk
 
+    # ``reference`` was named ``mutable`` before VTK9
+    reference = vtk.mutable
+
     # match the imports for VTK9
     def lazy_vtkGL2PSExporter():
         """Lazy import of the vtkGL2PSExporter."""
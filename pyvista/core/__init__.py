@@ -3,8 +3,10 @@
 from .dataset import DataSet, DataObject
 from .composite import MultiBlock
 from .datasetattributes import DataSetAttributes
-from .filters import (CompositeFilters, DataSetFilters, PolyDataFilters,
-                      UnstructuredGridFilters, UniformGridFilters)
+from ._bound_filter import BoundFilter
+from .filters import (CompositeFilters, DataSetFilters,
+                      PolyDataFilters, UnstructuredGridFilters,
+                      UniformGridFilters)
 from .grid import Grid, RectilinearGrid, UniformGrid
 from .objects import Table, Texture
 from .pointset import PointGrid, PolyData, StructuredGrid, UnstructuredGrid, ExplicitStructuredGrid
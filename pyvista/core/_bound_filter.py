@@ -0,0 +1,156 @@
+"""Filters bound to a dataset with a persistent output."""
+
+from pyvista import _vtk
+
+
+def _same_structure(output, new):
+    """Return whether ``new`` has the types and blocks of ``output``."""
+    if type(output) is not type(new):
+        return False
+    if isinstance(output, _vtk.vtkMultiBlockDataSet):
+        return (output.n_blocks == new.n_blocks and
+                all(_same_structure(output[i], new[i]) for i in range(output.n_blocks)))
+    return True
+
+
+def _refresh_output(output, new):
+    """Copy ``new`` into ``output`` in place, block by block for composites.
+
+    The blocks of a composite ``output`` are kept rather than replaced,
+    since plotters map each block separately.
+
+    """
+    if output is None:
+        return
+    if isinstance(output, _vtk.vtkMultiBlockDataSet):
+        for i in range(output.n_blocks):
+            output.set_block_name(i, new.get_block_name(i))
+            _refresh_output(output[i], new[i])
+        return
+    output.shallow_copy(new)
+    output.copy_meta_from(new)
+
+
+class BoundFilter:
+    """A filter bound to a dataset that refreshes a persistent output.
+
+    Calling a filter returns a new dataset each time, so a renderer
+    showing the result has to be given the new mesh after every
+    change of the filter parameters.  A bound filter instead copies
+    each result into the same :attr:`output`, which can be added to a
+    plotter once and is refreshed in place by :func:`BoundFilter.update`.
+
+    Use :func:`DataSetFilters.bind_filter` to create one.
+
+    Parameters
+    ----------
+    dataset : pyvista.DataSet
+        Input of the filter.
+
+    name : str
+        Name of the filter method of ``dataset``, for example ``'clip'``.
+
+    **kwargs : dict, optional
+        Initial parameters of the filter.
+
+    Examples
+    --------
+    >>> import pyvista as pv
+    >>> mesh = pv.Sphere()
+    >>> clipper = pv.BoundFilter(mesh, 'clip', normal='x')
+    >>> clipped = clipper.output
+    >>> _ = clipper.update(normal='-x')
+    >>> clipped is clipper.output
+    True
+
+    """
+
+    def __init__(self, dataset, name, **kwargs):
+        """Initialize the bound filter and run it once."""
+        method = getattr(dataset, name, None)
+        if name.startswith('_') or not callable(method):
+            raise ValueError(f'Filter `{name}` not understood.')
+        if kwargs.get('inplace', False):
+            raise ValueError('A bound filter cannot be applied in place.')
+        self._dataset = dataset
+        self._method = method
+        self._kwargs = {}
+        self._mtime = None
+        self._output = None
+        self.update(**kwargs)
+
+    @property
+    def dataset(self):
+        """Return the input of the filter."""
+        return self._dataset
+
+    @property
+    def name(self):
+        """Return the name of the filter."""
+        return self._method.__name__
+
+    @property
+    def parameters(self):
+        """Return a copy of the current parameters of the filter."""
+        return dict(self._kwargs)
+
+    @property
+    def output(self):
+        """Return the persistent output of the filter.
+
+        This is a tuple of datasets for filters returning several
+        datasets, such as ``clip`` with ``return_clipped=True``.
+
+        """
+        return self._output
+
+    def update(self, **kwargs):
+        """Rerun the filter and refresh :attr:`output` in place.
+
+        The filter only runs when parameters are given or when the
+        input dataset has been modified since the last run.  The
+        blocks of a ``pyvista.MultiBlock`` output are refreshed in
+        place, so the output cannot change its type or its number of
+        blocks.
+
+        Parameters
+        ----------
+        **kwargs : dict, optional
+            Parameters of the filter to change.  Other parameters keep
+            their current value.
+
+        Returns
+        -------
+        pyvista.DataSet or tuple(pyvista.DataSet)
+            The persistent output of the filter.
+
+        """
+        if kwargs.get('inplace', False):
+            raise ValueError('A bound filter cannot be applied in place.')
+        if not kwargs and self._mtime == self._dataset.GetMTime():
+            return self._output
+        params = dict(self._kwargs, **kwargs)
+        result = self._method(**params)
+        # some filters set the active arrays of their input
+        self._mtime = self._dataset.GetMTime()
+        self._kwargs = params
+
+        multiple = isinstance(result, tuple)
+        results = result if multiple else (result,)
+        if not all(isinstance(item, _vtk.vtkDataObject) for item in results):
+            raise TypeError(f'Filter `{self.name}` does not return datasets.')
+        if self._output is None:
+            # never hand out the input as the persistent output
+            outputs = tuple(item.copy(deep=False) if item is self._dataset else item
+                            for item in results)
+            self._output = outputs if multiple else outputs[0]
+            return self._output
+
+        outputs = self._output if isinstance(self._output, tuple) else (self._output,)
+        if len(outputs) != len(results) or not all(
+                _same_structure(old, new) for old, new in zip(outputs, results)):
+            raise TypeError(f'The output type of filter `{self.name}` changed. '
+                            'Create a new bound filter for these parameters.')
+        for output, new in zip(outputs, results):
+            _refresh_output(output, new)
+        return self._output
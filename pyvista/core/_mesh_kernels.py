@@ -0,0 +1,1551 @@
+"""Private numpy kernels of the dataset filters."""
+
+import collections
+
+import numpy as np
+
+import pyvista
+from pyvista import _vtk
+from pyvista.utilities import NORMALS, get_array, transformations, wrap
+from pyvista.utilities.cells import numpy_to_idarr
+from pyvista.utilities._mesh_arrays import (_append_attributes, _append_datasets,
+                                            _cell_array_to_numpy, _copy_active_attributes,
+                                            _copy_cells_data, _cross, _dot, _gather_cells,
+                                            _group_rows, _norm, _numpy_to_cell_array, _points_key,
+                                            _renumber_points, _topology_key)
+from pyvista.utilities._raycast import _implicit_distance
+from pyvista.core.errors import NotAllTrianglesError
+
+
+def _image_slab(image, axis, value, flip=False):
+    """Extract the two layers of an image bracketing ``value`` along ``axis``.
+
+    A plane on a voxel layer is cut by vtkCutter from the cells behind
+    it with respect to the normal, so ``flip`` marks a negative normal.
+
+    """
+    voi = list(image.GetExtent())
+    index = (value - image.origin[axis]) / image.spacing[axis]
+    if flip:
+        layer = int(np.floor(index))
+    else:
+        layer = int(np.ceil(index)) - 1
+    layer = min(max(layer, voi[axis*2]), voi[axis*2 + 1] - 1)
+    voi[axis*2:axis*2 + 2] = [layer, layer + 1]
+    alg = _vtk.vtkExtractVOI()
+    alg.SetInputDataObject(image)
+    alg.SetVOI(voi)
+    alg.Update()
+    return pyvista.core.filters._get_output(alg)
+
+
+def _axis_aligned_normal(normal):
+    """Return the axis index of an axis-aligned normal and if it is negative.
+
+    The axis index is ``None`` when the normal is not axis-aligned.
+
+    """
+    if isinstance(normal, str):
+        normal = NORMALS[normal.lower()]
+    normal = np.asarray(normal, dtype=float)
+    if np.count_nonzero(normal) != 1:
+        return None, False
+    axis = int(np.argmax(np.abs(normal)))
+    return axis, bool(normal[axis] < 0)
+
+
+def _image_layer(image, axis, value, flip=False, tolerance=1e-6):
+    """Return the plane of an image at ``value`` along ``axis`` as an image.
+
+    Point data is taken directly from the voxel layer when the plane
+    lies on one, and linearly interpolated between the two bracketing
+    layers otherwise.  Layers normal to ``z`` are contiguous in memory
+    and are returned as views of the parent arrays.  ``flip`` marks a
+    plane with a negative normal.
+
+    """
+    extent = image.GetExtent()
+    dims = image.dimensions
+    spacing = image.spacing
+    start = np.array(image.origin) + np.array(extent[::2])*np.array(spacing)
+    index = (value - start[axis]) / spacing[axis]
+    if index < -tolerance or index > dims[axis] - 1 + tolerance:
+        raise ValueError(f'Slice at {value} lies outside of the dataset bounds')
+
+    layer = int(round(index))
+    if abs(index - layer) <= tolerance:
+        weight = 0.0
+    else:
+        layer = int(np.floor(index))
+        weight = index - layer
+
+    out_dims = list(dims)
+    out_dims[axis] = 1
+    origin = start.copy()
+    origin[axis] = value
+    out = pyvista.UniformGrid(out_dims, spacing, origin)
+
+    def take(array, shape, ind):
+        if axis == 2:  # contiguous block of the array
+            n = shape[0]*shape[1]
+            return array[ind*n:(ind + 1)*n]
+        values = array.reshape(tuple(shape[::-1]) + array.shape[1:])
+        return np.ascontiguousarray(np.take(values, ind, axis=2 - axis).reshape(
+            (-1,) + array.shape[1:]))
+
+    point_data = image.GetPointData()
+    for i in range(point_data.GetNumberOfArrays()):
+        array = point_data.GetArray(i)
+        if array is None:
+            continue
+        values = _vtk.vtk_to_numpy(array)
+        layer_values = take(values, dims, layer)
+        if weight:
+            upper = take(values, dims, layer + 1)
+            layer_values = (1 - weight)*layer_values + weight*upper
+            if np.issubdtype(values.dtype, np.integer):
+                layer_values = np.round(layer_values)
+            layer_values = layer_values.astype(values.dtype)
+        out.point_arrays.append(layer_values, array.GetName(),
+                                active_vectors=False, active_scalars=False)
+
+    # match vtkCutter, which takes a plane on a voxel layer from the
+    # cells behind it with respect to the normal
+    cell_dims = [max(dim - 1, 1) for dim in dims]
+    cell_layer = layer if weight or flip else layer - 1
+    cell_layer = min(max(cell_layer, 0), cell_dims[axis] - 1)
+    cell_data = image.GetCellData()
+    for i in range(cell_data.GetNumberOfArrays()):
+        array = cell_data.GetArray(i)
+        if array is None:
+            continue
+        values = take(_vtk.vtk_to_numpy(array), cell_dims, cell_layer)
+        out.cell_arrays.append(values, array.GetName(),
+                               active_vectors=False, active_scalars=False)
+
+    _copy_active_attributes(point_data, out.GetPointData())
+    _copy_active_attributes(cell_data, out.GetCellData())
+    out.GetFieldData().ShallowCopy(image.GetFieldData())
+    out.copy_meta_from(image)
+    return out
+
+
+def _first_point_ids(poly_data):
+    """Return the id of the first point of each cell of a ``PolyData``."""
+    first = []
+    for carr in (poly_data.GetVerts(), poly_data.GetLines(),
+                 poly_data.GetPolys(), poly_data.GetStrips()):
+        offsets, connectivity = _cell_array_to_numpy(carr)
+        first.append(connectivity[offsets[:-1]])
+    return np.hstack(first)
+
+
+def _split_poly_data(poly_data, labels, n_labels):
+    """Split a ``PolyData`` into one ``PolyData`` per cell label.
+
+    The cells are gathered with a single stable sort of ``labels``
+    rather than by filtering the whole dataset once per label.  Cell
+    order, point data, cell data and field data are preserved.
+
+    Parameters
+    ----------
+    poly_data : pyvista.PolyData
+        Dataset to split.
+
+    labels : np.ndarray
+        Integer label of each cell in ``[0, n_labels)``.
+
+    n_labels : int
+        Number of output datasets.
+
+    Returns
+    -------
+    pieces : list(pyvista.PolyData)
+        One dataset per label.  Labels without cells give an empty
+        ``PolyData``.
+
+    """
+    cell_arrays = [poly_data.GetVerts(), poly_data.GetLines(),
+                   poly_data.GetPolys(), poly_data.GetStrips()]
+    cell_arrays = [_cell_array_to_numpy(carr) for carr in cell_arrays]
+    # global cell ids are ordered verts, lines, polys, then strips
+    type_starts = np.cumsum([0] + [off.size - 1 for off, _ in cell_arrays])
+
+    order = np.argsort(labels, kind='stable')
+    label_bounds = np.searchsorted(labels[order], np.arange(n_labels + 1))
+    points = poly_data.points
+
+    pieces = []
+    for i in range(n_labels):
+        cell_ids = order[label_bounds[i]:label_bounds[i + 1]]
+        type_bounds = np.searchsorted(cell_ids, type_starts)
+        gathered = [_gather_cells(offsets, connectivity,
+                                  cell_ids[type_bounds[j]:type_bounds[j + 1]] - type_starts[j])
+                    for j, (offsets, connectivity) in enumerate(cell_arrays)]
+        point_ids, inverse = np.unique(np.hstack([conn for _, conn in gathered]),
+                                       return_inverse=True)
+        piece = pyvista.PolyData()
+        piece.points = points[point_ids]
+
+        start = 0
+        new_cell_arrays = []
+        for offsets, connectivity in gathered:
+            stop = start + connectivity.size
+            new_cell_arrays.append(_numpy_to_cell_array(offsets, inverse[start:stop]))
+            start = stop
+        piece.SetVerts(new_cell_arrays[0])
+        piece.SetLines(new_cell_arrays[1])
+        piece.SetPolys(new_cell_arrays[2])
+        piece.SetStrips(new_cell_arrays[3])
+        _copy_cells_data(poly_data, piece, point_ids, cell_ids)
+        pieces.append(piece)
+    return pieces
+
+
+def _dataset_cells(dataset):
+    """Return the offsets and connectivity of all the cells of a dataset.
+
+    Cells of a ``PolyData`` are in the order of their ids: verts,
+    lines, polys, then strips.  Other datasets are cast to an
+    ``UnstructuredGrid``, where polyhedra list their points without
+    their faces.
+
+    """
+    if isinstance(dataset, _vtk.vtkPolyData):
+        cell_arrays = [_cell_array_to_numpy(carr) for carr in
+                       (dataset.GetVerts(), dataset.GetLines(),
+                        dataset.GetPolys(), dataset.GetStrips())]
+        # empty cell arrays may have no offsets at all
+        sizes = np.hstack([np.diff(off) for off, _ in cell_arrays])
+        offsets = np.zeros(sizes.size + 1, dtype=pyvista.ID_TYPE)
+        np.cumsum(sizes, out=offsets[1:])
+        connectivity = np.hstack([conn for _, conn in cell_arrays])
+        return offsets, connectivity.astype(pyvista.ID_TYPE, copy=False)
+    if not isinstance(dataset, _vtk.vtkUnstructuredGrid):
+        dataset = dataset.cast_to_unstructured_grid()
+    return _cell_array_to_numpy(dataset.GetCells())
+
+
+def _connected_regions(offsets, connectivity, n_points):
+    """Label the cells connected through their points.
+
+    Regions are found with a vectorized union-find over the points:
+    each pass hooks the root of every point of a cell to the smallest
+    root in that cell, then compresses the paths to their roots, so the
+    number of passes grows with the logarithm of the region diameters
+    rather than with the number of regions.  Cells without points are
+    regions of their own.
+
+    Returns
+    -------
+    labels : np.ndarray
+        Region of each cell, numbered by order of first appearance
+        like ``vtkConnectivityFilter``.
+
+    sizes : np.ndarray
+        Number of cells of each region.
+
+    """
+    sizes = np.diff(offsets)
+    nonempty = sizes > 0
+    starts = offsets[:-1][nonempty]
+    counts = sizes[nonempty]
+    parent = np.arange(n_points, dtype=pyvista.ID_TYPE)
+    while connectivity.size:
+        roots = parent[connectivity]
+        smallest = np.repeat(np.minimum.reduceat(roots, starts), counts)
+        hook = roots != smallest
+        if not hook.any():
+            break
+        np.minimum.at(parent, roots[hook], smallest[hook])
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    # cells without points get keys past the point ids
+    keys = n_points + np.arange(sizes.size, dtype=pyvista.ID_TYPE)
+    keys[nonempty] = parent[connectivity[starts]]
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty(order.size, dtype=pyvista.ID_TYPE)
+    rank[order] = np.arange(order.size, dtype=pyvista.ID_TYPE)
+    labels = rank[inverse.ravel()]
+    return labels, np.bincount(labels, minlength=order.size)
+
+
+def _split_grid(dataset, labels, n_labels, grid=None):
+    """Split a dataset into one ``UnstructuredGrid`` per cell label.
+
+    All the pieces are gathered at once: the cells are sorted by label
+    with a single stable sort, and the points of every piece are
+    renumbered by first appearance with one more sort, which matches
+    ``vtkThreshold``.  Cells with labels outside of ``[0, n_labels)``
+    are dropped.  ``grid`` is ``dataset`` as an ``UnstructuredGrid`` and
+    may be passed to avoid casting it again.
+
+    """
+    if grid is None:
+        grid = dataset
+        if not isinstance(dataset, _vtk.vtkUnstructuredGrid):
+            grid = dataset.cast_to_unstructured_grid()
+    order = np.argsort(labels, kind='stable')
+    label_bounds = np.searchsorted(labels[order], np.arange(n_labels + 1))
+    if np.any(grid.celltypes == _vtk.VTK_POLYHEDRON):
+        # polyhedra store their faces outside of the cell connectivity
+        return [_extract_cells_by_id(dataset, order[label_bounds[i]:label_bounds[i + 1]],
+                                     grid) for i in range(n_labels)]
+
+    order = order[label_bounds[0]:label_bounds[-1]]
+    label_bounds -= label_bounds[0]
+    offsets, connectivity = _cell_array_to_numpy(grid.GetCells())
+    new_offsets, new_connectivity = _gather_cells(offsets, connectivity, order)
+    cell_types = grid.celltypes[order]
+
+    # one key per point of each piece, ranked by first appearance
+    n_points = grid.n_points
+    entry_labels = np.repeat(labels[order].astype(pyvista.ID_TYPE), np.diff(new_offsets))
+    keys = entry_labels*n_points + new_connectivity
+    unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    by_appearance = np.argsort(first)
+    rank = np.empty(by_appearance.size, dtype=pyvista.ID_TYPE)
+    rank[by_appearance] = np.arange(by_appearance.size, dtype=pyvista.ID_TYPE)
+    unique_keys = unique_keys[by_appearance]
+    point_ids = unique_keys % max(n_points, 1)
+    point_bounds = np.searchsorted(unique_keys // max(n_points, 1), np.arange(n_labels + 1))
+    new_connectivity = rank[inverse.ravel()]
+
+    points = grid.points
+    pieces = []
+    for i in range(n_labels):
+        cell_start, cell_stop = label_bounds[i], label_bounds[i + 1]
+        point_start, point_stop = point_bounds[i], point_bounds[i + 1]
+        piece_offsets = new_offsets[cell_start:cell_stop + 1] - new_offsets[cell_start]
+        piece_connectivity = (new_connectivity[new_offsets[cell_start]:new_offsets[cell_stop]]
+                              - point_start)
+        piece = pyvista.UnstructuredGrid()
+        piece.points = points[point_ids[point_start:point_stop]]
+        cells = _numpy_to_cell_array(piece_offsets, piece_connectivity)
+        piece_types = np.ascontiguousarray(cell_types[cell_start:cell_stop])
+        if _vtk.VTK9:
+            piece.SetCells(_vtk.numpy_to_vtk(piece_types, deep=True), cells)
+        else:  # pragma: no cover
+            locations = piece_offsets[:-1] + np.arange(cell_stop - cell_start)
+            piece.SetCells(_vtk.numpy_to_vtk(piece_types, deep=True),
+                           numpy_to_idarr(locations, deep=True), cells)
+        _copy_cells_data(dataset, piece, point_ids[point_start:point_stop],
+                         order[cell_start:cell_stop])
+        pieces.append(piece)
+    return pieces
+
+
+def _unstructured_geometry(dataset):
+    """Return the points and cells of a dataset as an ``UnstructuredGrid``.
+
+    Only the geometry is cast, so none of the data arrays of a
+    structured dataset are copied to read its connectivity.  The cells
+    of three dimensional grids without blanking are directly built from
+    their dimensions.
+
+    """
+    if isinstance(dataset, _vtk.vtkUnstructuredGrid):
+        return dataset
+    ghosts = _vtk.vtkDataSetAttributes.GhostArrayName()
+    structured = (pyvista.UniformGrid, pyvista.RectilinearGrid, pyvista.StructuredGrid)
+    if (isinstance(dataset, structured) and min(dataset.dimensions) > 1
+            and ghosts not in dataset.point_arrays and ghosts not in dataset.cell_arrays):
+        # hexahedral cells are built from the dimensions, following the
+        # point ordering of vtkVoxel or vtkHexahedron
+        nx, ny, nz = dataset.dimensions
+        i, j, k = np.meshgrid(np.arange(nx - 1), np.arange(ny - 1), np.arange(nz - 1),
+                              indexing='ij')
+        first = (i + nx*(j + ny*k)).ravel(order='F').astype(pyvista.ID_TYPE)
+        corners = np.array([0, 1, nx, nx + 1], dtype=pyvista.ID_TYPE)
+        if isinstance(dataset, pyvista.StructuredGrid):
+            corners = corners[[0, 1, 3, 2]]
+            cell_type = _vtk.VTK_HEXAHEDRON
+        else:
+            cell_type = _vtk.VTK_VOXEL
+        corners = np.hstack((corners, corners + nx*ny))
+        connectivity = (first[:, np.newaxis] + corners).ravel()
+        offsets = np.arange(0, connectivity.size + 1, 8, dtype=pyvista.ID_TYPE)
+        geometry = pyvista.UnstructuredGrid()
+        geometry.points = dataset.points
+        cell_types = _vtk.numpy_to_vtk(np.full(first.size, cell_type, dtype=np.uint8),
+                                       deep=True)
+        cells = _numpy_to_cell_array(offsets, connectivity)
+        if _vtk.VTK9:
+            geometry.SetCells(cell_types, cells)
+        else:  # pragma: no cover
+            locations = offsets[:-1] + np.arange(first.size)
+            geometry.SetCells(cell_types, numpy_to_idarr(locations, deep=True), cells)
+        return geometry
+    geometry = dataset.copy(deep=False)
+    geometry.clear_arrays()
+    return geometry.cast_to_unstructured_grid()
+
+
+def _interpolation_weights(celltype, corners, points):
+    """Return the interpolation weights of points in cells of ``celltype``.
+
+    ``corners`` has shape ``(3, n_corners, n)`` and ``points`` has
+    shape ``(3, n)``.  The weights are those of
+    ``vtkCell.EvaluatePosition`` for vertices, lines, triangles,
+    tetrahedra, pixels and voxels, and ``None`` is returned for any
+    other cell type.
+
+    """
+    p = [corners[:, i] for i in range(corners.shape[1])]
+    if celltype == _vtk.VTK_VERTEX:
+        return np.ones((1, points.shape[1]))
+    if celltype == _vtk.VTK_LINE:
+        direction = p[1] - p[0]
+        t = _dot(points - p[0], direction)/_dot(direction, direction)
+        return np.array([1 - t, t])
+    if celltype == _vtk.VTK_TRIANGLE:
+        # barycentric coordinates of the projection on the plane of the triangle
+        u, v, w = p[1] - p[0], p[2] - p[0], points - p[0]
+        uu, uv, vv = _dot(u, u), _dot(u, v), _dot(v, v)
+        wu, wv = _dot(w, u), _dot(w, v)
+        det = uu*vv - uv*uv
+        r = (vv*wu - uv*wv)/det
+        s = (uu*wv - uv*wu)/det
+        return np.array([1 - r - s, r, s])
+    if celltype == _vtk.VTK_TETRA:
+        u, v, w, x = p[1] - p[0], p[2] - p[0], p[3] - p[0], points - p[0]
+        det = _dot(u, _cross(v, w))
+        r = _dot(x, _cross(v, w))/det
+        s = _dot(u, _cross(x, w))/det
+        t = _dot(u, _cross(v, x))/det
+        return np.array([1 - r - s - t, r, s, t])
+    if celltype in (_vtk.VTK_PIXEL, _vtk.VTK_VOXEL):
+        # axis aligned cells whose corners are ordered along the bits
+        # of their index, and pixels lie along their non flat axes
+        n_axes = 2 if celltype == _vtk.VTK_PIXEL else 3
+        extent = p[-1] - p[0]
+        axes = np.argsort(extent == 0, axis=0, kind='stable')[:n_axes]
+        pcoords = (np.take_along_axis(points - p[0], axes, axis=0)
+                   / np.take_along_axis(extent, axes, axis=0))
+        bits = (np.arange(2**n_axes)[:, np.newaxis] >> np.arange(n_axes)) & 1
+        return np.where(bits[:, :, np.newaxis], pcoords, 1 - pcoords).prod(axis=1)
+    return None
+
+
+def _probe_weights(dataset, points, tolerance, chunk_size=8192):
+    """Return the cells containing points and their interpolation weights.
+
+    Returns the id of the cell containing each point, or ``-1``, and
+    ``(n_points, max_cell_size)`` arrays of the ids of the points of
+    that cell, padded with ``-1``, and of their interpolation weights.
+
+    Only the ids of the cells are probed.  The weights of the located
+    cells are then computed in chunks of points by
+    :func:`_interpolation_weights`, or one point at a time with
+    ``vtkCell.EvaluatePosition`` for the other cell types.
+
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    n_points = points.shape[0]
+    max_size = max(dataset.GetMaxCellSize(), 1)
+    cell_ids = np.full(n_points, -1, dtype=pyvista.ID_TYPE)
+    point_ids = np.full((n_points, max_size), -1, dtype=pyvista.ID_TYPE)
+    weights = np.zeros((n_points, max_size))
+    if not n_points or not dataset.n_cells:
+        return cell_ids, point_ids, weights
+
+    source = dataset.copy(deep=False)
+    source.clear_arrays()
+    source.cell_arrays['_cell_ids'] = np.arange(dataset.n_cells, dtype=pyvista.ID_TYPE)
+    alg = _vtk.vtkProbeFilter()
+    alg.SetInputData(pyvista.PolyData(points))
+    alg.SetSourceData(source)
+    if _vtk.VTK9:
+        strategy = _vtk.vtkCellLocatorStrategy()
+        strategy.SetCellLocator(_vtk.vtkStaticCellLocator())
+        alg.SetFindCellStrategy(strategy)
+    alg.SetComputeTolerance(False)
+    alg.SetTolerance(tolerance)
+    alg.SetPassPointArrays(False)
+    alg.Update()
+    probed = pyvista.core.filters._get_output(alg)
+    found = np.flatnonzero(probed['vtkValidPointMask'])
+    cell_ids[found] = probed['_cell_ids'][found]
+
+    grid = _unstructured_geometry(dataset)
+    offsets, connectivity = _cell_array_to_numpy(grid.GetCells())
+    grid_points = np.asarray(grid.points, dtype=float).T
+    celltypes = grid.celltypes[cell_ids[found]]
+    slot_range = np.arange(max_size)
+    cell = _vtk.vtkGenericCell()
+    closest = [0.0, 0.0, 0.0]
+    pcoords = [0.0, 0.0, 0.0]
+    sub_id = _vtk.reference(0)
+    dist2 = _vtk.reference(0.0)
+    cell_weights = np.empty(max_size)
+    for celltype in np.unique(celltypes):
+        selected = found[celltypes == celltype]
+        for start in range(0, selected.size, chunk_size):
+            chunk = selected[start:start + chunk_size]
+            starts = offsets[cell_ids[chunk]]
+            sizes = offsets[cell_ids[chunk] + 1] - starts
+            inside = slot_range < sizes[:, np.newaxis]
+            chunk_ids = np.full((chunk.size, max_size), -1, dtype=pyvista.ID_TYPE)
+            chunk_ids[inside] = connectivity[(starts[:, np.newaxis] + slot_range)[inside]]
+            point_ids[chunk] = chunk_ids
+            corners = grid_points[:, chunk_ids[:, :sizes[0]].T]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                chunk_weights = _interpolation_weights(celltype, corners, points[chunk].T)
+            if chunk_weights is not None:
+                weights[chunk, :sizes[0]] = chunk_weights.T
+                continue
+            for i in chunk:
+                grid.GetCell(cell_ids[i], cell)
+                cell.EvaluatePosition(points[i], closest, sub_id, pcoords, dist2,
+                                      cell_weights)
+                n_ids = cell.GetNumberOfPoints()
+                weights[i, :n_ids] = cell_weights[:n_ids]
+    return cell_ids, point_ids, weights
+
+
+def _extract_cells_by_id(dataset, cell_ids, grid=None):
+    """Extract cells by id into an ``UnstructuredGrid`` using numpy.
+
+    Points are renumbered by first appearance so the output matches
+    ``vtkThreshold``.  ``grid`` is ``dataset`` as an
+    ``UnstructuredGrid`` and may be passed to avoid casting it again.
+
+    """
+    if grid is None:
+        grid = _unstructured_geometry(dataset)
+    if np.any(grid.celltypes == _vtk.VTK_POLYHEDRON):
+        # polyhedra store their faces outside of the cell connectivity
+        return pyvista.DataSetFilters.extract_cells(dataset, cell_ids)
+    offsets, connectivity = _cell_array_to_numpy(grid.GetCells())
+    new_offsets, new_connectivity = _gather_cells(offsets, connectivity, cell_ids)
+    point_ids, new_connectivity = _renumber_points(new_connectivity, grid.n_points)
+
+    output = pyvista.UnstructuredGrid()
+    output.points = grid.points[point_ids]
+    cell_types = np.ascontiguousarray(grid.celltypes[cell_ids])
+    cells = _numpy_to_cell_array(new_offsets, new_connectivity)
+    if _vtk.VTK9:
+        output.SetCells(_vtk.numpy_to_vtk(cell_types, deep=True), cells)
+    else:  # pragma: no cover
+        locations = new_offsets[:-1] + np.arange(cell_ids.size)
+        output.SetCells(_vtk.numpy_to_vtk(cell_types, deep=True),
+                        numpy_to_idarr(locations, deep=True), cells)
+    _copy_cells_data(dataset, output, point_ids, cell_ids)
+    return output
+
+
+def _transform_point_set(dataset, matrix, transform_all_input_vectors=False,
+                         inplace=False):
+    """Transform a point set with an affine 4x4 matrix using numpy.
+
+    Mirrors ``vtkTransformFilter``: the points and the active vectors
+    of the point and cell data are transformed, along with all their
+    three component arrays when ``transform_all_input_vectors`` is
+    true, and the active normals are transformed by the inverse
+    transpose and normalized.  Arrays keep their type.  The arrays of
+    ``dataset`` are overwritten when ``inplace`` is true, otherwise
+    the untransformed arrays are shared with the output.
+
+    """
+    output = dataset if inplace else dataset.copy(deep=False)
+    linear = matrix[:3, :3]
+    translation = matrix[:3, 3]
+    points = dataset.points
+    if inplace:
+        transformations._transform_array(linear, points, points, translation)
+        dataset.GetPoints().Modified()
+    else:
+        new_points = np.empty(points.shape, dtype=points.dtype)
+        transformations._transform_array(linear, points, new_points, translation)
+        output.SetPoints(pyvista.vtk_points(new_points, deep=False))
+
+    normal_matrix = np.linalg.inv(linear).T
+    for source, target in ((dataset.GetPointData(), output.GetPointData()),
+                           (dataset.GetCellData(), output.GetCellData())):
+        vectors, normals = source.GetVectors(), source.GetNormals()
+        candidates = [vectors, normals]
+        if transform_all_input_vectors:
+            candidates += [source.GetArray(i) for i in range(source.GetNumberOfArrays())]
+        arrays = []
+        for array in candidates:
+            if (array is None or isinstance(array, _vtk.vtkBitArray) or
+                    array.GetNumberOfComponents() != 3):
+                continue
+            if array.GetName() is None and array is not vectors and array is not normals:
+                continue
+            if not any(array is other for other in arrays):
+                arrays.append(array)
+        for array in arrays:
+            # like vtkTransformFilter, an array that is both the active
+            # vectors and normals is transformed as vectors
+            is_normals = array is normals and array is not vectors
+            values = _vtk.vtk_to_numpy(array)
+            out = values if inplace else np.empty(values.shape, dtype=values.dtype)
+            transformations._transform_array(normal_matrix if is_normals else linear,
+                                             values, out, normalize=is_normals)
+            if inplace:
+                array.Modified()
+                continue
+            vtk_array = _vtk.numpy_to_vtk(out)
+            vtk_array.SetName(array.GetName())
+            if array is vectors:
+                target.SetVectors(vtk_array)
+            if array is normals:
+                target.SetNormals(vtk_array)
+            if array is not vectors and array is not normals:
+                target.AddArray(vtk_array)
+    if inplace:
+        dataset.Modified()
+    return output
+
+
+def _averaging_operators(dataset):
+    """Return the cached cell to point and point to cell averaging operators.
+
+    The operators are ``scipy.sparse.csr_matrix`` of shape
+    ``(n_points, n_cells)`` and ``(n_cells, n_points)`` built from the
+    connectivity of ``dataset``.  They are stored on ``dataset`` and
+    rebuilt only when its connectivity changes.
+
+    """
+    try:
+        from scipy import sparse
+    except ImportError:  # pragma: no cover
+        raise ImportError('scipy must be available to use this filter.')
+
+    key = _topology_key(dataset)
+    cache = getattr(dataset, '_averaging_operators', None)
+    if cache is not None and cache[0] == key:
+        return cache[1], cache[2]
+
+    if isinstance(dataset, _vtk.vtkPolyData):
+        cell_arrays = [dataset.GetVerts(), dataset.GetLines(),
+                       dataset.GetPolys(), dataset.GetStrips()]
+    else:
+        grid = dataset
+        if not isinstance(dataset, _vtk.vtkUnstructuredGrid):
+            grid = dataset.cast_to_unstructured_grid()
+        cell_arrays = [grid.GetCells()]
+    # global cell ids follow the order of the cell arrays
+    sizes = []
+    connectivity = []
+    for carr in cell_arrays:
+        offsets, conn = _cell_array_to_numpy(carr)
+        sizes.append(np.diff(offsets))
+        connectivity.append(conn)
+    sizes = np.concatenate(sizes)
+    cell_ids = np.repeat(np.arange(sizes.size), sizes)
+    point_ids = np.concatenate(connectivity)
+
+    n_points = dataset.GetNumberOfPoints()
+    n_cells = dataset.GetNumberOfCells()
+    incidence = sparse.csr_matrix((np.ones(point_ids.size), (point_ids, cell_ids)),
+                                  shape=(n_points, n_cells))
+    # points repeated within a cell only contribute once
+    incidence.sum_duplicates()
+    incidence.data[:] = 1.0
+
+    def normalize_rows(matrix):
+        counts = np.diff(matrix.indptr)
+        matrix.data /= np.repeat(counts, counts)
+        return matrix
+
+    cell_to_point = normalize_rows(incidence.copy())
+    point_to_cell = normalize_rows(incidence.transpose().tocsr())
+    dataset._averaging_operators = (key, cell_to_point, point_to_cell)
+    return cell_to_point, point_to_cell
+
+
+def _cell_edges(poly_data, cell_arrays=('polys', 'lines', 'strips')):
+    """Return the start and end points of the sides of each cell of a ``PolyData``.
+
+    Polygons are closed, lines are open and triangle strips also join
+    every other point.  Shared sides are repeated once per cell.
+
+    """
+    starts = [np.empty(0, dtype=pyvista.ID_TYPE)]
+    ends = [np.empty(0, dtype=pyvista.ID_TYPE)]
+    layouts = {'polys': (poly_data.GetPolys(), True, (1, )),
+               'lines': (poly_data.GetLines(), False, (1, )),
+               'strips': (poly_data.GetStrips(), False, (1, 2))}
+    for name in cell_arrays:
+        cell_array, closed, steps = layouts[name]
+        offsets, connectivity = _cell_array_to_numpy(cell_array)
+        if not connectivity.size:
+            continue
+        cell_ids = np.repeat(np.arange(offsets.size - 1), np.diff(offsets))
+        for step in steps:
+            following = np.arange(connectivity.size) + step
+            if closed:
+                wrap = following >= offsets[cell_ids + 1]
+                following[wrap] -= np.diff(offsets)[cell_ids[wrap]]
+                valid = slice(None)
+            else:
+                valid = following < offsets[cell_ids + 1]
+            starts.append(connectivity[valid])
+            ends.append(connectivity[following[valid]])
+    return np.concatenate(starts), np.concatenate(ends)
+
+
+def _edge_graph(poly_data):
+    """Return the cached edge length matrix of a ``PolyData``.
+
+    The matrix is a symmetric ``scipy.sparse.csr_matrix`` of shape
+    ``(n_points, n_points)`` holding the length of each edge of the
+    polygons, lines and triangle strips, which is the graph used by
+    ``vtkDijkstraGraphGeodesicPath``.  It is stored on ``poly_data``
+    and rebuilt only when its connectivity or points change.
+
+    """
+    try:
+        from scipy import sparse
+    except ImportError:  # pragma: no cover
+        raise ImportError('scipy must be available to use this filter.')
+
+    key = _topology_key(poly_data) + _points_key(poly_data)
+    cache = getattr(poly_data, '_edge_graph', None)
+    if cache is not None and cache[0] == key:
+        return cache[1]
+
+    starts, ends = _cell_edges(poly_data)
+    n_points = poly_data.GetNumberOfPoints()
+    lower = np.minimum(starts, ends)
+    upper = np.maximum(starts, ends)
+    edges = np.unique(lower[lower != upper]*n_points + upper[lower != upper])
+    lower, upper = np.divmod(edges, n_points)
+    xyz = np.asarray(poly_data.points, dtype=float)
+    lengths = np.linalg.norm(xyz[upper] - xyz[lower], axis=1)
+    graph = sparse.csr_matrix((np.concatenate([lengths, lengths]),
+                               (np.concatenate([lower, upper]),
+                                np.concatenate([upper, lower]))),
+                              shape=(n_points, n_points))
+    poly_data._edge_graph = (key, graph)
+    return graph
+
+
+def _edge_table(poly_data):
+    """Return the cached table of the unique edges of the polygons of a ``PolyData``.
+
+    Edges are numbered by their first use when traversing the polygons
+    in order, and oriented as in that first polygon, like the edges
+    extracted by ``vtkFeatureEdges`` and ``vtkExtractEdges``.  The
+    table is stored on ``poly_data``: the edges and their faces are
+    rebuilt only when its connectivity changes, and the dihedral
+    angles when its points change.
+
+    Returns
+    -------
+    edges : np.ndarray
+        Start and end point of each edge, of shape ``(n_edges, 2)``.
+
+    face_offsets : np.ndarray
+        Offsets of the faces of each edge in ``face_ids``, of shape
+        ``(n_edges + 1, )``.
+
+    face_ids : np.ndarray
+        Cell ids of the polygons using each edge, in increasing order.
+
+    dihedral_angles : np.ndarray
+        Angle in degrees between the normals of the two polygons of
+        each edge, ``nan`` for edges without exactly two polygons.
+
+    """
+    key = _topology_key(poly_data)
+    points_key = _points_key(poly_data)
+    n_shift = poly_data.GetNumberOfVerts() + poly_data.GetNumberOfLines()
+    n_polys = poly_data.GetNumberOfPolys()
+    cache = getattr(poly_data, '_edge_table', None)
+    if cache is not None and cache[:2] == (key, points_key):
+        return cache[2:]
+
+    starts, ends = _cell_edges(poly_data, ('polys', ))
+    offsets, _ = _cell_array_to_numpy(poly_data.GetPolys())
+    cell_ids = np.repeat(np.arange(n_polys, dtype=pyvista.ID_TYPE), np.diff(offsets))
+    if cache is None or cache[0] != key:
+        valid = starts != ends
+        lower = np.minimum(starts[valid], ends[valid])
+        upper = np.maximum(starts[valid], ends[valid])
+        keys = lower*poly_data.GetNumberOfPoints() + upper
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty(order.size, dtype=pyvista.ID_TYPE)
+        rank[order] = np.arange(order.size, dtype=pyvista.ID_TYPE)
+        edge_ids = rank[inverse.ravel()]
+        first = np.flatnonzero(valid)[first[order]]
+        edges = np.column_stack((starts[first], ends[first]))
+        face_offsets = np.zeros(order.size + 1, dtype=pyvista.ID_TYPE)
+        np.cumsum(np.bincount(edge_ids, minlength=order.size), out=face_offsets[1:])
+        face_ids = cell_ids[valid][np.argsort(edge_ids, kind='stable')] + n_shift
+        cache = (key, None, edges, face_offsets, face_ids, None)
+
+    edges, face_offsets, face_ids = cache[2:5]
+    # polygon normals as the sum of the cross products of their sides
+    # around the first point, as in Newell's method
+    xyz = np.asarray(poly_data.points, dtype=float)
+    corners = xyz[starts[offsets[:-1]][cell_ids]]
+    sides = np.cross(xyz[starts] - corners, xyz[ends] - corners)
+    normals = np.empty((n_polys, 3))
+    for axis in range(3):
+        normals[:, axis] = np.bincount(cell_ids, weights=sides[:, axis], minlength=n_polys)
+    norms = np.linalg.norm(normals, axis=1)
+    normals[norms > 0] /= norms[norms > 0, np.newaxis]
+
+    dihedral_angles = np.full(edges.shape[0], np.nan)
+    manifold = np.flatnonzero(np.diff(face_offsets) == 2)
+    first = face_ids[face_offsets[manifold]] - n_shift
+    second = face_ids[face_offsets[manifold] + 1] - n_shift
+    cosines = np.einsum('ij,ij->i', normals[first], normals[second])
+    dihedral_angles[manifold] = np.degrees(np.arccos(np.clip(cosines, -1, 1)))
+    cache = (key, points_key) + cache[2:5] + (dihedral_angles, )
+    poly_data._edge_table = cache
+    return cache[2:]
+
+
+def _edge_classes(poly_data, feature_angle=30, boundary_edges=True,
+                  non_manifold_edges=True, feature_edges=True, manifold_edges=True):
+    """Return a mask of the edges of ``_edge_table`` of the given classes.
+
+    The classes follow ``vtkFeatureEdges``: boundary edges are used
+    by one polygon, non-manifold edges by three or more, and manifold
+    edges by exactly two.  Among the manifold edges, feature edges are
+    those whose dihedral angle reaches ``feature_angle``.  As in
+    ``vtkFeatureEdges``, manifold edges are only selected when feature
+    edges are not.
+
+    """
+    _, face_offsets, _, dihedral_angles = _edge_table(poly_data)
+    n_faces = np.diff(face_offsets)
+    mask = np.zeros(n_faces.size, dtype=bool)
+    if boundary_edges:
+        mask |= n_faces == 1
+    if non_manifold_edges:
+        mask |= n_faces > 2
+    if feature_edges:
+        with np.errstate(invalid='ignore'):
+            mask |= dihedral_angles >= feature_angle
+    elif manifold_edges:
+        mask |= n_faces == 2
+    return mask
+
+
+def _edges_to_poly_data(poly_data, mask):
+    """Extract the edges of ``_edge_table`` selected by ``mask`` as lines.
+
+    Coincident points are merged, and the edges keep the cell data of
+    their first polygon, like the output of ``vtkFeatureEdges``.
+
+    """
+    edges, face_offsets, face_ids, _ = _edge_table(poly_data)
+    point_ids, connectivity = _renumber_points(edges[mask].ravel(),
+                                               poly_data.GetNumberOfPoints())
+    if point_ids.size:
+        # adding zero turns -0.0 into 0.0 before comparing bit patterns
+        keys = np.asarray(poly_data.points[point_ids], dtype=float) + 0.0
+        first, point_map = _group_rows(keys.view(np.int64))
+        point_ids = point_ids[first]
+        connectivity = point_map[connectivity]
+
+    output = pyvista.PolyData()
+    output.points = poly_data.points[point_ids]
+    offsets = np.arange(0, connectivity.size + 1, 2, dtype=pyvista.ID_TYPE)
+    output.SetLines(_numpy_to_cell_array(offsets, connectivity))
+    _copy_cells_data(poly_data, output, point_ids, face_ids[face_offsets[:-1][mask]])
+    return output
+
+
+def _boundary_points(poly_data):
+    """Return a mask of the points on the boundary edges of the polygons."""
+    edges, face_offsets, _, _ = _edge_table(poly_data)
+    mask = np.zeros(poly_data.GetNumberOfPoints(), dtype=bool)
+    mask[edges[np.diff(face_offsets) == 1].ravel()] = True
+    return mask
+
+
+def _laplacian(poly_data, weights='uniform'):
+    """Return the cached Laplacian operator of a ``PolyData`` and its mass.
+
+    The operator is ``M^-1 C``, where ``C`` is the symmetric matrix of
+    edge weights with the opposite of their sum on the diagonal and
+    ``M`` the diagonal of point masses, stored as a vector.  Uniform
+    weights are one per edge with the point degrees as masses, so
+    ``L @ x`` moves each point to the average of its neighbors.
+    Cotangent weights are half the sum of the cotangents of the angles
+    opposite each edge, with a third of the area of the triangles
+    around each point as masses.  Points without mass have empty rows.
+
+    Operators are stored on ``poly_data`` per weighting and rebuilt
+    only when the connectivity, or the points for cotangent weights,
+    change.
+
+    """
+    try:
+        from scipy import sparse
+    except ImportError:  # pragma: no cover
+        raise ImportError('scipy must be available to use this filter.')
+
+    key = _topology_key(poly_data)
+    if weights == 'cotangent':
+        key += _points_key(poly_data)
+    elif weights != 'uniform':
+        raise ValueError(f'Weights `{weights}` not understood.')
+    cache = getattr(poly_data, '_laplacians', None)
+    if cache is None:
+        cache = poly_data._laplacians = {}
+    if weights in cache and cache[weights][0] == key:
+        return cache[weights][1:]
+
+    n_points = poly_data.GetNumberOfPoints()
+    if weights == 'uniform':
+        adjacency = _edge_graph(poly_data).copy()
+        adjacency.data[:] = 1.0
+        mass = np.asarray(adjacency.sum(axis=1)).ravel()
+    else:
+        if not poly_data.is_all_triangles():
+            raise NotAllTrianglesError('Cotangent weights require an all triangle mesh.')
+        _, connectivity = _cell_array_to_numpy(poly_data.GetPolys())
+        triangles = connectivity.reshape(-1, 3)
+        corners = np.asarray(poly_data.points, dtype=float)[triangles.T].transpose(0, 2, 1)
+        # the weight of the edge opposite to each corner of each triangle
+        rows = []
+        cols = []
+        values = []
+        for k in range(3):
+            i, j = (k + 1) % 3, (k + 2) % 3
+            u = corners[i] - corners[k]
+            v = corners[j] - corners[k]
+            sine = _norm(_cross(u, v))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cotangent = np.where(sine > 0, _dot(u, v)/sine, 0.0)
+            rows.append(triangles[:, i])
+            cols.append(triangles[:, j])
+            values.append(cotangent/2)
+        rows, cols, values = map(np.concatenate, (rows, cols, values))
+        adjacency = sparse.csr_matrix((np.concatenate([values, values]),
+                                       (np.concatenate([rows, cols]),
+                                        np.concatenate([cols, rows]))),
+                                      shape=(n_points, n_points))
+        areas = np.repeat(sine/6, 3)
+        mass = np.bincount(triangles.ravel(), weights=areas, minlength=n_points)
+
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    stiffness = adjacency - sparse.diags(degree)
+    with np.errstate(divide='ignore'):
+        inverse_mass = np.where(mass > 0, 1/mass, 0.0)
+    operator = sparse.csr_matrix(sparse.diags(inverse_mass) @ stiffness)
+    cache[weights] = (key, operator, mass)
+    return operator, mass
+
+
+def _vtk_boolean(poly_data, mesh, operation, tolerance):
+    """Run ``vtkBooleanOperationPolyDataFilter`` on two whole meshes."""
+    bfilter = _vtk.vtkBooleanOperationPolyDataFilter()
+    if operation == 'union':
+        bfilter.SetOperationToUnion()
+    elif operation == 'difference':
+        bfilter.SetOperationToDifference()
+    else:
+        bfilter.SetOperationToIntersection()
+    bfilter.SetInputData(1, mesh)
+    bfilter.SetInputData(0, poly_data)
+    bfilter.ReorientDifferenceCellsOff()
+    bfilter.SetTolerance(tolerance)
+    bfilter.Update()
+    return pyvista.core.filters._get_output(bfilter)
+
+
+def _overlap_cells(first, second, tolerance, closed=True):
+    """Return masks of the triangles of two meshes overlapping the other's bounds.
+
+    Returns ``None`` when culling does not apply: either mesh is not a
+    triangle surface, or not closed when ``closed`` is set, or every
+    triangle overlaps.
+
+    """
+    meshes = (first, second)
+    if not all(mesh.n_cells and mesh.n_cells == mesh.GetNumberOfPolys() and
+               mesh.is_all_triangles() and not (closed and mesh.n_open_edges)
+               for mesh in meshes):
+        return None
+    triangles = [np.asarray(mesh.points, dtype=float)[_cell_array_to_numpy(
+        mesh.GetPolys())[1].reshape(-1, 3)] for mesh in meshes]
+    lower = np.maximum(*[corners.min(axis=(0, 1)) for corners in triangles]) - tolerance
+    upper = np.minimum(*[corners.max(axis=(0, 1)) for corners in triangles]) + tolerance
+    masks = [np.all((corners.max(axis=1) >= lower) & (corners.min(axis=1) <= upper), axis=1)
+             for corners in triangles]
+    if all(mask.all() for mask in masks):
+        return None
+    return masks
+
+
+def _stitch_patch(mesh, inside, patch, patch_cells, keep_outside):
+    """Join the selected cells of a patch to the untouched cells of ``mesh``.
+
+    ``patch`` replaces the cells of ``mesh`` in ``inside`` and shares
+    the points of their boundary by coordinates.  The cells outside of
+    it are kept when ``keep_outside`` is set.  Point and cell arrays
+    shared by ``mesh`` and ``patch`` are kept, and the arrays of the
+    patch only, like the flags of ``vtkIntersectionPolyDataFilter``,
+    are zero outside of it.
+
+    """
+    n_points = mesh.n_points
+    connectivity = _cell_array_to_numpy(mesh.GetPolys())[1].reshape(-1, 3)
+    kept = np.flatnonzero(~inside) if keep_outside else np.empty(0, dtype=pyvista.ID_TYPE)
+
+    # points of the patch at the coordinates of a point of its cells in
+    # ``mesh`` are that point, the others are appended
+    candidates = np.unique(connectivity[inside])
+    keys = np.vstack([np.asarray(mesh.points[candidates], dtype=float),
+                      np.asarray(patch.points, dtype=float)]) + 0.0
+    patch_ids = np.empty(0, dtype=pyvista.ID_TYPE)
+    new = np.empty(0, dtype=bool)
+    if keys.shape[0]:
+        first, groups = _group_rows(keys.view(np.int64))
+        matches = first[groups[candidates.size:]]
+        new = matches >= candidates.size
+        patch_ids = np.empty(new.size, dtype=pyvista.ID_TYPE)
+        patch_ids[~new] = candidates[matches[~new]]
+        patch_ids[new] = n_points + np.arange(np.count_nonzero(new))
+
+    offsets, patch_connectivity = _cell_array_to_numpy(patch.GetPolys())
+    patch_offsets, patch_connectivity = _gather_cells(offsets, patch_connectivity, patch_cells)
+    new_offsets = np.hstack([np.arange(kept.size, dtype=pyvista.ID_TYPE)*3,
+                             patch_offsets + kept.size*3])
+    point_ids, new_connectivity = _renumber_points(
+        np.hstack([connectivity[kept].ravel(), patch_ids[patch_connectivity]]),
+        n_points + np.count_nonzero(new))
+
+    output = pyvista.PolyData()
+    points = np.vstack([np.asarray(mesh.points), np.asarray(patch.points)[new]])
+    output.points = points[point_ids]
+    output.SetPolys(_numpy_to_cell_array(new_offsets, new_connectivity))
+    # index the points of the patch after the points of ``mesh``
+    point_source = np.hstack([np.arange(n_points), n_points + np.flatnonzero(new)])
+    _append_attributes([mesh.GetPointData(), patch.GetPointData()], output.GetPointData(),
+                       [(0, 0, n_points), (1, 0, patch.n_points)],
+                       n_points + patch.n_points, point_source[point_ids])
+    cell_source = np.hstack([kept, mesh.n_cells + patch_cells])
+    _append_attributes([mesh.GetCellData(), patch.GetCellData()], output.GetCellData(),
+                       [(0, 0, mesh.n_cells), (1, 0, patch.n_cells)],
+                       mesh.n_cells + patch.n_cells, cell_source)
+
+    for source, target, ind, offset in [
+            (patch.GetPointData(), output.GetPointData(), point_source[point_ids], n_points),
+            (patch.GetCellData(), output.GetCellData(), cell_source, mesh.n_cells)]:
+        from_patch = ind >= offset
+        for i in range(source.GetNumberOfArrays()):
+            array = source.GetArray(i)
+            if array is None or target.HasArray(array.GetName()):
+                continue
+            values = _vtk.vtk_to_numpy(array)
+            filled = np.zeros((ind.size, ) + values.shape[1:], dtype=values.dtype)
+            filled[from_patch] = values[ind[from_patch] - offset]
+            vtk_array = _vtk.numpy_to_vtk(filled, deep=True, array_type=array.GetDataType())
+            vtk_array.SetName(array.GetName())
+            target.AddArray(vtk_array)
+    return output
+
+
+def _boolean_operation(poly_data, mesh, operation, tolerance=1e-6):
+    """Run a boolean operation only on the triangles near the overlap of the meshes.
+
+    Triangles of a closed surface outside of the bounds of the other
+    closed surface are outside of it, so only the patches of triangles
+    overlapping the bounds of both meshes go through
+    ``vtkIntersectionPolyDataFilter``.  The cells of the split patches
+    are classified like ``vtkBooleanOperationPolyDataFilter`` does, by
+    the signed distance of their centers to the other mesh, and the
+    untouched triangles are stitched back.  Other meshes go through
+    ``vtkBooleanOperationPolyDataFilter`` as a whole.
+
+    """
+    masks = _overlap_cells(poly_data, mesh, tolerance)
+    if masks is None:
+        return _vtk_boolean(poly_data, mesh, operation, tolerance)
+
+    meshes = (poly_data, mesh)
+    labels = [np.where(mask, 0, -1) for mask in masks]
+    patches = [_split_poly_data(part, label, 1)[0] for part, label in zip(meshes, labels)]
+    if all(patch.n_cells for patch in patches):
+        intfilter = _vtk.vtkIntersectionPolyDataFilter()
+        intfilter.SetInputDataObject(0, patches[0])
+        intfilter.SetInputDataObject(1, patches[1])
+        intfilter.SetSplitFirstOutput(True)
+        intfilter.SetSplitSecondOutput(True)
+        intfilter.Update()
+        splits = [pyvista.core.filters._get_output(intfilter, oport=1), pyvista.core.filters._get_output(intfilter, oport=2)]
+        # patches that do not intersect are not split
+        patches = [split if split.n_cells else patch for split, patch in zip(splits, patches)]
+
+    # cells outside the other mesh are kept by the union, and by the
+    # difference for the first mesh; the others keep the inside cells
+    keep_outside = [operation != 'intersection', operation == 'union']
+    sides = []
+    for i, patch in enumerate(patches):
+        patch_cells = np.empty(0, dtype=pyvista.ID_TYPE)
+        if patch.n_cells:
+            distance = _implicit_distance(meshes[1 - i])
+            outside = _signed_distances(distance, _polygon_centers(patch)) > tolerance
+            patch_cells = np.flatnonzero(outside == keep_outside[i])
+        sides.append(_stitch_patch(meshes[i], masks[i], patch, patch_cells, keep_outside[i]))
+
+    output = _append_datasets(sides)
+    if not isinstance(output, pyvista.PolyData):
+        output = pyvista.PolyData()
+    # signed distances to the other mesh, like vtkBooleanOperationPolyDataFilter
+    point_distances = []
+    cell_distances = []
+    for i, side in enumerate(sides):
+        distance = _implicit_distance(meshes[1 - i])
+        point_distances.append(_signed_distances(distance, side.points))
+        cell_distances.append(_signed_distances(distance, _polygon_centers(side)))
+    if output.n_points:
+        output.point_arrays['Distance'] = np.concatenate(point_distances)
+        output.cell_arrays['Distance'] = np.concatenate(cell_distances)
+    source = np.repeat(np.arange(2, dtype=np.int32), [side.n_points for side in sides])
+    output.point_arrays['PointSource'] = source
+    source = np.repeat(np.arange(2, dtype=np.int32), [side.n_cells for side in sides])
+    output.cell_arrays['CellSource'] = source
+    return output
+
+
+def _polygon_centers(poly_data):
+    """Return the centers of the polygons of a ``PolyData``."""
+    offsets, connectivity = _cell_array_to_numpy(poly_data.GetPolys())
+    sizes = np.diff(offsets)
+    cell_ids = np.repeat(np.arange(sizes.size), sizes)
+    points = np.asarray(poly_data.points, dtype=float)[connectivity]
+    if not sizes.size:
+        return np.empty((0, 3))
+    return np.column_stack([np.bincount(cell_ids, weights=points[:, axis],
+                                        minlength=sizes.size)
+                            for axis in range(3)]) / sizes[:, np.newaxis]
+
+
+def _signed_distances(function, points):
+    """Evaluate an implicit function at an array of points."""
+    points = np.ascontiguousarray(points, dtype=float).reshape(-1, 3)
+    if not points.shape[0]:
+        return np.empty(0)
+    values = _vtk.vtkDoubleArray()
+    function.FunctionValue(_vtk.numpy_to_vtk(points), values)
+    return _vtk.vtk_to_numpy(values).copy()
+
+
+def _smooth_points(poly_data, factors, n_iter, weights, boundary_smoothing, inplace):
+    """Move the points by successive Laplacian steps of the given factors."""
+    from scipy import sparse
+
+    operator = _laplacian(poly_data, weights)[0]
+    # scale the rows so that each step moves the points towards a
+    # weighted average of their neighbors, which keeps explicit steps
+    # stable whatever the size of the cells
+    diagonal = -operator.diagonal()
+    with np.errstate(divide='ignore'):
+        scale = np.where(diagonal > 0, 1/diagonal, 0.0)
+    if not boundary_smoothing:
+        scale[_boundary_points(poly_data)] = 0.0
+    operator = sparse.csr_matrix(sparse.diags(scale) @ operator)
+    identity = sparse.identity(poly_data.n_points, format='csr')
+    steps = [identity + factor*operator for factor in factors]
+    points = np.asarray(poly_data.points, dtype=float)
+    for _ in range(n_iter):
+        for step in steps:
+            points = step @ points
+    points = points.astype(poly_data.points.dtype)
+    if inplace:
+        poly_data.points[:] = points
+        poly_data.GetPoints().Modified()
+        return poly_data
+    output = poly_data.copy(deep=False)
+    output.SetPoints(pyvista.vtk_points(points, deep=False))
+    return output
+
+
+_VERDICT_DBL_MAX = 1.0e30
+
+_HEXAHEDRON_CORNERS = [(0, 1, 3, 4), (1, 2, 0, 5), (2, 3, 1, 6), (3, 0, 2, 7),
+                       (4, 7, 5, 0), (5, 4, 6, 1), (6, 5, 7, 2), (7, 6, 4, 3)]
+_HEXAHEDRON_DIAGONALS = [(0, 6), (1, 7), (2, 4), (3, 5)]
+_HEXAHEDRON_EDGES = [(0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4),
+                     (0, 4), (1, 5), (2, 6), (3, 7)]
+
+
+def _tetra_quality(corners, measures):
+    """Return the quality ``measures`` of tetrahedra with ``corners``.
+
+    ``corners`` has shape ``(3, 4, n)``.  The formulas are those of the
+    Verdict library used by ``vtkCellQuality``.
+
+    """
+    p0, p1, p2, p3 = (corners[:, i] for i in range(4))
+    ab, ac, ad = p1 - p0, p2 - p0, p3 - p0
+    bc, bd, cd = p2 - p1, p3 - p1, p3 - p2
+    ab2, ac2, ad2 = _dot(ab, ab), _dot(ac, ac), _dot(ad, ad)
+    bc2, bd2, cd2 = _dot(bc, bc), _dot(bd, bd), _dot(cd, cd)
+    faces = [_cross(ab, ac)]
+    jacobian = _dot(ad, faces[0])
+    if {'aspect_ratio', 'radius_ratio', 'min_angle'}.intersection(measures):
+        # twice the areas of the faces
+        faces += [_cross(ab, ad), _cross(ac, ad), _cross(bc, bd)]
+        areas = sum(_norm(face) for face in faces)
+
+    values = {}
+    for measure in measures:
+        if measure == 'volume':
+            value = jacobian/6
+        elif measure == 'jacobian':
+            value = jacobian
+        elif measure == 'scaled_jacobian':
+            lengths = np.sqrt(np.max([ab2*ac2*ad2, ab2*bc2*bd2, ac2*bc2*cd2,
+                                      ad2*bd2*cd2], axis=0))
+            value = np.sqrt(2)*jacobian/np.maximum(lengths, np.abs(jacobian))
+            value[lengths == 0] = 0
+        elif measure == 'aspect_ratio':
+            longest = np.sqrt(np.max([ab2, ac2, ad2, bc2, bd2, cd2], axis=0))
+            value = np.sqrt(6)/12*longest*areas/np.abs(jacobian)
+        elif measure == 'radius_ratio':
+            weighted = ab2*_cross(ac, ad) + ac2*_cross(ad, ab) + ad2*faces[0]
+            value = _norm(weighted)*areas/(6*jacobian**2)
+        elif measure == 'aspect_frobenius':
+            numerator = 1.5*(ab2 + ac2 + ad2) - (_dot(ab, ac) + _dot(ac, ad) + _dot(ad, ab))
+            value = numerator/(3*np.cbrt(2*jacobian**2))
+        elif measure == 'min_angle':
+            lengths = [_norm(face) for face in faces]
+            cosines = [_dot(faces[i], faces[j])/(lengths[i]*lengths[j])
+                       for i in range(4) for j in range(i + 1, 4)]
+            value = np.degrees(np.arccos(np.clip(cosines, -1, 1)).min(axis=0))
+        values[measure] = value
+    return values
+
+
+def _hexahedron_quality(corners, measures):
+    """Return the quality ``measures`` of hexahedra with ``corners``.
+
+    ``corners`` has shape ``(3, 8, n)``.  The formulas are those of the
+    Verdict library used by ``vtkCellQuality``.
+
+    """
+    p = [corners[:, i] for i in range(8)]
+    # principal axes of the trilinear map
+    axes = [p[1] + p[2] + p[5] + p[6] - p[0] - p[3] - p[4] - p[7],
+            p[2] + p[3] + p[6] + p[7] - p[0] - p[1] - p[4] - p[5],
+            p[4] + p[5] + p[6] + p[7] - p[0] - p[1] - p[2] - p[3]]
+    lengths = [_norm(axis) for axis in axes]
+    center = _dot(axes[0], _cross(axes[1], axes[2]))
+
+    edges = {}
+
+    def edge(start, end):
+        """Return an edge vector, its squared length and whether it points to ``end``."""
+        key = (min(start, end), max(start, end))
+        if key not in edges:
+            vector = p[key[1]] - p[key[0]]
+            edges[key] = (vector, _dot(vector, vector))
+        return edges[key] + (start < end, )
+
+    values = {}
+    for measure in measures:
+        if measure == 'volume':
+            value = center/64
+        elif measure in ('jacobian', 'scaled_jacobian'):
+            scaled = measure == 'scaled_jacobian'
+            value = center/(lengths[0]*lengths[1]*lengths[2]) if scaled else center/64
+            for origin, *ends in _HEXAHEDRON_CORNERS:
+                (a, a2, a_out), (b, b2, b_out), (c, c2, c_out) = (edge(origin, end)
+                                                                  for end in ends)
+                # edges pointing into the corner flip the sign of the determinant
+                if (a_out + b_out + c_out) % 2 == 0:
+                    b, c = c, b
+                corner = _dot(a, _cross(b, c))
+                if scaled:
+                    corner /= np.sqrt(a2*b2*c2)
+                value = np.minimum(value, corner)
+            if scaled:
+                value[np.isnan(value)] = 0
+        elif measure == 'max_edge_ratio':
+            squared = [length**2 for length in lengths]
+            value = np.sqrt(np.max([squared[i]/squared[j] for i in range(3)
+                                    for j in range(3) if i != j], axis=0))
+        elif measure in ('diagonal', 'stretch'):
+            diagonals = np.array([_dot(p[i] - p[j], p[i] - p[j])
+                                  for i, j in _HEXAHEDRON_DIAGONALS])
+            if measure == 'diagonal':
+                value = np.sqrt(diagonals.min(axis=0)/diagonals.max(axis=0))
+            else:
+                edges = np.array([_dot(p[i] - p[j], p[i] - p[j])
+                                  for i, j in _HEXAHEDRON_EDGES])
+                value = np.sqrt(3*edges.min(axis=0)/diagonals.max(axis=0))
+        elif measure == 'skew':
+            units = [axis/length for axis, length in zip(axes, lengths)]
+            value = np.max([np.abs(_dot(units[0], units[1])),
+                            np.abs(_dot(units[0], units[2])),
+                            np.abs(_dot(units[1], units[2]))], axis=0)
+            value[np.isnan(value)] = 0
+        elif measure == 'taper':
+            cross_derivatives = [p[0] - p[1] + p[2] - p[3] + p[4] - p[5] + p[6] - p[7],
+                                 p[0] - p[1] - p[2] + p[3] - p[4] + p[5] + p[6] - p[7],
+                                 p[0] + p[1] - p[2] - p[3] - p[4] - p[5] + p[6] + p[7]]
+            pairs = [(0, 1), (0, 2), (1, 2)]
+            value = np.max([_norm(derivative)/np.minimum(lengths[i], lengths[j])
+                            for derivative, (i, j) in zip(cross_derivatives, pairs)], axis=0)
+        values[measure] = value
+    return values
+
+
+_CELL_QUALITY_KERNELS = {
+    _vtk.VTK_TETRA: (_tetra_quality, ('volume', 'jacobian', 'scaled_jacobian',
+                                      'aspect_ratio', 'radius_ratio',
+                                      'aspect_frobenius', 'min_angle')),
+    _vtk.VTK_HEXAHEDRON: (_hexahedron_quality, ('volume', 'jacobian', 'scaled_jacobian',
+                                                'max_edge_ratio', 'diagonal', 'stretch',
+                                                'skew', 'taper')),
+}
+
+
+_CELL_CORNERS = {_vtk.VTK_LINE: 2, _vtk.VTK_TRIANGLE: 3, _vtk.VTK_QUAD: 4,
+                 _vtk.VTK_TETRA: 4, _vtk.VTK_HEXAHEDRON: 8}
+
+_CELL_DIMENSIONS = {_vtk.VTK_LINE: 1, _vtk.VTK_TRIANGLE: 2, _vtk.VTK_QUAD: 2,
+                    _vtk.VTK_TETRA: 3, _vtk.VTK_HEXAHEDRON: 3}
+
+
+# decomposition used by vtkHexahedron::Triangulate
+_HEXAHEDRON_TETRAS = [(0, 1, 3, 4), (1, 4, 5, 6), (1, 4, 6, 3), (1, 3, 6, 2), (3, 6, 7, 4)]
+
+
+def _homogeneous_cells(dataset):
+    """Return the cell type and connectivity of a mesh of a single cell type.
+
+    Only meshes made entirely of lines, triangles, quads, tetrahedra or
+    hexahedra are recognized, and ``None`` is returned for any other
+    mesh.  The connectivity has one row per cell.
+
+    """
+    if isinstance(dataset, _vtk.vtkPolyData):
+        cell_arrays = [dataset.GetVerts(), dataset.GetLines(),
+                       dataset.GetPolys(), dataset.GetStrips()]
+        used = [carr for carr in cell_arrays if carr.GetNumberOfCells()]
+        if len(used) != 1 or used[0] not in cell_arrays[1:3]:
+            return None
+        offsets, connectivity = _cell_array_to_numpy(used[0])
+        n_corners = offsets[1]
+        if not np.all(np.diff(offsets) == n_corners):
+            return None
+        celltypes = {2: _vtk.VTK_LINE} if used[0] is cell_arrays[1] else \
+            {3: _vtk.VTK_TRIANGLE, 4: _vtk.VTK_QUAD}
+        celltype = celltypes.get(n_corners)
+        if celltype is None:
+            return None
+    elif isinstance(dataset, _vtk.vtkUnstructuredGrid):
+        if not dataset.GetNumberOfCells():
+            return None
+        celltypes = dataset.celltypes
+        celltype = celltypes[0]
+        if celltype not in _CELL_CORNERS or not np.all(celltypes == celltype):
+            return None
+        _, connectivity = _cell_array_to_numpy(dataset.GetCells())
+    else:
+        return None
+    return celltype, connectivity.reshape(-1, _CELL_CORNERS[celltype])
+
+
+def _map_cells(dataset, connectivity, function, chunk_size=8192):
+    """Apply ``function`` to the corners of chunks of cells.
+
+    ``function`` receives the corners as an array of shape ``(3,
+    n_corners, n)`` and returns a dictionary of arrays whose last axis
+    runs over the cells.  The results of all chunks are concatenated.
+
+    """
+    points = np.ascontiguousarray(np.asarray(dataset.points, dtype=float).T)
+    results = collections.defaultdict(list)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for start in range(0, len(connectivity), chunk_size):
+            corners = points[:, connectivity[start:start + chunk_size].T]
+            for key, value in function(corners).items():
+                results[key].append(value)
+    return {key: np.concatenate(value, axis=-1) for key, value in results.items()}
+
+
+def _homogeneous_cell_quality(dataset, measures):
+    """Compute cell quality ``measures`` of a pure tetrahedral or hexahedral grid.
+
+    Returns a dictionary holding the measures that have a vectorized
+    kernel for the cell type of ``dataset``, which is empty when
+    ``dataset`` mixes cell types or is not an unstructured grid.
+
+    """
+    cells = _homogeneous_cells(dataset)
+    if cells is None or not isinstance(dataset, _vtk.vtkUnstructuredGrid):
+        return {}
+    celltype, connectivity = cells
+    if celltype not in _CELL_QUALITY_KERNELS:
+        return {}
+    function, supported = _CELL_QUALITY_KERNELS[celltype]
+    measures = [measure for measure in measures if measure in supported]
+    if not measures:
+        return {}
+
+    values = _map_cells(dataset, connectivity, lambda corners: function(corners, measures))
+    for value in values.values():
+        # same saturation as Verdict for degenerate cells
+        value[np.isnan(value)] = _VERDICT_DBL_MAX
+        np.clip(value, -_VERDICT_DBL_MAX, _VERDICT_DBL_MAX, out=value)
+    return values
+
+
+def _cell_geometry(celltype, corners, measures):
+    """Return geometric ``measures`` of cells of type ``celltype``.
+
+    ``'size'`` is the length, area or (signed) volume of each cell
+    computed as ``vtkCellSizeFilter`` does, and ``'center'`` is the mean
+    of its corners, which is the parametric center used by
+    ``vtkCellCenters`` for these cell types.
+
+    """
+    p = [corners[:, i] for i in range(corners.shape[1])]
+    values = {}
+    if 'size' in measures:
+        if celltype == _vtk.VTK_LINE:
+            size = _norm(p[1] - p[0])
+        elif celltype == _vtk.VTK_TRIANGLE:
+            size = _norm(_cross(p[1] - p[0], p[2] - p[0]))/2
+        elif celltype == _vtk.VTK_QUAD:
+            size = _norm(_cross(p[2] - p[0], p[3] - p[1]))/2
+        else:
+            tetras = [range(4)] if celltype == _vtk.VTK_TETRA else _HEXAHEDRON_TETRAS
+            size = sum(_dot(p[b] - p[a], _cross(p[c] - p[a], p[d] - p[a]))
+                       for a, b, c, d in tetras)/6
+        values['size'] = size
+    if 'center' in measures:
+        values['center'] = corners.mean(axis=1)
+    return values
+
+
+def _homogeneous_cell_geometry(dataset, measures):
+    """Compute geometric ``measures`` of the cells of a homogeneous mesh.
+
+    See :func:`_cell_geometry` for the ``measures``.  Returns the cell
+    type and a dictionary of the measures, with the cells along the
+    first axis, or ``None`` when ``dataset`` is not recognized by
+    :func:`_homogeneous_cells`.
+
+    """
+    cells = _homogeneous_cells(dataset)
+    if cells is None:
+        return None
+    celltype, connectivity = cells
+    values = _map_cells(dataset, connectivity,
+                        lambda corners: _cell_geometry(celltype, corners, measures))
+    return celltype, {key: value.T for key, value in values.items()}
+
+
+def _surface_volume(surface):
+    """Return the volume enclosed by a triangle or quad ``surface``.
+
+    The divergence theorem is applied separately with the x, y and z
+    coordinates, and the three results only agree for closed surfaces.
+    Returns ``None`` when they do not or the surface has other cells,
+    in which case ``vtkMassProperties`` should be used.
+
+    """
+    cells = _homogeneous_cells(surface)
+    if cells is None or cells[0] not in (_vtk.VTK_TRIANGLE, _vtk.VTK_QUAD):
+        return None
+    celltype, connectivity = cells
+    if celltype == _vtk.VTK_QUAD:
+        connectivity = connectivity[:, [0, 1, 2, 0, 2, 3]].reshape(-1, 3)
+
+    def projected_volumes(corners):
+        normals = _cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        return {'volumes': (corners.sum(axis=1)*normals).sum(axis=1, keepdims=True)/6}
+
+    volumes = _map_cells(surface, connectivity, projected_volumes)['volumes'].sum(axis=1)
+    tolerance = 1e-9*max(abs(volumes).max(), surface.length**3)
+    if np.ptp(volumes) > tolerance:
+        return None
+    return abs(volumes.mean())
+
+
+def _stream_tracer(dataset, vectors=None, integrator_type=45, integration_direction='both',
+                   surface_streamlines=False, initial_step_length=0.5, step_unit='cl',
+                   min_step_length=0.01, max_step_length=1.0, max_steps=2000,
+                   terminal_speed=1e-12, max_error=1e-6, max_time=None,
+                   compute_vorticity=True, rotation_scale=1.0, interpolator_type='point'):
+    """Return a ``vtkStreamTracer`` of ``dataset`` waiting for its seeds.
+
+    The vectors are selected on the tracer rather than made active so
+    that ``dataset`` is not modified.  The cell interpolator of point
+    sets finds cells with the cell locator stored on the dataset, so
+    the locator is only built once for all the tracers of a dataset
+    until it is modified, like the point locator of the default
+    interpolator.
+
+    """
+    integration_direction = str(integration_direction).strip().lower()
+    if integration_direction not in ['both', 'back', 'backward', 'forward']:
+        raise ValueError("Integration direction must be one of:\n 'backward', "
+                         f"'forward', or 'both' - not '{integration_direction}'.")
+    if integrator_type not in [2, 4, 45]:
+        raise ValueError('Integrator type must be one of `2`, `4`, or `45`.')
+    if interpolator_type not in ['c', 'cell', 'p', 'point']:
+        raise ValueError("Interpolator type must be either 'cell' or 'point'")
+    if step_unit not in ['l', 'cl']:
+        raise ValueError("Step unit must be either 'l' or 'cl'")
+    step_unit = {'cl': _vtk.vtkStreamTracer.CELL_LENGTH_UNIT,
+                 'l': _vtk.vtkStreamTracer.LENGTH_UNIT}[step_unit]
+    if vectors is None:
+        vectors = dataset.active_vectors_info.name
+        if vectors is None:
+            raise ValueError('No vectors to integrate.  Set `vectors` or the active vectors.')
+    array, field = get_array(dataset, vectors, preference='point', info=True, err=True)
+    if max_time is None:
+        max_velocity = np.nanmax(array) if array.size else np.nan
+        max_time = 4.0 * dataset.GetLength() / max_velocity
+
+    alg = _vtk.vtkStreamTracer()
+    alg.SetInputDataObject(dataset)
+    alg.SetInputArrayToProcess(0, 0, 0, field.value, vectors)
+    # general parameters
+    alg.SetComputeVorticity(compute_vorticity)
+    alg.SetInitialIntegrationStep(initial_step_length)
+    alg.SetIntegrationStepUnit(step_unit)
+    alg.SetMaximumError(max_error)
+    alg.SetMaximumIntegrationStep(max_step_length)
+    alg.SetMaximumNumberOfSteps(max_steps)
+    alg.SetMaximumPropagation(max_time)
+    alg.SetMinimumIntegrationStep(min_step_length)
+    alg.SetRotationScale(rotation_scale)
+    alg.SetSurfaceStreamlines(surface_streamlines)
+    alg.SetTerminalSpeed(terminal_speed)
+    # Model parameters
+    if integration_direction == 'forward':
+        alg.SetIntegrationDirectionToForward()
+    elif integration_direction in ['backward', 'back']:
+        alg.SetIntegrationDirectionToBackward()
+    else:
+        alg.SetIntegrationDirectionToBoth()
+    # set integrator type
+    if integrator_type == 2:
+        alg.SetIntegratorTypeToRungeKutta2()
+    elif integrator_type == 4:
+        alg.SetIntegratorTypeToRungeKutta4()
+    else:
+        alg.SetIntegratorTypeToRungeKutta45()
+    # set interpolator type
+    if interpolator_type in ['c', 'cell']:
+        if _vtk.VTK9 and isinstance(dataset, _vtk.vtkPointSet):
+            interpolator = _vtk.vtkInterpolatedVelocityField()
+            interpolator.SetFindCellStrategy(_vtk.vtkCellLocatorStrategy())
+            alg.SetInterpolatorPrototype(interpolator)
+        else:
+            alg.SetInterpolatorTypeToCellLocator()
+    else:
+        alg.SetInterpolatorTypeToDataSetPointLocator()
+    return alg
@@ -35,6 +35,21 @@ from pyvista.utilities import (FieldAssociation, NORMALS, assert_empty_kwargs,
 from pyvista.utilities.cells import numpy_to_idarr
 from pyvista.core.errors import (NotAllTrianglesError, VTKVersionError)
 from pyvista.utilities import transformations
+from pyvista.utilities._mesh_arrays import (_append_datasets, _cell_array_to_numpy, _group_rows,
+                                            _numpy_to_cell_array, _points_key, _take_attributes,
+                                            _topology_key)
+from pyvista.utilities._raycast import _cast_rays, _enclosed_points_mask, _implicit_distance
+from pyvista.core._bound_filter import BoundFilter
+from pyvista.core._mesh_kernels import (_averaging_operators, _axis_aligned_normal,
+                                        _boolean_operation, _CELL_DIMENSIONS, _connected_regions,
+                                        _dataset_cells, _edge_classes, _edge_graph, _edge_table,
+                                        _edges_to_poly_data, _extract_cells_by_id,
+                                        _first_point_ids, _homogeneous_cell_geometry,
+                                        _homogeneous_cell_quality, _image_layer, _image_slab,
+                                        _laplacian, _overlap_cells, _probe_weights, _smooth_points,
+                                        _split_grid, _split_poly_data, _stitch_patch,
+                                        _stream_tracer, _transform_point_set,
+                                        _unstructured_geometry)
 
 from typing import Union
 
@@ -62,6 +77,53 @@ def _get_output(algorithm, iport=0, iconnection=0, oport=0, active_scalars=None,
     return data
 
 
+def _select_arrays(dataset, pass_arrays, *required):
+    """Return a shallow copy of ``dataset`` with only some of its arrays.
+
+    Point, cell and field arrays are kept when named in ``pass_arrays``
+    or ``required``, along with the ghost array, so that filters run on
+    the copy only carry these arrays to their output.  ``dataset`` is
+    returned as is when ``pass_arrays`` is ``None``.
+
+    """
+    if pass_arrays is None:
+        return dataset
+    if isinstance(pass_arrays, str):
+        pass_arrays = [pass_arrays]
+    for name in pass_arrays:
+        if name not in dataset.array_names:
+            raise KeyError(f'Data array ({name}) not present in this dataset.')
+    keep = set(pass_arrays).union(required)
+    keep.add(_vtk.vtkDataSetAttributes.GhostArrayName())
+
+    output = dataset.copy(deep=False)
+    for data in [output.GetPointData(), output.GetCellData(), output.GetFieldData()]:
+        for i in reversed(range(data.GetNumberOfArrays())):
+            if data.GetAbstractArray(i).GetName() not in keep:
+                data.RemoveArray(i)
+    return output
+
+
+def _auto_contour_algorithm(dataset, scalars=None, preference='point'):
+    """Return the fastest contour algorithm for a dataset and its scalars."""
+    if scalars is None:
+        scalars = dataset.active_scalars_name
+    arr = None
+    if scalars is not None:
+        arr = get_array(dataset, scalars, preference=preference)
+    if arr is None or (arr.ndim > 1 and arr.shape[1] > 1):
+        return _vtk.vtkContourFilter()
+    if not hasattr(dataset, 'dimensions') or min(dataset.dimensions) < 2:
+        return _vtk.vtkContourFilter()
+    if isinstance(dataset, pyvista.UniformGrid):
+        return _vtk.vtkFlyingEdges3D()
+    if isinstance(dataset, pyvista.StructuredGrid):
+        return _vtk.vtkGridSynchronizedTemplates3D()
+    if isinstance(dataset, pyvista.RectilinearGrid):
+        return _vtk.vtkRectilinearSynchronizedTemplates()
+    return _vtk.vtkContourFilter()
+
+
 @abstract_class
 class DataSetFilters:
     """A set of common filters that can be applied to any vtkDataSet."""
@@ -91,7 +153,7 @@ class DataSetFilters:
             return _get_output(alg)
 
     def clip(dataset, normal='x', origin=None, invert=True, value=0.0, inplace=False,
-             return_clipped=False):
+             return_clipped=False, pass_arrays=None):
         """Clip a dataset by a plane by specifying the origin and normal.
 
         If no parameters are given the clip will occur in the center of that dataset.
@@ -120,6 +182,10 @@ class DataSetFilters:
         return_clipped : bool, optional
             Return both unclipped and clipped parts of the dataset.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         Returns
         -------
         mesh : pyvista.PolyData or tuple(pyvista.PolyData)
@@ -152,8 +218,8 @@ class DataSetFilters:
         # create the plane for clipping
         function = generate_plane(normal, origin)
         # run the clip
-        result = DataSetFilters._clip_with_function(dataset, function,
-                                                    invert=invert, value=value,
+        result = DataSetFilters._clip_with_function(_select_arrays(dataset, pass_arrays),
+                                                    function, invert=invert, value=value,
                                                     return_clipped=return_clipped)
         if inplace:
             if return_clipped:
@@ -165,7 +231,7 @@ class DataSetFilters:
         else:
             return result
 
-    def clip_box(dataset, bounds=None, invert=True, factor=0.35):
+    def clip_box(dataset, bounds=None, invert=True, factor=0.35, pass_arrays=None):
         """Clip a dataset by a bounding box defined by the bounds.
 
         If no bounds are given, a corner of the dataset bounds will be removed.
@@ -189,6 +255,10 @@ class DataSetFilters:
             If bounds are not given this is the factor along each axis to
             extract the default box.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         Examples
         --------
         Clip a corner of a cube.  The bounds of a cube are normally
@@ -230,7 +300,7 @@ class DataSetFilters:
             xmin, xmax, ymin, ymax, zmin, zmax = dataset.bounds
             bounds = (xmin, xmin+bounds[0], ymin, ymin+bounds[1], zmin, zmin+bounds[2])
         alg = _vtk.vtkBoxClipDataSet()
-        alg.SetInputDataObject(dataset)
+        alg.SetInputDataObject(_select_arrays(dataset, pass_arrays))
         alg.SetBoxClip(*bounds)
         port = 0
         if invert:
@@ -278,8 +348,7 @@ class DataSetFilters:
         >>> pl.show()  # doctest:+SKIP
 
         """
-        function = _vtk.vtkImplicitPolyDataDistance()
-        function.SetInput(surface)
+        function = _implicit_distance(surface)
         points = pyvista.convert_array(dataset.points)
         dists = _vtk.vtkDoubleArray()
         function.FunctionValue(points, dists)
@@ -290,7 +359,97 @@ class DataSetFilters:
         result.point_arrays['implicit_distance'] = pyvista.convert_array(dists)
         return result
 
-    def clip_scalar(dataset, scalars=None, invert=True, value=0.0, inplace=False):
+    def distance_to(dataset, target, signed=False, both_ways=False, n_samples=None,
+                    seed=None):
+        """Compute the distance from the points of this mesh to another mesh.
+
+        Distances are measured to the closest point of the external
+        surface of ``target``.  The locator over that surface is cached
+        on ``target`` and only rebuilt when its points or cells change,
+        so comparing several meshes against the same target is cheap.
+
+        Parameters
+        ----------
+        target : pyvista.DataSet
+            The mesh to measure the distance to.
+
+        signed : bool, optional
+            Return distances that are negative behind the faces of
+            ``target``, that is inside it for a closed surface with
+            outward normals.  The summaries always use the absolute
+            distances.
+
+        both_ways : bool, optional
+            Also measure the distance from the points of ``target`` to
+            this mesh and include it in the summaries, which gives the
+            symmetric Hausdorff distance.
+
+        n_samples : int, optional
+            Only measure the distance from this many randomly chosen
+            points of each mesh to quickly estimate the summaries.  The
+            distance of the other points is ``nan``.
+
+        seed : int, optional
+            Seed of the random choice of the points when ``n_samples``
+            is set.
+
+        Returns
+        -------
+        distances : np.ndarray
+            Distance from each point of this mesh to ``target``.
+
+        summary : dict
+            Hausdorff distance, mean and root mean square of the
+            distances under the keys ``'hausdorff'``, ``'mean'`` and
+            ``'rms'``.
+
+        Examples
+        --------
+        Compare a sphere to a slightly larger one.
+
+        >>> import pyvista as pv
+        >>> sphere = pv.Sphere(radius=0.5)
+        >>> larger = pv.Sphere(radius=0.55)
+        >>> distances, summary = sphere.distance_to(larger, signed=True)
+        >>> print(f"{distances.min():.3f} {summary['hausdorff']:.3f}")
+        -0.050 0.050
+
+        """
+        if n_samples is not None and n_samples < 1:
+            raise ValueError('`n_samples` must be a positive integer.')
+        if not target.n_cells or both_ways and not dataset.n_cells:
+            raise ValueError('Cannot measure the distance to a mesh without cells.')
+        rng = np.random.default_rng(seed)
+
+        def measure(source, surface):
+            ids = np.arange(source.n_points)
+            if n_samples is not None and n_samples < source.n_points:
+                ids = np.sort(rng.choice(source.n_points, n_samples, replace=False))
+            points = np.asarray(source.points, dtype=float)[ids]
+            dists = _vtk.vtkDoubleArray()
+            _implicit_distance(surface).FunctionValue(pyvista.convert_array(points), dists)
+            distances = np.full(source.n_points, np.nan)
+            distances[ids] = pyvista.convert_array(dists)
+            return distances, ids
+
+        distances, ids = measure(dataset, target)
+        measured = [np.abs(distances[ids])]
+        if both_ways:
+            reverse, reverse_ids = measure(target, dataset)
+            measured.append(np.abs(reverse[reverse_ids]))
+        measured = np.concatenate(measured)
+        if not signed:
+            distances = np.abs(distances)
+
+        summary = {'hausdorff': np.nan, 'mean': np.nan, 'rms': np.nan}
+        if measured.size:
+            summary = {'hausdorff': measured.max(),
+                       'mean': measured.mean(),
+                       'rms': np.sqrt(np.mean(measured**2))}
+        return distances, summary
+
+    def clip_scalar(dataset, scalars=None, invert=True, value=0.0, inplace=False,
+                    pass_arrays=None):
         """Clip a dataset by a scalar.
 
         Parameters
@@ -309,6 +468,10 @@ class DataSetFilters:
         inplace : bool, optional
             Update mesh in-place.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         Returns
         -------
         pdata : pyvista.PolyData
@@ -337,11 +500,11 @@ class DataSetFilters:
         else:
             alg = _vtk.vtkTableBasedClipDataSet()
 
-        alg.SetInputDataObject(dataset)
         alg.SetValue(value)
         if scalars is None:
             field, scalars = dataset.active_scalars_info
         _, field = get_array(dataset, scalars, preference='point', info=True)
+        alg.SetInputDataObject(_select_arrays(dataset, pass_arrays, scalars))
 
         # SetInputArrayToProcess(idx, port, connection, field, name)
         alg.SetInputArrayToProcess(0, 0, 0, field.value, scalars)
@@ -356,7 +519,7 @@ class DataSetFilters:
             return result
 
     def clip_surface(dataset, surface, invert=True, value=0.0,
-                     compute_distance=False):
+                     compute_distance=False, pass_arrays=None):
         """Clip any mesh type using a :class:`pyvista.PolyData` surface mesh.
 
         This will return a :class:`pyvista.UnstructuredGrid` of the clipped
@@ -382,23 +545,28 @@ class DataSetFilters:
             A new array called ``'implicit_distance'`` will be added to the
             output clipped mesh.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         """
-        if not isinstance(surface, _vtk.vtkPolyData):
-            surface = DataSetFilters.extract_geometry(surface)
-        function = _vtk.vtkImplicitPolyDataDistance()
-        function.SetInput(surface)
+        function = _implicit_distance(surface)
         if compute_distance:
             points = pyvista.convert_array(dataset.points)
             dists = _vtk.vtkDoubleArray()
             function.FunctionValue(points, dists)
             dataset['implicit_distance'] = pyvista.convert_array(dists)
         # run the clip
+        if compute_distance:
+            dataset = _select_arrays(dataset, pass_arrays, 'implicit_distance')
+        else:
+            dataset = _select_arrays(dataset, pass_arrays)
         result = DataSetFilters._clip_with_function(dataset, function,
                                                     invert=invert, value=value)
         return result
 
     def slice(dataset, normal='x', origin=None, generate_triangles=False,
-              contour=False):
+              contour=False, pass_arrays=None):
         """Slice a dataset by a plane at the specified origin and normal vector orientation.
 
         If no origin is specified, the center of the input dataset will be used.
@@ -420,6 +588,10 @@ class DataSetFilters:
         contour : bool, optional
             If True, apply a ``contour`` filter after slicing
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         """
         if isinstance(normal, str):
             normal = NORMALS[normal.lower()]
@@ -430,7 +602,7 @@ class DataSetFilters:
         plane = generate_plane(normal, origin)
         # create slice
         alg = _vtk.vtkCutter()  # Construct the cutter object
-        alg.SetInputDataObject(dataset)  # Use the grid as the data we desire to cut
+        alg.SetInputDataObject(_select_arrays(dataset, pass_arrays))
         alg.SetCutFunction(plane)  # the cutter to use the plane we made
         if not generate_triangles:
             alg.GenerateTrianglesOff()
@@ -441,7 +613,7 @@ class DataSetFilters:
         return output
 
     def slice_orthogonal(dataset, x=None, y=None, z=None,
-                         generate_triangles=False, contour=False):
+                         generate_triangles=False, contour=False, pass_arrays=None):
         """Create three orthogonal slices through the dataset on the three cartesian planes.
 
         Yields a MutliBlock dataset of the three slices.
@@ -464,6 +636,10 @@ class DataSetFilters:
         contour : bool, optional
             If True, apply a ``contour`` filter after slicing
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         """
         # Create the three slices
         if x is None:
@@ -477,8 +653,9 @@ class DataSetFilters:
             for i in range(dataset.n_blocks):
                 output[i] = dataset[i].slice_orthogonal(x=x, y=y, z=z,
                     generate_triangles=generate_triangles,
-                    contour=contour)
+                    contour=contour, pass_arrays=pass_arrays)
             return output
+        dataset = _select_arrays(dataset, pass_arrays)
         output[0, 'YZ'] = dataset.slice(normal='x', origin=[x,y,z], generate_triangles=generate_triangles)
         output[1, 'XZ'] = dataset.slice(normal='y', origin=[x,y,z], generate_triangles=generate_triangles)
         output[2, 'XY'] = dataset.slice(normal='z', origin=[x,y,z], generate_triangles=generate_triangles)
@@ -486,7 +663,7 @@ class DataSetFilters:
 
     def slice_along_axis(dataset, n=5, axis='x', tolerance=None,
                          generate_triangles=False, contour=False,
-                         bounds=None, center=None):
+                         bounds=None, center=None, pass_arrays=None):
         """Create many slices of the input dataset along a specified axis.
 
         Parameters
@@ -509,6 +686,36 @@ class DataSetFilters:
         contour : bool, optional
             If True, apply a ``contour`` filter after slicing
 
+        bounds : sequence, optional
+            A 6-length sequence overriding the bounds of the dataset
+            used to place the slices.
+
+        center : sequence, optional
+            A 3-length sequence overriding the center of the dataset.
+
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
+        Notes
+        -----
+        Except for image data, all slices are computed in a single
+        pass of ``vtkContourFilter`` over a temporary array holding the
+        coordinate of each point along ``axis``, and the result is split
+        into one block per slice.  ``pyvista.UniformGrid`` inputs are
+        still sliced once per plane, but each slice only cuts the two
+        voxel layers around its plane.
+
+        Examples
+        --------
+        Slice the random hills dataset along the x axis.
+
+        >>> from pyvista import examples
+        >>> hills = examples.load_random_hills()
+        >>> slices = hills.slice_along_axis(n=10, axis='x')
+        >>> slices.n_blocks
+        10
+
         """
         axes = {'x':0, 'y':1, 'z':2}
         if isinstance(axis, int):
@@ -534,18 +741,54 @@ class DataSetFilters:
             for i in range(dataset.n_blocks):
                 output[i] = dataset[i].slice_along_axis(n=n, axis=axis,
                     tolerance=tolerance, generate_triangles=generate_triangles,
-                    contour=contour, bounds=bounds, center=center)
+                    contour=contour, bounds=bounds, center=center,
+                    pass_arrays=pass_arrays)
             return output
-        for i in range(n):
-            center[ax] = rng[i]
-            slc = DataSetFilters.slice(dataset, normal=axis, origin=center,
-                                       generate_triangles=generate_triangles,
-                                       contour=contour)
+        dataset = _select_arrays(dataset, pass_arrays)
+        if isinstance(dataset, pyvista.UniformGrid) and min(dataset.dimensions) > 1:
+            # vtkCutter triangulates image data when given several
+            # values, so cut only the two voxel layers around each plane
+            for i in range(n):
+                center[ax] = rng[i]
+                slab = _image_slab(dataset, ax, rng[i])
+                output[i, f'slice{i}'] = DataSetFilters.slice(slab, normal=axis, origin=center,
+                                                              generate_triangles=generate_triangles,
+                                                              contour=contour)
+            return output
+
+        # contour the axis coordinate at every slice location so that
+        # each cell of the dataset is visited only once
+        mesh = dataset.copy(deep=False)
+        mesh.point_arrays.append(mesh.points[:, ax], '_slice_coordinate',
+                                 deep_copy=True, active_vectors=False,
+                                 active_scalars=False)
+        alg = _vtk.vtkContourFilter()
+        alg.SetInputDataObject(mesh)
+        alg.SetInputArrayToProcess(0, 0, 0, FieldAssociation.POINT.value,
+                                   '_slice_coordinate')
+        alg.SetNumberOfContours(n)
+        for i, value in enumerate(rng):
+            alg.SetValue(i, value)
+        alg.SetComputeNormals(False)
+        alg.SetComputeGradients(False)
+        alg.SetComputeScalars(False)
+        alg.SetGenerateTriangles(generate_triangles)
+        alg.Update()
+        cut = _get_output(alg)
+
+        # each cell lies on one plane, so label it by its first point
+        labels = np.zeros(cut.n_cells, dtype=np.intp)
+        if n > 1 and cut.n_cells:
+            coords = cut.points[_first_point_ids(cut), ax]
+            labels = np.searchsorted((rng[1:] + rng[:-1])/2, coords)
+        for i, slc in enumerate(_split_poly_data(cut, labels, n)):
+            if contour:
+                slc = slc.contour()
             output[i, f'slice{i}'] = slc
         return output
 
     def slice_along_line(dataset, line, generate_triangles=False,
-                         contour=False):
+                         contour=False, pass_arrays=None):
         """Slice a dataset using a polyline/spline as the path.
 
         This also works for lines generated with :func:`pyvista.Line`
@@ -562,6 +805,10 @@ class DataSetFilters:
         contour : bool, optional
             If True, apply a ``contour`` filter after slicing
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         """
         # check that we have a PolyLine cell in the input line
         if line.GetNumberOfCells() != 1:
@@ -574,7 +821,7 @@ class DataSetFilters:
         polyplane.SetPolyLine(polyline)
         # Create slice
         alg = _vtk.vtkCutter()  # Construct the cutter object
-        alg.SetInputDataObject(dataset)  # Use the grid as the data we desire to cut
+        alg.SetInputDataObject(_select_arrays(dataset, pass_arrays))
         alg.SetCutFunction(polyplane)  # the cutter to use the poly planes
         if not generate_triangles:
             alg.GenerateTrianglesOff()
@@ -585,7 +832,7 @@ class DataSetFilters:
         return output
 
     def threshold(dataset, value=None, scalars=None, invert=False, continuous=False,
-                  preference='cell', all_scalars=False):
+                  preference='cell', all_scalars=False, pass_arrays=None):
         """Apply a ``vtkThreshold`` filter to the input dataset.
 
         This filter will apply a ``vtkThreshold`` filter to the input dataset
@@ -593,6 +840,9 @@ class DataSetFilters:
         value in each cell satisfies threshold criterion.  If scalars is None,
         the inputs active scalars is used.
 
+        To threshold the same scalars by several ranges, use the faster
+        :func:`DataSetFilters.threshold_ranges`.
+
         Parameters
         ----------
         value : float or sequence, optional
@@ -625,6 +875,10 @@ class DataSetFilters:
             with a scalar value satisfying the threshold criterion
             will extract the cell.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         Examples
         --------
         >>> import pyvista
@@ -645,6 +899,7 @@ class DataSetFilters:
 
         if arr is None:
             raise ValueError('No arrays present to threshold.')
+        dataset = _select_arrays(dataset, pass_arrays, scalars)
 
         # If using an inverted range, merge the result of two filters:
         if isinstance(value, (np.ndarray, collections.abc.Sequence)) and invert:
@@ -688,8 +943,147 @@ class DataSetFilters:
         alg.Update()
         return _get_output(alg)
 
+    def threshold_ranges(dataset, ranges, scalars=None, continuous=False,
+                         preference='cell', all_scalars=False,
+                         component_mode='selected', component=0,
+                         labels=False):
+        """Threshold the dataset by several value ranges in a single pass.
+
+        The cells satisfying each range are found with vectorized numpy
+        operations and gathered directly from the cell connectivity
+        rather than by running ``vtkThreshold`` once per range.  Each
+        extracted dataset matches the output of ``vtkThreshold``,
+        including the ordering of its points and cells.
+
+        Parameters
+        ----------
+        ranges : sequence
+            Sequence of ``(min, max)`` pairs.  A cell satisfies a range
+            when its value lies within ``[min, max]``.
+
+        scalars : str, optional
+            Name of scalars to threshold on. Defaults to currently active scalars.
+
+        continuous : bool, optional
+            When True, the continuous interval [minimum cell scalar,
+            maximum cell scalar] will be used to intersect the threshold bound,
+            rather than the set of discrete scalar values from the vertices.
+            Only used for point scalars when ``all_scalars`` is ``False``.
+            ``NaN`` values are ignored when computing the cell interval.
+
+        preference : str, optional
+            When scalars is specified, this is the preferred array type to
+            search for in the dataset.  Must be either ``'point'`` or ``'cell'``
+
+        all_scalars : bool, optional
+            If using scalars from point data, all scalars for all
+            points in a cell must satisfy the threshold when this
+            value is ``True``.  When ``False``, any point of the cell
+            with a scalar value satisfying the threshold criterion
+            will extract the cell.
+
+        component_mode : str, optional
+            How multi-component scalars are thresholded.  ``'selected'``
+            uses the component given by ``component``, ``'all'``
+            requires all components to satisfy the range and ``'any'``
+            requires at least one.
+
+        component : int, optional
+            Component used when ``component_mode='selected'``.  Like
+            ``vtkThreshold``, the first component is used when this
+            exceeds the number of components.
+
+        labels : bool, optional
+            When ``True``, return an integer array with the index of the
+            first range satisfied by each cell, or ``-1`` when no range
+            is satisfied, instead of extracting the cells.
+
+        Returns
+        -------
+        output : pyvista.MultiBlock or numpy.ndarray
+            One ``pyvista.UnstructuredGrid`` per range, or the cell labels
+            when ``labels=True``.
+
+        Examples
+        --------
+        Split a uniform grid into two ranges of its cell data.
+
+        >>> from pyvista import examples
+        >>> grid = examples.load_uniform()
+        >>> blocks = grid.threshold_ranges([(0, 200), (500, 700)])
+        >>> blocks.n_blocks
+        2
+
+        """
+        ranges = np.asarray(ranges, dtype=float)
+        if ranges.ndim != 2 or ranges.shape[1] != 2:
+            raise ValueError('``ranges`` must be a sequence of (min, max) pairs.')
+        if component_mode not in ['selected', 'all', 'any']:
+            raise ValueError(f'Invalid component_mode "{component_mode}".  Must be '
+                             'one of "selected", "all", or "any".')
+        if scalars is None:
+            field, scalars = dataset.active_scalars_info
+        arr, field = get_array(dataset, scalars, preference=preference, info=True)
+        if arr is None:
+            raise ValueError('No arrays present to threshold.')
+
+        arr = np.asarray(arr, dtype=float)
+        if arr.ndim == 1:
+            arr = arr.reshape(-1, 1)
+        n_components = arr.shape[1]
+        if component_mode == 'selected':
+            if component >= n_components:
+                component = 0
+            arr = arr[:, component:component + 1]
+        combine = np.any if component_mode == 'any' else np.all
+
+        grid = _unstructured_geometry(dataset)
+        offsets, connectivity = _cell_array_to_numpy(grid.GetCells())
+        starts = offsets[:-1]
+        nonempty = np.diff(offsets) > 0
+        starts = starts[nonempty]
+
+        def reduce_cells(ufunc, values, empty):
+            """Reduce point values over the points of each cell."""
+            out = np.full((dataset.n_cells,) + values.shape[1:], empty,
+                          dtype=values.dtype)
+            if starts.size:
+                out[nonempty] = ufunc.reduceat(values[connectivity], starts)
+            return out
+
+        mask = np.empty((ranges.shape[0], dataset.n_cells), dtype=bool)
+        if field == FieldAssociation.POINT and continuous and not all_scalars:
+            # NaN values are ignored when building the cell ranges
+            cell_min = reduce_cells(np.fmin, arr, np.inf)
+            cell_max = reduce_cells(np.fmax, arr, -np.inf)
+            cell_min[np.isnan(cell_min)] = np.inf
+            cell_max[np.isnan(cell_max)] = -np.inf
+            for i, (lower, upper) in enumerate(ranges):
+                overlap = (cell_max >= lower) & (cell_min <= upper)
+                mask[i] = combine(overlap, axis=1)
+        else:
+            for i, (lower, upper) in enumerate(ranges):
+                inside = combine((arr >= lower) & (arr <= upper), axis=1)
+                if field == FieldAssociation.POINT:
+                    ufunc = np.logical_and if all_scalars else np.logical_or
+                    inside = reduce_cells(ufunc, inside, False)
+                mask[i] = inside
+        # cells without points are never extracted
+        mask[:, ~nonempty] = False
+
+        if labels:
+            cell_labels = np.full(dataset.n_cells, -1, dtype=int)
+            for i in range(ranges.shape[0] - 1, -1, -1):
+                cell_labels[mask[i]] = i
+            return cell_labels
+
+        output = pyvista.MultiBlock()
+        for i in range(ranges.shape[0]):
+            output[i] = _extract_cells_by_id(dataset, np.flatnonzero(mask[i]), grid)
+        return output
+
     def threshold_percent(dataset, percent=0.50, scalars=None, invert=False,
-                          continuous=False, preference='cell'):
+                          continuous=False, preference='cell', pass_arrays=None):
         """Threshold the dataset by a percentage of its range on the active scalars array or as specified.
 
         Parameters
@@ -716,6 +1110,10 @@ class DataSetFilters:
             When scalars is specified, this is the preferred array type to
             search for in the dataset.  Must be either ``'point'`` or ``'cell'``
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         """
         if scalars is None:
             _, tscalars = dataset.active_scalars_info
@@ -750,7 +1148,7 @@ class DataSetFilters:
         # Use the normal thresholding function on these values
         return DataSetFilters.threshold(dataset, value=value, scalars=scalars,
                                         invert=invert, continuous=continuous,
-                                        preference=preference)
+                                        preference=preference, pass_arrays=pass_arrays)
 
     def outline(dataset, generate_faces=False):
         """Produce an outline of the full extent for the input dataset.
@@ -783,15 +1181,21 @@ class DataSetFilters:
         alg.Update()
         return wrap(alg.GetOutputDataObject(0))
 
-    def extract_geometry(dataset):
+    def extract_geometry(dataset, pass_arrays=None):
         """Extract the outer surface of a volume or structured grid dataset as PolyData.
 
         This will extract all 0D, 1D, and 2D cells producing the
         boundary faces of the dataset.
 
+        Parameters
+        ----------
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         """
         alg = _vtk.vtkGeometryFilter()
-        alg.SetInputDataObject(dataset)
+        alg.SetInputDataObject(_select_arrays(dataset, pass_arrays))
         alg.Update()
         return _get_output(alg)
 
@@ -805,7 +1209,16 @@ class DataSetFilters:
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
+        Notes
+        -----
+        The edges of ``PolyData`` without triangle strips are taken from
+        a table of their unique edges cached on the mesh.  As with
+        ``vtkExtractEdges``, vertices and lines do not add edges.
+
         """
+        if isinstance(dataset, _vtk.vtkPolyData) and not dataset.GetNumberOfStrips():
+            edges = _edge_table(dataset)[0]
+            return _edges_to_poly_data(dataset, np.ones(edges.shape[0], dtype=bool))
         alg = _vtk.vtkExtractEdges()
         alg.SetInputDataObject(dataset)
         _update_alg(alg, progress_bar, 'Extracting All Edges')
@@ -890,7 +1303,7 @@ class DataSetFilters:
 
     def contour(dataset, isosurfaces=10, scalars=None, compute_normals=False,
                 compute_gradients=False, compute_scalars=True, rng=None,
-                preference='point', method='contour', progress_bar=False):
+                preference='point', method='contour', progress_bar=False, pass_arrays=None):
         """Contour an input dataset by an array.
 
         ``isosurfaces`` can be an integer specifying the number of isosurfaces in
@@ -924,15 +1337,36 @@ class DataSetFilters:
 
         method : str, optional
             Specify to choose which vtk filter is used to create the contour.
-            Must be one of ``'contour'``, ``'marching_cubes'`` and
-            ``'flying_edges'``. Defaults to ``'contour'``.
+            Must be one of ``'contour'``, ``'marching_cubes'``,
+            ``'flying_edges'`` and ``'auto'``. Defaults to ``'contour'``.
+            ``'auto'`` selects the fastest algorithm for the input:
+            ``vtkFlyingEdges3D`` for a volumetric ``UniformGrid``, the
+            synchronized templates filters for a ``StructuredGrid`` or
+            ``RectilinearGrid``, and ``vtkContourFilter`` otherwise.
+            Multi-component scalars always use ``vtkContourFilter``.
 
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
+        Examples
+        --------
+        Generate two isosurfaces of a uniform grid using the fastest
+        available algorithm.
+
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> grid = examples.load_uniform()
+        >>> contours = grid.contour([100, 500], method='auto')
+
         """
         if method is None or method == 'contour':
             alg = _vtk.vtkContourFilter()
+        elif method == 'auto':
+            alg = _auto_contour_algorithm(dataset, scalars, preference)
         elif method == 'marching_cubes':
             alg = _vtk.vtkMarchingCubes()
         elif method == 'flying_edges':
@@ -942,7 +1376,6 @@ class DataSetFilters:
         # Make sure the input has scalars to contour on
         if dataset.n_arrays < 1:
             raise ValueError('Input dataset for the contour filter must have scalar data.')
-        alg.SetInputDataObject(dataset)
         alg.SetComputeNormals(compute_normals)
         alg.SetComputeGradients(compute_gradients)
         alg.SetComputeScalars(compute_scalars)
@@ -954,6 +1387,7 @@ class DataSetFilters:
         # NOTE: only point data is allowed? well cells works but seems buggy?
         if field != FieldAssociation.POINT:
             raise TypeError(f'Contour filter only works on Point data. Array ({scalars}) is in the Cell data.')
+        alg.SetInputDataObject(_select_arrays(dataset, pass_arrays, scalars))
         alg.SetInputArrayToProcess(0, 0, 0, field.value, scalars) # args: (idx, port, connection, field, name)
         # set the isosurfaces
         if isinstance(isosurfaces, int):
@@ -1098,6 +1532,10 @@ class DataSetFilters:
                            progress_bar=False):
         """Compute sizes for 1D (length), 2D (area) and 3D (volume) cells.
 
+        Meshes made only of lines, triangles, quads, tetrahedra or
+        hexahedra are measured with vectorized numpy kernels, and any
+        other mesh with ``vtkCellSizeFilter``.
+
         Parameters
         ----------
         length : bool
@@ -1113,6 +1551,21 @@ class DataSetFilters:
             Display a progress bar to indicate progress.
 
         """
+        sizes = [('Length', length, 1), ('Area', area, 2), ('Volume', volume, 3)]
+        geometry = None
+        if length or area or volume:
+            geometry = _homogeneous_cell_geometry(dataset, ['size'])
+        if geometry is not None:
+            celltype, values = geometry
+            output = dataset.copy(deep=False)
+            for name, compute, dimension in sizes:
+                if compute:
+                    if dimension == _CELL_DIMENSIONS[celltype]:
+                        output.cell_arrays[name] = values['size']
+                    else:
+                        output.cell_arrays[name] = np.zeros(dataset.n_cells)
+            return output
+
         alg = _vtk.vtkCellSizeFilter()
         alg.SetInputDataObject(dataset)
         alg.SetComputeArea(area)
@@ -1122,17 +1575,37 @@ class DataSetFilters:
         _update_alg(alg, progress_bar, 'Computing Cell Sizes')
         return _get_output(alg)
 
-    def cell_centers(dataset, vertex=True):
+    def cell_centers(dataset, vertex=True, pass_arrays=None):
         """Generate points at the center of the cells in this dataset.
 
         These points can be used for placing glyphs / vectors.
 
+        Meshes made only of lines, triangles, quads, tetrahedra or
+        hexahedra are handled with vectorized numpy kernels, and any
+        other mesh with ``vtkCellCenters``.
+
         Parameters
         ----------
         vertex : bool
             Enable/disable the generation of vertex cells.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         """
+        dataset = _select_arrays(dataset, pass_arrays)
+        geometry = _homogeneous_cell_geometry(dataset, ['center'])
+        if geometry is not None:
+            output = pyvista.PolyData()
+            output.points = geometry[1]['center']
+            output.GetPointData().PassData(dataset.GetCellData())
+            if vertex:
+                output.verts = pyvista.PolyData._make_vertex_cells(output.n_points)
+                output.GetCellData().PassData(dataset.GetCellData())
+            output.GetFieldData().PassData(dataset.GetFieldData())
+            return output
+
         alg = _vtk.vtkCellCenters()
         alg.SetInputDataObject(dataset)
         alg.SetVertexCells(vertex)
@@ -1319,30 +1792,122 @@ class DataSetFilters:
         """Find, label, and split connected bodies/volumes.
 
         This splits different connected bodies into blocks in a MultiBlock dataset.
+        Bodies are found with :func:`DataSetFilters.connected_regions`
+        and gathered with a single sort, so the cost does not grow with
+        the number of bodies.
 
         Parameters
         ----------
         label : bool
-            A flag on whether to keep the ID arrays given by the
-            ``connectivity`` filter.
+            A flag on whether to add a ``'RegionId'`` point and cell
+            array with the index of the body, like the ``connectivity``
+            filter.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere() + pyvista.Sphere(center=(2, 0, 0))
+        >>> bodies = mesh.split_bodies()
+        >>> bodies.n_blocks
+        2
 
         """
-        # Get the connectivity and label different bodies
-        labeled = DataSetFilters.connectivity(dataset)
-        classifier = labeled.cell_arrays['RegionId']
-        bodies = pyvista.MultiBlock()
-        for vid in np.unique(classifier):
-            # Now extract it:
-            b = labeled.threshold([vid-0.5, vid+0.5], scalars='RegionId')
-            if not label:
-                # strange behavior:
-                # must use this method rather than deleting from the point_arrays
-                # or else object is collected.
-                b.cell_arrays.remove('RegionId')
-                b.point_arrays.remove('RegionId')
-            bodies.append(b)
-
-        return bodies
+        grid = dataset
+        if not isinstance(dataset, _vtk.vtkUnstructuredGrid):
+            grid = dataset.cast_to_unstructured_grid()
+        offsets, connectivity = _cell_array_to_numpy(grid.GetCells())
+        labels, sizes = _connected_regions(offsets, connectivity, grid.n_points)
+        if label:
+            point_labels = np.zeros(grid.n_points, dtype=pyvista.ID_TYPE)
+            point_labels[connectivity] = np.repeat(labels, np.diff(offsets))
+            grid = grid.copy(deep=False)
+            grid.point_arrays['RegionId'] = point_labels
+            grid.cell_arrays['RegionId'] = labels
+        return pyvista.MultiBlock(_split_grid(grid, labels, sizes.size, grid))
+
+    def connected_regions(dataset):
+        """Label the regions of cells connected through their points.
+
+        Unlike the ``connectivity`` filter, this only computes the
+        labels, with a vectorized union-find over the points of the
+        cells, in a time that grows with the number of cells but not
+        with the number of regions.
+
+        Returns
+        -------
+        region_ids : np.ndarray
+            Region of each cell.  Regions are numbered by order of
+            appearance of their first cell, like the ``'RegionId'``
+            array of the ``connectivity`` filter.
+
+        region_sizes : np.ndarray
+            Number of cells of each region.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere() + pyvista.Sphere(center=(2, 0, 0), radius=0.2,
+        ...                                          theta_resolution=5, phi_resolution=5)
+        >>> region_ids, region_sizes = mesh.connected_regions()
+        >>> region_sizes
+        array([1680,   30])
+
+        """
+        offsets, connectivity = _dataset_cells(dataset)
+        return _connected_regions(offsets, connectivity, dataset.GetNumberOfPoints())
+
+    def split_by_label(dataset, labels, n_labels=None):
+        """Split the cells of this dataset by label.
+
+        All the pieces are gathered with one sort of the labels instead
+        of one ``threshold`` per label.  Cells keep their order within
+        each piece, with their point, cell and field data.
+
+        Parameters
+        ----------
+        labels : str or np.ndarray
+            Name of an integer cell array, or integer label of each
+            cell.  Cells with labels outside of ``[0, n_labels)`` are
+            dropped.
+
+        n_labels : int, optional
+            Number of pieces.  Defaults to one more than the largest
+            label.
+
+        Returns
+        -------
+        pyvista.MultiBlock
+            One block per label, which are ``PolyData`` when this
+            dataset is a ``PolyData`` and ``UnstructuredGrid``
+            otherwise.  Labels without cells give empty blocks.
+
+        Examples
+        --------
+        Split a mesh by connected region.
+
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere() + pyvista.Sphere(center=(2, 0, 0), radius=0.2,
+        ...                                          theta_resolution=5, phi_resolution=5)
+        >>> region_ids, _ = mesh.connected_regions()
+        >>> pieces = mesh.split_by_label(region_ids)
+        >>> [piece.n_cells for piece in pieces]
+        [1680, 30]
+
+        """
+        if isinstance(labels, str):
+            labels = get_array(dataset, labels, preference='cell', err=True)
+        labels = np.asarray(labels)
+        if labels.shape != (dataset.GetNumberOfCells(), ):
+            raise ValueError('`labels` must have one value per cell.')
+        if not np.issubdtype(labels.dtype, np.integer):
+            raise TypeError('`labels` must be integers.')
+        if n_labels is None:
+            n_labels = int(labels.max()) + 1 if labels.size else 0
+        if isinstance(dataset, _vtk.vtkPolyData):
+            pieces = _split_poly_data(dataset, labels, n_labels)
+        else:
+            pieces = _split_grid(dataset, labels, n_labels)
+        return pyvista.MultiBlock(pieces)
 
     def warp_by_scalar(dataset, scalars=None, factor=1.0, normal=None,
                        inplace=False, **kwargs):
@@ -1443,7 +2008,149 @@ class DataSetFilters:
         else:
             return warped_mesh
 
-    def cell_data_to_point_data(dataset, pass_cell_data=False):
+    def averaging_operator(dataset, preference='cell'):
+        """Return the sparse operator averaging cell data onto points.
+
+        The operator is built once from the connectivity of this mesh
+        and cached on it.  It is only rebuilt when the connectivity
+        changes, so converting arrays of a fixed mesh for many
+        timesteps only costs a sparse matrix product per timestep.
+
+        Parameters
+        ----------
+        preference : str, optional
+            Association of the data the operator acts on.  ``'cell'``
+            returns the ``(n_points, n_cells)`` operator averaging the
+            values of all cells using each point, as done by
+            :func:`DataSetFilters.cell_data_to_point_data`.  ``'point'``
+            returns the ``(n_cells, n_points)`` operator averaging the
+            values of the points of each cell, as done by
+            :func:`DataSetFilters.point_data_to_cell_data`.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            The averaging operator.  Rows of points not used by any
+            cell are empty.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from pyvista import examples
+        >>> mesh = examples.load_hexbeam()
+        >>> operator = mesh.averaging_operator()
+        >>> operator.shape == (mesh.n_points, mesh.n_cells)
+        True
+        >>> point_values = operator @ np.ones(mesh.n_cells)
+        >>> np.allclose(point_values, 1)
+        True
+
+        """
+        cell_to_point, point_to_cell = _averaging_operators(dataset)
+        if preference == 'cell':
+            return cell_to_point
+        elif preference == 'point':
+            return point_to_cell
+        raise ValueError(f'Data preference `{preference}` not understood.')
+
+    def average_arrays(dataset, names=None, preference='cell'):
+        """Average cell arrays onto points or point arrays onto cells.
+
+        All arrays are converted with a single sparse matrix product
+        using the cached :func:`DataSetFilters.averaging_operator`.
+        Neither the mesh nor its arrays are modified or copied.
+
+        Parameters
+        ----------
+        names : str or list(str), optional
+            Names of the arrays to convert.  Defaults to all numeric
+            arrays of the given association.
+
+        preference : str, optional
+            Either ``'cell'`` to average cell arrays onto the points or
+            ``'point'`` to average point arrays onto the cells.
+
+        Returns
+        -------
+        dict
+            Converted arrays keyed by name.  The types follow
+            :func:`DataSetFilters.cell_data_to_point_data` and
+            :func:`DataSetFilters.point_data_to_cell_data`: structured
+            meshes keep the type of cell arrays and round integers,
+            while otherwise only double precision arrays keep their
+            type and all others are returned as ``float32``.
+
+        Examples
+        --------
+        Convert two cell arrays of the same mesh at once.
+
+        >>> import numpy as np
+        >>> from pyvista import examples
+        >>> mesh = examples.load_hexbeam()
+        >>> mesh.cell_arrays['pressure'] = np.arange(mesh.n_cells, dtype=float)
+        >>> mesh.cell_arrays['velocity'] = np.ones((mesh.n_cells, 3))
+        >>> arrays = mesh.average_arrays(['pressure', 'velocity'])
+        >>> arrays['velocity'].shape == (mesh.n_points, 3)
+        True
+
+        """
+        operator = DataSetFilters.averaging_operator(dataset, preference=preference)
+        if preference == 'cell':
+            source = dataset.cell_arrays
+        else:
+            source = dataset.point_arrays
+
+        if names is None:
+            names = [name for name in source.keys()
+                     if np.asarray(source[name]).dtype.kind in 'biuf']
+        elif isinstance(names, str):
+            names = [names]
+
+        arrays = []
+        for name in names:
+            array = np.asarray(source[name])
+            if array.dtype.kind not in 'biuf':
+                raise TypeError(f'Array `{name}` is not numeric and cannot be averaged.')
+            arrays.append(array)
+        if not arrays:
+            return {}
+
+        # match the output types of ``vtkCellDataToPointData`` and
+        # ``vtkPointDataToCellData``
+        keep_type = preference == 'cell' and not isinstance(
+            dataset, (_vtk.vtkPolyData, _vtk.vtkUnstructuredGrid))
+        n_output = operator.shape[0]
+        widths = [int(np.prod(array.shape[1:])) for array in arrays]
+        starts = np.cumsum([0] + widths)
+        outputs = []
+        for array, width in zip(arrays, widths):
+            if keep_type or array.dtype == np.float64:
+                dtype = array.dtype
+            else:
+                dtype = np.float32
+            outputs.append(np.empty((n_output, width), dtype=dtype))
+
+        # stack all components so a single product converts every array.
+        # Packing and unpacking by blocks of rows keeps the copies in cache.
+        block = 8192
+        stacked = np.empty((operator.shape[1], starts[-1]))
+        for i in range(0, stacked.shape[0], block):
+            for array, start, stop in zip(arrays, starts[:-1], starts[1:]):
+                stacked[i:i + block, start:stop] = array[i:i + block].reshape(-1, stop - start)
+        averaged = operator @ stacked
+        for i in range(0, n_output, block):
+            for output, start, stop in zip(outputs, starts[:-1], starts[1:]):
+                values = averaged[i:i + block, start:stop]
+                if output.dtype.kind in 'biu':
+                    values = np.trunc(values + np.copysign(0.5, values))
+                output[i:i + block] = values
+
+        converted = {}
+        for name, array, output in zip(names, arrays, outputs):
+            converted[name] = output.reshape((n_output, ) + array.shape[1:])
+        return converted
+
+    def cell_data_to_point_data(dataset, pass_cell_data=False, inplace=False):
         """Transform cell data into point data.
 
         Point data are specified per node and cell data specified within cells.
@@ -1460,7 +2167,30 @@ class DataSetFilters:
         pass_cell_data : bool
             If enabled, pass the input cell data through to the output
 
+        inplace : bool, optional
+            Convert the arrays of this mesh in place with the cached
+            :func:`DataSetFilters.averaging_operator` instead of copying
+            the mesh.  Requires ``scipy``.
+
         """
+        if inplace:
+            if isinstance(dataset, pyvista.MultiBlock):
+                for block in dataset:
+                    if block is not None:
+                        block.cell_data_to_point_data(pass_cell_data=pass_cell_data,
+                                                      inplace=True)
+                return dataset
+            active_scalars = dataset.active_scalars_info
+            converted = DataSetFilters.average_arrays(dataset, preference='cell')
+            for name, array in converted.items():
+                dataset.point_arrays[name] = array
+            if not pass_cell_data:
+                dataset.clear_cell_arrays()
+            if active_scalars.association == FieldAssociation.CELL and \
+               active_scalars.name in converted:
+                dataset.set_active_scalars(active_scalars.name, preference='point')
+            return dataset
+
         alg = _vtk.vtkCellDataToPointData()
         alg.SetInputDataObject(dataset)
         alg.SetPassCellData(pass_cell_data)
@@ -1470,7 +2200,7 @@ class DataSetFilters:
             active_scalars = dataset.active_scalars_name
         return _get_output(alg, active_scalars=active_scalars)
 
-    def ctp(dataset, pass_cell_data=False):
+    def ctp(dataset, pass_cell_data=False, inplace=False):
         """Transform cell data into point data.
 
         Point data are specified per node and cell data specified within cells.
@@ -1479,9 +2209,10 @@ class DataSetFilters:
         An alias/shortcut for ``cell_data_to_point_data``.
 
         """
-        return DataSetFilters.cell_data_to_point_data(dataset, pass_cell_data=pass_cell_data)
+        return DataSetFilters.cell_data_to_point_data(dataset, pass_cell_data=pass_cell_data,
+                                                      inplace=inplace)
 
-    def point_data_to_cell_data(dataset, pass_point_data=False):
+    def point_data_to_cell_data(dataset, pass_point_data=False, inplace=False):
         """Transform point data into cell data.
 
         Point data are specified per node and cell data specified within cells.
@@ -1494,7 +2225,30 @@ class DataSetFilters:
         pass_point_data : bool
             If enabled, pass the input point data through to the output
 
+        inplace : bool, optional
+            Convert the arrays of this mesh in place with the cached
+            :func:`DataSetFilters.averaging_operator` instead of copying
+            the mesh.  Requires ``scipy``.
+
         """
+        if inplace:
+            if isinstance(dataset, pyvista.MultiBlock):
+                for block in dataset:
+                    if block is not None:
+                        block.point_data_to_cell_data(pass_point_data=pass_point_data,
+                                                      inplace=True)
+                return dataset
+            active_scalars = dataset.active_scalars_info
+            converted = DataSetFilters.average_arrays(dataset, preference='point')
+            for name, array in converted.items():
+                dataset.cell_arrays[name] = array
+            if not pass_point_data:
+                dataset.clear_point_arrays()
+            if active_scalars.association == FieldAssociation.POINT and \
+               active_scalars.name in converted:
+                dataset.set_active_scalars(active_scalars.name, preference='cell')
+            return dataset
+
         alg = _vtk.vtkPointDataToCellData()
         alg.SetInputDataObject(dataset)
         alg.SetPassPointData(pass_point_data)
@@ -1504,7 +2258,7 @@ class DataSetFilters:
             active_scalars = dataset.active_scalars_name
         return _get_output(alg, active_scalars=active_scalars)
 
-    def ptc(dataset, pass_point_data=False):
+    def ptc(dataset, pass_point_data=False, inplace=False):
         """Transform point data into cell data.
 
         Point data are specified per node and cell data specified within cells.
@@ -1513,9 +2267,10 @@ class DataSetFilters:
         An alias/shortcut for ``point_data_to_cell_data``.
 
         """
-        return DataSetFilters.point_data_to_cell_data(dataset, pass_point_data=pass_point_data)
+        return DataSetFilters.point_data_to_cell_data(dataset, pass_point_data=pass_point_data,
+                                                      inplace=inplace)
 
-    def triangulate(dataset, inplace=False):
+    def triangulate(dataset, inplace=False, pass_arrays=None):
         """Return an all triangle mesh.
 
         More complex polygons will be broken down into triangles.
@@ -1525,6 +2280,10 @@ class DataSetFilters:
         inplace : bool, optional
             Updates mesh in-place.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         Returns
         -------
         mesh : pyvista.UnstructuredGrid
@@ -1532,7 +2291,7 @@ class DataSetFilters:
 
         """
         alg = _vtk.vtkDataSetTriangleFilter()
-        alg.SetInputData(dataset)
+        alg.SetInputData(_select_arrays(dataset, pass_arrays))
         alg.Update()
 
         mesh = _get_output(alg)
@@ -1576,7 +2335,8 @@ class DataSetFilters:
         return _get_output(alg)
 
     def select_enclosed_points(dataset, surface, tolerance=0.001,
-                               inside_out=False, check_surface=True):
+                               inside_out=False, check_surface=True,
+                               method='vtk'):
         """Mark points as to whether they are inside a closed surface.
 
         This evaluates all the input points to determine whether they are in an
@@ -1618,6 +2378,27 @@ class DataSetFilters:
             manifold. If the surface is not closed and manifold, a runtime
             error is raised.
 
+        method : str, optional
+            ``'vtk'`` uses :class:`vtk.vtkSelectEnclosedPoints`, which
+            casts rays from each point in turn.  ``'parity'`` counts the
+            crossings of a vertical ray from each point with the
+            triangles of the surface, vectorized over all points with
+            numpy, which is much faster for large numbers of points.
+            With ``'parity'``, points within ``tolerance`` of the
+            surface are marked inside.
+
+        Examples
+        --------
+        Select the points of a uniform grid inside a sphere.
+
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> grid = examples.load_uniform()
+        >>> sphere = pyvista.Sphere(center=grid.center, radius=4)
+        >>> selected = grid.select_enclosed_points(sphere, method='parity')
+        >>> selected['SelectedPoints'].any()
+        True
+
         """
         if not isinstance(surface, pyvista.PolyData):
             raise TypeError("`surface` must be `pyvista.PolyData`")
@@ -1625,6 +2406,16 @@ class DataSetFilters:
             raise RuntimeError("Surface is not closed. Please read the warning in the "
                                "documentation for this function and either pass "
                                "`check_surface=False` or repair the surface.")
+        if method == 'parity':
+            inside = _enclosed_points_mask(dataset.points, surface,
+                                           tolerance=tolerance*surface.length)
+            if inside_out:
+                inside = ~inside
+            out = dataset.copy()
+            out['SelectedPoints'] = inside.astype(np.uint8)
+            return out
+        elif method != 'vtk':
+            raise ValueError(f'Method `{method}` not understood.')
         alg = _vtk.vtkSelectEnclosedPoints()
         alg.SetInputData(dataset)
         alg.SetSurfaceData(surface)
@@ -1840,6 +2631,196 @@ class DataSetFilters:
         _update_alg(interpolator, progress_bar, 'Interpolating')
         return _get_output(interpolator)
 
+    def build_sampling_operator(dataset, target, method='probe',
+                                preference='point', tolerance=None,
+                                sharpness=2, radius=1.0, n_points=None,
+                                strategy='null_value'):
+        """Precompute the sparse operator sampling this mesh at target points.
+
+        The cell ids and interpolation weights are computed once and
+        stored in a ``(n_target_points, n_source_values)`` sparse
+        matrix.  Resampling any array of this mesh onto the target
+        points is then a single sparse matrix product, which makes
+        this well suited to time series where the geometry of both
+        meshes does not change between timesteps.
+
+        Parameters
+        ----------
+        target : pyvista.DataSet or numpy.ndarray
+            The mesh whose points are sampled, or an array of points of
+            shape ``(n, 3)``.
+
+        method : str, optional
+            ``'probe'`` uses the cell interpolation functions of this
+            mesh, giving the same values as :func:`DataSetFilters.probe`
+            and :func:`DataSetFilters.sample`.  ``'interpolate'`` uses a
+            gaussian kernel over the points of this mesh, giving the
+            same values as :func:`DataSetFilters.interpolate`.
+
+        preference : str, optional
+            Either ``'point'`` to build an operator acting on point
+            arrays or ``'cell'`` to build one acting on cell arrays.
+            Cell arrays are only supported by the ``'probe'`` method.
+
+        tolerance : float, optional
+            Distance within which a target point is considered to lie
+            in a cell of this mesh.  Only used by the ``'probe'``
+            method.  Defaults to a millionth of the diagonal of this
+            mesh.
+
+        sharpness : float, optional
+            Sharpness of the gaussian kernel.  Only used by the
+            ``'interpolate'`` method.
+
+        radius : float, optional
+            Radius within which the basis points must lie.  Only used
+            by the ``'interpolate'`` method.
+
+        n_points : int, optional
+            If given, use the ``n_points`` closest points as the
+            interpolation basis instead of a radius.  Only used by the
+            ``'interpolate'`` method.
+
+        strategy : str, optional
+            How to handle target points without any basis point.
+            ``'null_value'`` leaves their row empty so they sample to
+            zero, while ``'closest_point'`` uses the closest point of
+            this mesh.  Only used by the ``'interpolate'`` method.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Operator of shape ``(n_target_points, n_points)`` or
+            ``(n_target_points, n_cells)`` depending on ``preference``.
+            Target points outside this mesh have empty rows.
+
+        Notes
+        -----
+        ``mesh.sample(target)`` samples ``target`` onto ``mesh``, so it
+        corresponds to ``target.build_sampling_operator(mesh)``.
+        Likewise ``mesh.interpolate(target)`` corresponds to
+        ``target.build_sampling_operator(mesh, method='interpolate')``.
+
+        The ``'probe'`` operator locates the cells with a single
+        ``vtkProbeFilter`` pass and costs about as much as one call of
+        ``probe`` on unstructured meshes.  The weights of lines,
+        triangles, tetrahedra, pixels and voxels are computed with
+        numpy, while other cell types are evaluated one target point
+        at a time.  Image data is probed much faster, so the operator
+        only pays off after a few tens of timesteps.  The
+        ``'interpolate'`` operator finds the kernel basis of all the
+        target points at once with a ``scipy.spatial.cKDTree`` and
+        costs about two calls of ``interpolate``.  Applying either
+        operator is a sparse matrix product that is much faster than
+        any of these filters.
+
+        Examples
+        --------
+        Sample the point data of a uniform grid at the points of a
+        sphere for several timesteps.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> grid = examples.load_uniform()
+        >>> sphere = pyvista.Sphere(center=(4.5, 4.5, 4.5), radius=4.5)
+        >>> operator = grid.build_sampling_operator(sphere)
+        >>> steps = [np.sin(grid.points[:, 0] + t) for t in range(3)]
+        >>> sampled = [operator @ values for values in steps]
+        >>> sampled[0].shape == (sphere.n_points, )
+        True
+
+        """
+        try:
+            from scipy import sparse
+            from scipy.spatial import cKDTree
+        except ImportError:  # pragma: no cover
+            raise ImportError('scipy must be available to use this filter.')
+
+        if pyvista.is_pyvista_dataset(target):
+            points = target.points
+        else:
+            points = np.asarray(target, dtype=float).reshape(-1, 3)
+        points = np.asarray(points, dtype=float)
+        n_target = points.shape[0]
+
+        rows = []
+        cols = []
+        values = []
+        if method == 'probe':
+            if preference == 'point':
+                n_columns = dataset.n_points
+            elif preference == 'cell':
+                n_columns = dataset.n_cells
+            else:
+                raise ValueError(f'Data preference `{preference}` not understood.')
+            if tolerance is None:
+                tolerance = 1e-6*dataset.length
+
+            cell_ids, point_ids, weights = _probe_weights(dataset, points, tolerance)
+            if preference == 'cell':
+                found = np.flatnonzero(cell_ids >= 0)
+                rows.append(found)
+                cols.append(cell_ids[found])
+                values.append(np.ones(found.size))
+            else:
+                # unused slots of the cells have negative point ids
+                mask = (cell_ids >= 0)[:, np.newaxis] & (point_ids >= 0)
+                rows.append(np.nonzero(mask)[0])
+                cols.append(point_ids[mask])
+                values.append(weights[mask])
+
+        elif method == 'interpolate':
+            if preference != 'point':
+                raise ValueError('The `interpolate` method only supports point data.')
+            if strategy not in ['null_value', 'closest_point']:
+                raise ValueError(f'strategy `{strategy}` not supported.')
+            n_columns = dataset.n_points
+            if n_columns and n_target:
+                tree = cKDTree(np.asarray(dataset.points, dtype=float))
+                if n_points:
+                    n_closest = min(n_points, n_columns)
+                    distances, ids = tree.query(points, k=n_closest)
+                    row = np.repeat(np.arange(n_target), n_closest)
+                    col = ids.ravel()
+                    dist2 = distances.ravel()**2
+                else:
+                    pairs = cKDTree(points).sparse_distance_matrix(tree, radius,
+                                                                   output_type='ndarray')
+                    row, col, dist2 = pairs['i'], pairs['j'], pairs['v']**2
+
+                # same kernel as vtkGaussianKernel, where a basis point
+                # coinciding with the target point takes all the weight
+                kernel = np.exp(-(sharpness/radius)**2*dist2)
+                exact = np.flatnonzero(dist2 <= 256*np.finfo(float).eps)
+                exact_rows, first = np.unique(row[exact], return_index=True)
+                keep = ~np.isin(row, exact_rows)
+                keep[exact[first]] = True
+                kernel[exact[first]] = 1.0
+                row, col, kernel = row[keep], col[keep], kernel[keep]
+                sums = np.bincount(row, kernel, minlength=n_target)
+                sums[sums == 0] = 1.0
+                rows.append(row)
+                cols.append(col)
+                values.append(kernel/sums[row])
+
+                if strategy == 'closest_point':
+                    empty = np.flatnonzero(np.bincount(row, minlength=n_target) == 0)
+                    rows.append(empty)
+                    cols.append(tree.query(points[empty])[1])
+                    values.append(np.ones(empty.size))
+
+        else:
+            raise ValueError(f'Sampling method `{method}` not understood.')
+
+        if rows:
+            rows = np.concatenate(rows)
+            cols = np.concatenate(cols)
+            values = np.concatenate(values)
+        operator = sparse.csr_matrix((values, (rows, cols)),
+                                     shape=(n_target, n_columns))
+        return operator
+
     def streamlines(dataset, vectors=None, source_center=None,
                     source_radius=None, n_points=100,
                     integrator_type=45, integration_direction='both',
@@ -1955,21 +2936,12 @@ class DataSetFilters:
             will override the sphere point source.
 
         """
-        integration_direction = str(integration_direction).strip().lower()
-        if integration_direction not in ['both', 'back', 'backward', 'forward']:
-            raise ValueError("Integration direction must be one of:\n 'backward', "
-                             f"'forward', or 'both' - not '{integration_direction}'.")
-        if integrator_type not in [2, 4, 45]:
-            raise ValueError('Integrator type must be one of `2`, `4`, or `45`.')
-        if interpolator_type not in ['c', 'cell', 'p', 'point']:
-            raise ValueError("Interpolator type must be either 'cell' or 'point'")
-        if step_unit not in ['l', 'cl']:
-            raise ValueError("Step unit must be either 'l' or 'cl'")
-        step_unit = {'cl': _vtk.vtkStreamTracer.CELL_LENGTH_UNIT,
-                     'l': _vtk.vtkStreamTracer.LENGTH_UNIT}[step_unit]
         if isinstance(vectors, str):
-            dataset.set_active_scalars(vectors)
-            dataset.set_active_vectors(vectors)
+            # only set when needed so the locators of the dataset are kept
+            if dataset.active_scalars_name != vectors:
+                dataset.set_active_scalars(vectors)
+            if dataset.active_vectors_name != vectors:
+                dataset.set_active_vectors(vectors)
         if max_time is None:
             max_velocity = dataset.get_data_range()[-1]
             max_time = 4.0 * dataset.GetLength() / max_velocity
@@ -1988,54 +2960,152 @@ class DataSetFilters:
             source.SetCenter(source_center)
             source.SetRadius(source_radius)
             source.SetNumberOfPoints(n_points)
-        # Build the algorithm
-        alg = _vtk.vtkStreamTracer()
-        # Inputs
-        alg.SetInputDataObject(dataset)
-        # NOTE: not sure why we can't pass a PolyData object
-        #       setting the connection is the only I could get it to work
-        alg.SetSourceConnection(source.GetOutputPort())
-        # general parameters
-        alg.SetComputeVorticity(compute_vorticity)
-        alg.SetInitialIntegrationStep(initial_step_length)
-        alg.SetIntegrationStepUnit(step_unit)
-        alg.SetMaximumError(max_error)
-        alg.SetMaximumIntegrationStep(max_step_length)
-        alg.SetMaximumNumberOfSteps(max_steps)
-        alg.SetMaximumPropagation(max_time)
-        alg.SetMinimumIntegrationStep(min_step_length)
-        alg.SetRotationScale(rotation_scale)
+        source.Update()
+        src = pyvista.wrap(source.GetOutput())
+        alg = _stream_tracer(dataset, vectors, integrator_type, integration_direction,
+                             surface_streamlines, initial_step_length, step_unit,
+                             min_step_length, max_step_length, max_steps, terminal_speed,
+                             max_error, max_time, compute_vorticity, rotation_scale,
+                             interpolator_type)
         alg.SetStartPosition(start_position)
-        alg.SetSurfaceStreamlines(surface_streamlines)
-        alg.SetTerminalSpeed(terminal_speed)
-        # Model parameters
-        if integration_direction == 'forward':
-            alg.SetIntegrationDirectionToForward()
-        elif integration_direction in ['backward', 'back']:
-            alg.SetIntegrationDirectionToBackward()
-        else:
-            alg.SetIntegrationDirectionToBoth()
-        # set integrator type
-        if integrator_type == 2:
-            alg.SetIntegratorTypeToRungeKutta2()
-        elif integrator_type == 4:
-            alg.SetIntegratorTypeToRungeKutta4()
-        else:
-            alg.SetIntegratorTypeToRungeKutta45()
-        # set interpolator type
-        if interpolator_type in ['c', 'cell']:
-            alg.SetInterpolatorTypeToCellLocator()
-        else:
-            alg.SetInterpolatorTypeToDataSetPointLocator()
-        # run the algorithm
+        alg.SetSourceData(src)
         alg.Update()
         output = _get_output(alg)
         if return_source:
-            source.Update()
-            src = pyvista.wrap(source.GetOutput())
             return output, src
         return output
 
+    def streamlines_from_source(dataset, source, vectors=None, integrator_type=45,
+                                integration_direction='both', surface_streamlines=False,
+                                initial_step_length=0.5, step_unit='cl', min_step_length=0.01,
+                                max_step_length=1.0, max_steps=2000, terminal_speed=1e-12,
+                                max_error=1e-6, max_time=None, compute_vorticity=True,
+                                rotation_scale=1.0, interpolator_type='point'):
+        """Integrate a vector field from the given seed points.
+
+        The active vectors and scalars of the dataset are left
+        untouched, so the locators that the interpolators build on the
+        dataset are kept from one call to the next until the dataset
+        is modified.  This makes repeated seeding of the same vector
+        field much cheaper than :func:`DataSetFilters.streamlines`.
+
+        Parameters
+        ----------
+        source : pyvista.DataSet or np.ndarray
+            The points of this dataset, or an array of points, are used
+            as seeds.
+
+        vectors : str, optional
+            Name of the point vector array to integrate.  Defaults to
+            the active vectors.
+
+        **kwargs : dict, optional
+            The integration parameters ``integrator_type``,
+            ``integration_direction``, ``surface_streamlines``,
+            ``initial_step_length``, ``step_unit``, ``min_step_length``,
+            ``max_step_length``, ``max_steps``, ``terminal_speed``,
+            ``max_error``, ``max_time``, ``compute_vorticity``,
+            ``rotation_scale`` and ``interpolator_type`` are the same
+            as in :func:`DataSetFilters.streamlines`.
+
+        Returns
+        -------
+        streamlines : pyvista.PolyData
+            One polyline per seed and direction.  The cell arrays
+            ``'SeedIds'`` and ``'ReasonForTermination'`` give the seed
+            of each line and why its integration stopped.
+
+        Notes
+        -----
+        The reasons for termination are ``1`` when leaving the dataset,
+        ``2`` when the seed is outside the dataset, ``3`` for an
+        unexpected vector value, ``4`` when reaching ``max_time``,
+        ``5`` when reaching ``max_steps`` and ``6`` when the speed
+        falls below ``terminal_speed``.
+
+        Examples
+        --------
+        Trace streamlines from a line of seeds.
+
+        >>> import numpy as np
+        >>> import pyvista as pv
+        >>> from pyvista import examples
+        >>> mesh = examples.download_carotid()  # doctest:+SKIP
+        >>> seeds = np.linspace((80, 90, 20), (120, 110, 20), 20)
+        >>> lines = mesh.streamlines_from_source(seeds, 'vectors')  # doctest:+SKIP
+
+        """
+        if not isinstance(source, _vtk.vtkDataSet):
+            source = pyvista.PolyData(np.asarray(source, dtype=float).reshape(-1, 3))
+        alg = _stream_tracer(dataset, vectors, integrator_type, integration_direction,
+                             surface_streamlines, initial_step_length, step_unit,
+                             min_step_length, max_step_length, max_steps, terminal_speed,
+                             max_error, max_time, compute_vorticity, rotation_scale,
+                             interpolator_type)
+        alg.SetSourceData(source)
+        alg.Update()
+        return _get_output(alg)
+
+    def streamline_batches(dataset, source, batch_size=1000, vectors=None, **kwargs):
+        """Integrate a vector field from seed points, one batch at a time.
+
+        The seeds are traced ``batch_size`` at a time with the same
+        tracer, and the streamlines of each batch are yielded as soon
+        as they are computed, so that they can be shown or processed
+        while the next ones are traced.
+
+        Parameters
+        ----------
+        source : pyvista.DataSet or np.ndarray
+            The points of this dataset, or an array of points, are used
+            as seeds.
+
+        batch_size : int, optional
+            Number of seeds traced in each batch.
+
+        vectors : str, optional
+            Name of the point vector array to integrate.  Defaults to
+            the active vectors.
+
+        **kwargs : dict, optional
+            Integration parameters of
+            :func:`DataSetFilters.streamlines_from_source`.
+
+        Yields
+        ------
+        streamlines : pyvista.PolyData
+            The streamlines of a batch of seeds.  Their ``'SeedIds'``
+            cell array gives the index of their seed among all the
+            seeds.
+
+        Examples
+        --------
+        Trace the streamlines of 1000 random seeds in batches of 100.
+
+        >>> import numpy as np
+        >>> import pyvista as pv
+        >>> from pyvista import examples
+        >>> mesh = examples.download_carotid()  # doctest:+SKIP
+        >>> seeds = np.random.random((1000, 3))*(80, 80, 40) + (70, 70, 0)
+        >>> for lines in mesh.streamline_batches(seeds, 100, 'vectors'):  # doctest:+SKIP
+        ...     print(lines.n_cells)
+
+        """
+        if batch_size < 1:
+            raise ValueError('`batch_size` must be a positive integer.')
+        if isinstance(source, _vtk.vtkDataSet):
+            source = pyvista.wrap(source).points
+        seeds = np.asarray(source, dtype=float).reshape(-1, 3)
+        alg = _stream_tracer(dataset, vectors, **kwargs)
+        for start in range(0, len(seeds), batch_size):
+            alg.SetSourceData(pyvista.PolyData(seeds[start:start + batch_size]))
+            alg.Update()
+            # the tracer refills the same output on each update
+            output = _get_output(alg).copy(deep=False)
+            if 'SeedIds' in output.cell_arrays:
+                output.cell_arrays['SeedIds'] += start
+            yield output
+
     def decimate_boundary(dataset, target_reduction=0.5):
         """Return a decimated version of a triangulation of the boundary.
 
@@ -2084,6 +3154,112 @@ class DataSetFilters:
         sampled_line = line.sample(dataset, tolerance=tolerance)
         return sampled_line
 
+    def sample_over_lines(dataset, lines, resolution=None, tolerance=None):
+        """Sample a dataset onto many lines at once.
+
+        All lines are gathered in a single ``PolyData`` which is
+        sampled with one :func:`DataSetFilters.sample` call, so the
+        locator of this dataset is only built once.
+
+        Parameters
+        ----------
+        lines : np.ndarray or list
+            Sequence of ``M`` polylines, each an array of shape
+            ``(n, 3)`` with ``n >= 2``, such as an array of ``M``
+            segments of shape ``(M, 2, 3)``.  Circular arcs can be
+            sampled by passing the points of :func:`pyvista.CircularArc`.
+
+        resolution : int, optional
+            Number of pieces to divide each segment of each line into.
+            By default, lines of two points are divided into as many
+            pieces as the input mesh has cells, like
+            :func:`DataSetFilters.sample_over_line`, and lines of more
+            points are sampled at their points.  Must be a positive
+            integer.
+
+        tolerance: float, optional
+            Tolerance used to compute whether a point in the source is in a
+            cell of the input.  If not given, tolerance is automatically generated.
+
+        Returns
+        -------
+        sampled_lines : pv.PolyData
+            One polyline cell per line with sampled data from dataset.
+            The points of each line are stored contiguously and in
+            order.  The point array ``'LineIndex'`` holds the index of
+            the line of each point and ``'Distance'`` the distance
+            from the start of its line.
+
+        Examples
+        --------
+        Sample 10 vertical segments and split the result per segment.
+
+        >>> import numpy as np
+        >>> from pyvista import examples
+        >>> uniform = examples.load_uniform()
+        >>> uniform["height"] = uniform.points[:, 2]
+        >>> xy = np.linspace(0, 9, 10)
+        >>> lines = np.zeros((10, 2, 3))
+        >>> lines[:, :, 0] = xy[:, np.newaxis]
+        >>> lines[:, :, 1] = xy[:, np.newaxis]
+        >>> lines[:, 1, 2] = 9
+        >>> sampled = uniform.sample_over_lines(lines, resolution=20)
+        >>> profiles = sampled["height"].reshape(10, 21)
+        >>> profiles.shape
+        (10, 21)
+
+        """
+        if resolution is not None and resolution < 1:
+            raise ValueError('`resolution` must be a positive integer.')
+        try:
+            polylines = [np.asarray(lines, dtype=float)]
+        except ValueError:
+            # lines with different numbers of points
+            polylines = []
+        if not polylines or polylines[0].ndim != 3:
+            polylines = [np.asarray(line, dtype=float)[np.newaxis] for line in lines]
+
+        points = []
+        sizes = []
+        for polyline in polylines:
+            if polyline.ndim != 3 or polyline.shape[1] < 2 or polyline.shape[2] != 3:
+                raise ValueError('Each line must be an array of at least two points '
+                                 'of shape ``(n, 3)``.')
+            n_pieces = resolution
+            if n_pieces is None:
+                n_pieces = int(dataset.n_cells) if polyline.shape[1] == 2 else 1
+            # subdivide every segment of every line at once
+            start = polyline[:, :-1, np.newaxis]
+            step = (polyline[:, 1:, np.newaxis] - start)/n_pieces
+            pieces = start + np.arange(n_pieces)[:, np.newaxis]*step
+            pieces = pieces.reshape(polyline.shape[0], -1, 3)
+            points.append(np.concatenate([pieces, polyline[:, -1:]], axis=1).reshape(-1, 3))
+            sizes.append(np.full(polyline.shape[0], pieces.shape[1] + 1))
+        points = np.concatenate(points)
+        sizes = np.concatenate(sizes)
+
+        n_lines = sizes.size
+        offsets = np.zeros(n_lines + 1, dtype=pyvista.ID_TYPE)
+        np.cumsum(sizes, out=offsets[1:])
+        cells = np.empty(offsets[-1] + n_lines, dtype=pyvista.ID_TYPE)
+        counts = offsets[:-1] + np.arange(n_lines)
+        cells[counts] = sizes
+        mask = np.ones(cells.size, dtype=bool)
+        mask[counts] = False
+        cells[mask] = np.arange(offsets[-1])
+
+        line_index = np.repeat(np.arange(n_lines), sizes)
+        lengths = np.zeros(points.shape[0])
+        lengths[1:] = np.linalg.norm(np.diff(points, axis=0), axis=1)
+        lengths[offsets[:-1]] = 0
+        distance = np.cumsum(lengths)
+        distance -= distance[offsets[:-1]][line_index]
+
+        sampled_lines = pyvista.PolyData(points, lines=cells)
+        sampled_lines.point_arrays['LineIndex'] = line_index
+        sampled_lines.point_arrays['Distance'] = distance
+        return sampled_lines.sample(dataset, tolerance=tolerance)
+
     def plot_over_line(dataset, pointa, pointb, resolution=None, scalars=None,
                        title=None, ylabel=None, figsize=None, figure=True,
                        show=True, tolerance=None, fname=None):
@@ -2499,7 +3675,7 @@ class DataSetFilters:
         if show:  # pragma: no cover
             return plt.show()
 
-    def extract_cells(dataset, ind):
+    def extract_cells(dataset, ind, pass_arrays=None):
         """Return a subset of the grid.
 
         Parameters
@@ -2507,6 +3683,10 @@ class DataSetFilters:
         ind : np.ndarray
             Numpy array of cell indices to be extracted.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         Returns
         -------
         subgrid : pyvista.UnstructuredGrid
@@ -2524,7 +3704,7 @@ class DataSetFilters:
 
         # extract
         extract_sel = _vtk.vtkExtractSelection()
-        extract_sel.SetInputData(0, dataset)
+        extract_sel.SetInputData(0, _select_arrays(dataset, pass_arrays))
         extract_sel.SetInputData(1, selection)
         extract_sel.Update()
         subgrid = _get_output(extract_sel)
@@ -2537,7 +3717,7 @@ class DataSetFilters:
 
         return subgrid
 
-    def extract_points(dataset, ind, adjacent_cells=True, include_cells=True):
+    def extract_points(dataset, ind, adjacent_cells=True, include_cells=True, pass_arrays=None):
         """Return a subset of the grid (with cells) that contains any of the given point indices.
 
         Parameters
@@ -2553,6 +3733,10 @@ class DataSetFilters:
             Specifies if the cells shall be returned or not. The default is 
             True.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         Returns
         -------
         subgrid : pyvista.UnstructuredGrid
@@ -2581,13 +3765,13 @@ class DataSetFilters:
 
         # extract
         extract_sel = _vtk.vtkExtractSelection()
-        extract_sel.SetInputData(0, dataset)
+        extract_sel.SetInputData(0, _select_arrays(dataset, pass_arrays))
         extract_sel.SetInputData(1, selection)
         extract_sel.Update()
         return _get_output(extract_sel)
 
     def extract_surface(dataset, pass_pointid=True, pass_cellid=True,
-                        nonlinear_subdivision=1):
+                        nonlinear_subdivision=1, pass_arrays=None):
         """Extract surface mesh of the grid.
 
         Parameters
@@ -2615,6 +3799,10 @@ class DataSetFilters:
             be passed even if no nonlinear faces exist. This option
             has no effect if the input is not an unstructured grid.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         Returns
         -------
         pyvista.PolyData
@@ -2633,7 +3821,7 @@ class DataSetFilters:
 
         """
         surf_filter = _vtk.vtkDataSetSurfaceFilter()
-        surf_filter.SetInputData(dataset)
+        surf_filter.SetInputData(_select_arrays(dataset, pass_arrays))
         if pass_pointid:
             surf_filter.PassThroughCellIdsOn()
         if pass_cellid:
@@ -2700,20 +3888,31 @@ class DataSetFilters:
         edges : pyvista.vtkPolyData
             Extracted edges.
 
+        Notes
+        -----
+        The edges of surfaces without triangle strips are classified
+        from a table of their unique edges, which is cached on the mesh
+        so that repeated queries on the same surface do not rebuild the
+        edge topology.
+
         """
         if not isinstance(dataset, _vtk.vtkPolyData):
             dataset = DataSetFilters.extract_surface(dataset)
-        featureEdges = _vtk.vtkFeatureEdges()
-        featureEdges.SetInputData(dataset)
-        featureEdges.SetFeatureAngle(feature_angle)
-        featureEdges.SetManifoldEdges(manifold_edges)
-        featureEdges.SetNonManifoldEdges(non_manifold_edges)
-        featureEdges.SetBoundaryEdges(boundary_edges)
-        featureEdges.SetFeatureEdges(feature_edges)
-        featureEdges.SetColoring(False)
-        featureEdges.Update()
-
-        mesh = _get_output(featureEdges)
+        if not dataset.GetNumberOfStrips():
+            mask = _edge_classes(dataset, feature_angle, boundary_edges,
+                                 non_manifold_edges, feature_edges, manifold_edges)
+            mesh = _edges_to_poly_data(dataset, mask)
+        else:
+            featureEdges = _vtk.vtkFeatureEdges()
+            featureEdges.SetInputData(dataset)
+            featureEdges.SetFeatureAngle(feature_angle)
+            featureEdges.SetManifoldEdges(manifold_edges)
+            featureEdges.SetNonManifoldEdges(non_manifold_edges)
+            featureEdges.SetBoundaryEdges(boundary_edges)
+            featureEdges.SetFeatureEdges(feature_edges)
+            featureEdges.SetColoring(False)
+            featureEdges.Update()
+            mesh = _get_output(featureEdges)
         if inplace:
             dataset.overwrite(mesh)
             return dataset
@@ -2758,6 +3957,9 @@ class DataSetFilters:
         array must match or the arrays will be ignored and not
         included in the final merged mesh.
 
+        Use :func:`pyvista.merge` to join many datasets at once, which
+        is much faster than merging them one after the other.
+
         """
         append_filter = _vtk.vtkAppendFilter()
         append_filter.SetMergePoints(merge_points)
@@ -2790,7 +3992,99 @@ class DataSetFilters:
         """Combine this mesh with another into an :class:`pyvista.UnstructuredGrid`."""
         return DataSetFilters.merge(dataset, grid)
 
-    def compute_cell_quality(dataset, quality_measure='scaled_jacobian', null_value=-1.0):
+    def merge_points(dataset, tolerance=0.0):
+        """Merge coincident or nearby points using quantized spatial hashing.
+
+        Points are snapped to a grid of cells of size ``tolerance``
+        and all the points falling in the same grid cell are merged
+        into the first of them, keeping its coordinates and point
+        data.  With the default ``tolerance=0.0`` only points with
+        exactly the same coordinates are merged.  Grouping the points
+        takes a single sort, which is much faster than the point
+        locators of ``clean`` and ``merge`` on large point soups.
+
+        Cells are kept as they are, even when merging collapses some
+        of their points.  Use ``clean`` to remove degenerate cells.
+
+        Parameters
+        ----------
+        tolerance : float, optional
+            Size of the grid cells used to quantize the points.  Points
+            closer than ``tolerance`` may still fall in adjacent grid
+            cells and are not merged then.
+
+        Returns
+        -------
+        merged : pyvista.PolyData or pyvista.UnstructuredGrid
+            Mesh with merged points.  ``PolyData`` is returned for a
+            ``PolyData`` input and ``UnstructuredGrid`` otherwise.
+
+        point_map : np.ndarray
+            Index in ``merged`` of each point of the input mesh.
+
+        Examples
+        --------
+        Merge the points of a sphere whose triangles do not share any
+        points.  A small tolerance absorbs the round-off of ``shrink``.
+
+        >>> import pyvista
+        >>> soup = pyvista.Sphere().shrink(1.0)
+        >>> soup.n_points
+        5040
+        >>> merged, point_map = soup.merge_points(tolerance=1e-6)
+        >>> merged.n_points
+        842
+
+        """
+        if tolerance < 0:
+            raise ValueError('`tolerance` must be non-negative.')
+        points = np.asarray(dataset.points, dtype=float)
+        if tolerance > 0:
+            keys = np.floor((points - points.min(axis=0))/tolerance).astype(np.int64)
+        else:
+            # adding zero turns -0.0 into 0.0 before comparing bit patterns
+            keys = np.ascontiguousarray(points + 0.0).view(np.int64)
+        if points.shape[0]:
+            point_ids, point_map = _group_rows(keys)
+        else:
+            point_ids = point_map = np.empty(0, dtype=pyvista.ID_TYPE)
+
+        if isinstance(dataset, _vtk.vtkPolyData):
+            merged = pyvista.PolyData()
+            merged.points = dataset.points[point_ids]
+            cell_arrays = [_cell_array_to_numpy(carr) for carr in
+                           (dataset.GetVerts(), dataset.GetLines(),
+                            dataset.GetPolys(), dataset.GetStrips())]
+            cell_arrays = [_numpy_to_cell_array(offsets, point_map[connectivity])
+                           for offsets, connectivity in cell_arrays]
+            merged.SetVerts(cell_arrays[0])
+            merged.SetLines(cell_arrays[1])
+            merged.SetPolys(cell_arrays[2])
+            merged.SetStrips(cell_arrays[3])
+        else:
+            grid = dataset
+            if not isinstance(dataset, _vtk.vtkUnstructuredGrid):
+                grid = dataset.cast_to_unstructured_grid()
+            if np.any(grid.celltypes == _vtk.VTK_POLYHEDRON):
+                raise ValueError('Meshes with polyhedral cells are not supported.')
+            offsets, connectivity = _cell_array_to_numpy(grid.GetCells())
+            cells = _numpy_to_cell_array(offsets, point_map[connectivity])
+            cell_types = _vtk.numpy_to_vtk(np.ascontiguousarray(grid.celltypes), deep=True)
+            merged = pyvista.UnstructuredGrid()
+            merged.points = grid.points[point_ids]
+            if _vtk.VTK9:
+                merged.SetCells(cell_types, cells)
+            else:  # pragma: no cover
+                locations = offsets[:-1] + np.arange(offsets.size - 1)
+                merged.SetCells(cell_types, numpy_to_idarr(locations, deep=True), cells)
+        _take_attributes(dataset.GetPointData(), merged.GetPointData(), point_ids)
+        merged.GetCellData().ShallowCopy(dataset.GetCellData())
+        merged.GetFieldData().ShallowCopy(dataset.GetFieldData())
+        merged.copy_meta_from(dataset)
+        return merged, point_map
+
+    def compute_cell_quality(dataset, quality_measure='scaled_jacobian', null_value=-1.0,
+                             measures=None, return_summary=False):
         """Compute a function of (geometric) quality for each cell of a mesh.
 
         The per-cell quality is added to the mesh's cell data, in an array
@@ -2799,36 +4093,43 @@ class DataSetFilters:
 
         Defaults to computing the scaled jacobian.
 
+        Several measures can be computed at once with ``measures``,
+        each of them stored in a cell array named after the measure.
+        On grids made only of tetrahedra or only of hexahedra, these
+        are evaluated with vectorized kernels for the measures marked
+        with ``(tet)`` or ``(hex)`` below, which give the same values
+        as VTK.
+
         Options for cell quality measure:
 
         - ``'area'``
         - ``'aspect_beta'``
-        - ``'aspect_frobenius'``
+        - ``'aspect_frobenius'`` (tet)
         - ``'aspect_gamma'``
-        - ``'aspect_ratio'``
+        - ``'aspect_ratio'`` (tet)
         - ``'collapse_ratio'``
         - ``'condition'``
-        - ``'diagonal'``
+        - ``'diagonal'`` (hex)
         - ``'dimension'``
         - ``'distortion'``
-        - ``'jacobian'``
+        - ``'jacobian'`` (tet, hex)
         - ``'max_angle'``
         - ``'max_aspect_frobenius'``
-        - ``'max_edge_ratio'``
+        - ``'max_edge_ratio'`` (hex)
         - ``'med_aspect_frobenius'``
-        - ``'min_angle'``
+        - ``'min_angle'`` (tet)
         - ``'oddy'``
-        - ``'radius_ratio'``
+        - ``'radius_ratio'`` (tet)
         - ``'relative_size_squared'``
-        - ``'scaled_jacobian'``
+        - ``'scaled_jacobian'`` (tet, hex)
         - ``'shape'``
         - ``'shape_and_size'``
         - ``'shear'``
         - ``'shear_and_size'``
-        - ``'skew'``
-        - ``'stretch'``
-        - ``'taper'``
-        - ``'volume'``
+        - ``'skew'`` (hex)
+        - ``'stretch'`` (hex)
+        - ``'taper'`` (hex)
+        - ``'volume'`` (tet, hex)
         - ``'warpage'``
 
         Parameters
@@ -2843,6 +4144,37 @@ class DataSetFilters:
             for a triangle. Undefined quality will always be undefined.
             The default value is -1.
 
+        measures : list(str), optional
+            Cell quality measures to compute at once.  Each one is
+            stored in a cell array named after the measure and
+            ``quality_measure`` is ignored.
+
+        return_summary : bool, optional
+            Also return a dictionary with the ``'min'``, ``'max'``,
+            ``'mean'`` and ``'std'`` of each computed measure over the
+            cells where it is not ``null_value``.
+
+        Returns
+        -------
+        mesh : pyvista.DataSet
+            Mesh with the cell quality arrays.
+
+        summary : dict
+            Summary statistics keyed by measure.  Only returned when
+            ``return_summary=True``.
+
+        Examples
+        --------
+        Compute two measures of a tetrahedral mesh at once
+
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> mesh = examples.load_hexbeam().triangulate()
+        >>> qual, summary = mesh.compute_cell_quality(measures=['volume', 'scaled_jacobian'],
+        ...                                           return_summary=True)
+        >>> print(f"{summary['scaled_jacobian']['min']:.3f}")
+        0.408
+
         """
         alg = _vtk.vtkCellQuality()
         measure_setters = {
@@ -2876,16 +4208,41 @@ class DataSetFilters:
             'volume': alg.SetQualityMeasureToVolume,
             'warpage': alg.SetQualityMeasureToWarpage
         }
-        try:
-            # Set user specified quality measure
-            measure_setters[quality_measure]()
-        except (KeyError, IndexError):
-            options = ', '.join([f"'{s}'" for s in list(measure_setters.keys())])
-            raise KeyError(f'Cell quality type ({quality_measure}) not available. Options are: {options}')
+        if measures is None:
+            names = {quality_measure: 'CellQuality'}
+        else:
+            names = {measure: measure for measure in measures}
+        for measure in names:
+            if measure not in measure_setters:
+                options = ', '.join([f"'{s}'" for s in list(measure_setters.keys())])
+                raise KeyError(f'Cell quality type ({measure}) not available. Options are: {options}')
+
+        # the vectorized kernels share one gather of the cells, which only
+        # pays off over separate VTK passes when several measures are needed
+        values = {}
+        if len(names) > 1:
+            values = _homogeneous_cell_quality(dataset, names)
+        output = dataset.copy(deep=False)
         alg.SetInputData(dataset)
         alg.SetUndefinedQuality(null_value)
-        alg.Update()
-        return _get_output(alg)
+        for measure, name in names.items():
+            if measure not in values:
+                measure_setters[measure]()
+                alg.Update()
+                quality = alg.GetOutput().GetCellData().GetArray('CellQuality')
+                values[measure] = _vtk.vtk_to_numpy(quality).copy()
+            output.cell_arrays[name] = values[measure]
+
+        if not return_summary:
+            return output
+        summary = {}
+        for measure in names:
+            defined = values[measure][values[measure] != null_value]
+            if not defined.size:
+                defined = np.array([np.nan])
+            summary[measure] = {'min': defined.min(), 'max': defined.max(),
+                                'mean': defined.mean(), 'std': defined.std()}
+        return output, summary
 
     def compute_derivative(dataset, scalars=None, gradient=True,
                            divergence=None, vorticity=None, qcriterion=None,
@@ -2973,7 +4330,7 @@ class DataSetFilters:
         alg.Update()
         return _get_output(alg)
 
-    def shrink(dataset, shrink_factor=1.0, progress_bar=False):
+    def shrink(dataset, shrink_factor=1.0, progress_bar=False, pass_arrays=None):
         """Shrink the individual faces of a mesh.
 
         This filter shrinks the individual faces of a mesh rather than scaling
@@ -2987,6 +4344,10 @@ class DataSetFilters:
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         Examples
         --------
         Extrude shrink mesh
@@ -2998,12 +4359,13 @@ class DataSetFilters:
         if not (0.0 <= shrink_factor <= 1.0):
             raise ValueError('`shrink_factor` should be between 0.0 and 1.0')
         alg = _vtk.vtkShrinkFilter()
-        alg.SetInputData(dataset)
+        alg.SetInputData(_select_arrays(dataset, pass_arrays))
         alg.SetShrinkFactor(shrink_factor)
         _update_alg(alg, progress_bar, 'Shrinking Mesh')
         output = pyvista.wrap(alg.GetOutput())
         if isinstance(dataset, _vtk.vtkPolyData):
             return output.extract_surface()
+        return output
 
     def transform(dataset: _vtk.vtkDataSet,
                   trans: Union[_vtk.vtkMatrix4x4, _vtk.vtkTransform, np.ndarray],
@@ -3019,6 +4381,17 @@ class DataSetFilters:
             When ``True``, all input vectors are transformed. Otherwise, only the
             points, normals and active vectors are transformed.
 
+        inplace : bool, optional
+            When ``True``, the points and vectors of the mesh are
+            overwritten.  Otherwise, a new mesh is returned.
+
+        Notes
+        -----
+        Affine transforms of meshes with explicit points, like
+        :class:`pyvista.PolyData` and :class:`pyvista.UnstructuredGrid`,
+        are applied with numpy by chunks and keep the type of the points
+        and vectors.  Other transforms use ``vtkTransformFilter``.
+
         Examples
         --------
         Translate a mesh by (50, 100, 200)
@@ -3058,6 +4431,15 @@ class DataSetFilters:
             raise ValueError(
                 "Transform element (3,3), the inverse scale term, is zero")
 
+        matrix = pyvista.array_from_vtkmatrix(m)
+        if (isinstance(dataset, _vtk.vtkPointSet) and
+                np.array_equal(matrix[3], [0, 0, 0, 1]) and
+                np.linalg.det(matrix[:3, :3]) != 0):
+            # transform explicit points of affine transforms with numpy
+            return _transform_point_set(dataset, matrix,
+                                        transform_all_input_vectors=transform_all_input_vectors,
+                                        inplace=inplace)
+
         # vtkTransformFilter sometimes doesn't transform all vector arrays
         # when there are active point/cell scalars. Use this workaround
         active_scalars_name = dataset.active_scalars_name
@@ -3125,6 +4507,45 @@ class DataSetFilters:
         return dataset.transform(t, transform_all_input_vectors=transform_all_input_vectors,
                                  inplace=inplace)
 
+    def bind_filter(dataset, name, **kwargs):
+        """Bind a filter to this dataset to reuse its output.
+
+        The returned :class:`pyvista.BoundFilter` keeps a persistent
+        output that is refreshed in place whenever the parameters of
+        the filter change or this dataset is modified.  Add that output
+        to a plotter once and call ``update`` from animation or widget
+        callbacks instead of adding a new mesh for every change.
+
+        Parameters
+        ----------
+        name : str
+            Name of the filter, for example ``'clip'`` or ``'contour'``.
+
+        **kwargs : dict, optional
+            Initial parameters of the filter.
+
+        Returns
+        -------
+        pyvista.BoundFilter
+            The bound filter.
+
+        Examples
+        --------
+        Sweep a clipping plane across a mesh.
+
+        >>> import numpy as np
+        >>> import pyvista as pv
+        >>> mesh = pv.Sphere()
+        >>> clipper = mesh.bind_filter('clip', normal='x', origin=(0, 0, 0))
+        >>> plotter = pv.Plotter()  # doctest:+SKIP
+        >>> _ = plotter.add_mesh(clipper.output)  # doctest:+SKIP
+        >>> for x in np.linspace(-0.4, 0.4, 5):
+        ...     _ = clipper.update(origin=(x, 0, 0))
+        ...     plotter.render()  # doctest:+SKIP
+
+        """
+        return BoundFilter(dataset, name, **kwargs)
+
 
 @abstract_class
 class CompositeFilters:
@@ -3146,20 +4567,25 @@ class CompositeFilters:
     def combine(composite, merge_points=False):
         """Append all blocks into a single unstructured grid.
 
+        Nested blocks are appended in the same single pass as the
+        other blocks, see :func:`pyvista.merge`.
+
         Parameters
         ----------
         merge_points : bool, optional
-            Merge coincidental points.
+            Merge coincidental points.  Merged points keep the point
+            data of the last block they belong to.
 
         """
-        alg = _vtk.vtkAppendFilter()
-        for block in composite:
-            if isinstance(block, _vtk.vtkMultiBlockDataSet):
-                block = CompositeFilters.combine(block, merge_points=merge_points)
-            alg.AddInputData(block)
-        alg.SetMergePoints(merge_points)
-        alg.Update()
-        return wrap(alg.GetOutputDataObject(0))
+        def blocks(composite):
+            for block in composite:
+                if isinstance(block, _vtk.vtkMultiBlockDataSet):
+                    yield from blocks(wrap(block))
+                elif block is not None:
+                    yield wrap(block)
+
+        return _append_datasets(blocks(composite), merge_points=merge_points,
+                                main_has_priority=False, unstructured=True)
 
     clip = DataSetFilters.clip
 
@@ -3235,9 +4661,23 @@ class PolyDataFilters(DataSetFilters):
         angle : float
             Angle to consider an edge.
 
+        Examples
+        --------
+        >>> import pyvista
+        >>> mask = pyvista.Cube().clean().triangulate().edge_mask(45)
+        >>> int(mask.sum())
+        8
+
         """
         if not isinstance(poly_data, pyvista.PolyData):  # pragma: no cover
             poly_data = pyvista.PolyData(poly_data)
+        if not poly_data.GetNumberOfStrips():
+            edges = _edge_table(poly_data)[0]
+            feature = _edge_classes(poly_data, angle, boundary_edges=False,
+                                    non_manifold_edges=False, manifold_edges=False)
+            mask = np.zeros(poly_data.n_points, dtype=bool)
+            mask[edges[feature].ravel()] = True
+            return mask
         poly_data.point_arrays['point_ind'] = np.arange(poly_data.n_points)
         featureEdges = _vtk.vtkFeatureEdges()
         featureEdges.SetInputData(poly_data)
@@ -3275,17 +4715,7 @@ class PolyDataFilters(DataSetFilters):
         if not poly_data.is_all_triangles() or not cut.is_all_triangles():
             raise NotAllTrianglesError("Make sure both the input and output are triangulated.")
 
-        bfilter = _vtk.vtkBooleanOperationPolyDataFilter()
-        bfilter.SetOperationToIntersection()
-        # bfilter.SetOperationToDifference()
-
-        bfilter.SetInputData(1, cut)
-        bfilter.SetInputData(0, poly_data)
-        bfilter.ReorientDifferenceCellsOff()
-        bfilter.SetTolerance(tolerance)
-        bfilter.Update()
-
-        mesh = _get_output(bfilter)
+        mesh = _boolean_operation(poly_data, cut, 'intersection', tolerance)
         if inplace:
             poly_data.overwrite(mesh)
             return poly_data
@@ -3348,18 +4778,21 @@ class PolyDataFilters(DataSetFilters):
         union : pyvista.PolyData
             The union mesh.
 
+        Notes
+        -----
+        When both meshes are closed triangle surfaces, only the
+        triangles overlapping the bounds of both meshes go through
+        ``vtkBooleanOperationPolyDataFilter``, and the others are
+        stitched back to the result, so that the cost follows the size
+        of the overlap rather than the size of the meshes.  This also
+        applies to :func:`PolyDataFilters.boolean_difference` and
+        :func:`PolyDataFilters.boolean_cut`.
+
         """
         if not isinstance(mesh, pyvista.PolyData):
             raise TypeError("Input mesh must be PolyData.")
 
-        bfilter = _vtk.vtkBooleanOperationPolyDataFilter()
-        bfilter.SetOperationToUnion()
-        bfilter.SetInputData(1, mesh)
-        bfilter.SetInputData(0, poly_data)
-        bfilter.ReorientDifferenceCellsOff()
-        bfilter.Update()
-
-        mesh = _get_output(bfilter)
+        mesh = _boolean_operation(poly_data, mesh, 'union')
         if inplace:
             poly_data.overwrite(mesh)
             return poly_data
@@ -3386,14 +4819,7 @@ class PolyDataFilters(DataSetFilters):
         if not isinstance(mesh, pyvista.PolyData):
             raise TypeError("Input mesh must be PolyData.")
 
-        bfilter = _vtk.vtkBooleanOperationPolyDataFilter()
-        bfilter.SetOperationToDifference()
-        bfilter.SetInputData(1, mesh)
-        bfilter.SetInputData(0, poly_data)
-        bfilter.ReorientDifferenceCellsOff()
-        bfilter.Update()
-
-        mesh = _get_output(bfilter)
+        mesh = _boolean_operation(poly_data, mesh, 'difference')
         if inplace:
             poly_data.overwrite(mesh)
             return poly_data
@@ -3446,20 +4872,56 @@ class PolyDataFilters(DataSetFilters):
                                                         split_first=False, \
                                                         split_second=True)
 
+        Notes
+        -----
+        Triangles outside of the bounds of the other mesh cannot
+        intersect it, so when both meshes are all triangles only the
+        patches of triangles overlapping the bounds of both meshes are
+        intersected.  The split patches are then joined back to the
+        untouched triangles, which come first in the split meshes.
+
         """
+        meshes = (poly_data, mesh)
+        masks = _overlap_cells(poly_data, mesh, 0.0, closed=False)
+        inputs = meshes
+        if masks is not None:
+            inputs = [_split_poly_data(part, np.where(mask, 0, -1), 1)[0]
+                      for part, mask in zip(meshes, masks)]
+
         intfilter = _vtk.vtkIntersectionPolyDataFilter()
-        intfilter.SetInputDataObject(0, poly_data)
-        intfilter.SetInputDataObject(1, mesh)
+        intfilter.SetInputDataObject(0, inputs[0])
+        intfilter.SetInputDataObject(1, inputs[1])
         intfilter.SetComputeIntersectionPointArray(True)
         intfilter.SetSplitFirstOutput(split_first)
         intfilter.SetSplitSecondOutput(split_second)
-        intfilter.Update()
+        if all(part.n_cells for part in inputs):
+            intfilter.Update()
 
         intersection = _get_output(intfilter, oport=0)
         first = _get_output(intfilter, oport=1)
         second = _get_output(intfilter, oport=2)
-
-        return intersection, first, second
+        if masks is None:
+            return intersection, first, second
+
+        # map the patches back to the whole meshes
+        outputs = [intersection]
+        for i, (split, patch) in enumerate(zip((split_first, split_second), (first, second))):
+            cell_ids = np.flatnonzero(masks[i])
+            name = f'Input{i}CellID'
+            if name in intersection.cell_arrays:
+                intersection.cell_arrays[name] = cell_ids[intersection.cell_arrays[name]]
+            if not (split and patch.n_cells):
+                outputs.append(meshes[i].copy())
+                continue
+            # the untouched cells come first in the split mesh
+            name = f'NewCell{i}ID'
+            if name in intersection.cell_arrays:
+                new_ids = intersection.cell_arrays[name]
+                shift = masks[i].size - cell_ids.size
+                intersection.cell_arrays[name] = np.where(new_ids >= 0, new_ids + shift, -1)
+            outputs.append(_stitch_patch(meshes[i], masks[i], patch,
+                                         np.arange(patch.n_cells), True))
+        return tuple(outputs)
 
     def curvature(poly_data, curv_type='mean'):
         """Return the pointwise curvature of a mesh.
@@ -3538,7 +5000,7 @@ class PolyDataFilters(DataSetFilters):
         return poly_data.plot(scalars=poly_data.curvature(curv_type),
                               **kwargs)
 
-    def triangulate(poly_data, inplace=False):
+    def triangulate(poly_data, inplace=False, pass_arrays=None):
         """Return an all triangle mesh.
 
         More complex polygons will be broken down into tetrahedrals.
@@ -3548,6 +5010,10 @@ class PolyDataFilters(DataSetFilters):
         inplace : bool, optional
             Updates mesh in-place.
 
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
         Returns
         -------
         mesh : pyvista.PolyData
@@ -3555,7 +5021,7 @@ class PolyDataFilters(DataSetFilters):
 
         """
         trifilter = _vtk.vtkTriangleFilter()
-        trifilter.SetInputData(poly_data)
+        trifilter.SetInputData(_select_arrays(poly_data, pass_arrays))
         trifilter.PassVertsOff()
         trifilter.PassLinesOff()
         trifilter.Update()
@@ -3641,6 +5107,251 @@ class PolyDataFilters(DataSetFilters):
         else:
             return mesh
 
+    def laplacian_operator(poly_data, weights='uniform'):
+        """Return the Laplacian operator of this mesh as a sparse matrix.
+
+        The operator is cached on the mesh, so that iterative
+        workflows only pay for a sparse matrix product per step.
+        Requires ``scipy``.
+
+        Parameters
+        ----------
+        weights : str, optional
+            ``'uniform'`` weights every edge equally, so that
+            ``operator @ mesh.points`` is the vector from each point to
+            the average of its neighbors.  ``'cotangent'`` uses the
+            cotangent weights of an all triangle mesh, normalized by a
+            third of the area of the triangles around each point.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Operator of shape ``(n_points, n_points)``.  Its rows sum
+            to zero and isolated points have empty rows.
+
+        Examples
+        --------
+        The Laplacian of a linear function vanishes inside a plane.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> plane = pyvista.Plane(i_resolution=4, j_resolution=4).triangulate()
+        >>> operator = plane.laplacian_operator(weights='cotangent')
+        >>> values = operator @ plane.points[:, 0]
+        >>> print(f'{np.abs(values).reshape(5, 5)[1:-1, 1:-1].max():.3f}')
+        0.000
+
+        """
+        return _laplacian(poly_data, weights)[0]
+
+    def smooth_laplacian(poly_data, n_iter=20, relaxation_factor=0.1, weights='uniform',
+                         boundary_smoothing=True, inplace=False):
+        """Smooth the points of this mesh with sparse Laplacian iterations.
+
+        Each iteration moves the points by ``relaxation_factor`` times
+        the vector to the weighted average of their neighbors, computed
+        with a single sparse matrix product from
+        :func:`PolyDataFilters.laplacian_operator`.
+        Unlike :func:`PolyDataFilters.smooth`, feature edges are not
+        preserved.  Requires ``scipy``.
+
+        Parameters
+        ----------
+        n_iter : int, optional
+            Number of iterations.
+
+        relaxation_factor : float, optional
+            Fraction of the Laplacian applied at each iteration.
+
+        weights : str, optional
+            Weights of the Laplacian, ``'uniform'`` or ``'cotangent'``.
+
+        boundary_smoothing : bool, optional
+            Smooth the points on the boundary edges.  Otherwise, they
+            stay in place.
+
+        inplace : bool, optional
+            Updates mesh in-place.
+
+        Returns
+        -------
+        mesh : pyvista.PolyData
+            Smoothed mesh.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere()
+        >>> smoothed = sphere.smooth_laplacian(n_iter=50, relaxation_factor=0.5)
+        >>> smoothed.volume < sphere.volume
+        True
+
+        """
+        return _smooth_points(poly_data, (relaxation_factor, ), n_iter, weights,
+                              boundary_smoothing, inplace)
+
+    def smooth_taubin(poly_data, n_iter=20, relaxation_factor=0.5, pass_band=0.1,
+                      weights='uniform', boundary_smoothing=True, inplace=False):
+        """Smooth the points of this mesh with Taubin's low-pass filter.
+
+        Each iteration applies a shrinking Laplacian step of factor
+        ``relaxation_factor`` followed by an inflating step of factor
+        ``1/(pass_band - 1/relaxation_factor)``, which removes noise
+        without the shrinkage of Laplacian smoothing.  Each step is a
+        single sparse matrix product using
+        :func:`PolyDataFilters.laplacian_operator`.  Requires ``scipy``.
+
+        Parameters
+        ----------
+        n_iter : int, optional
+            Number of iterations.
+
+        relaxation_factor : float, optional
+            Factor of the shrinking step, between 0 and 1.
+
+        pass_band : float, optional
+            Pass band frequency of the filter.  Typical values are
+            between 0.01 and 0.1.
+
+        weights : str, optional
+            Weights of the Laplacian, ``'uniform'`` or ``'cotangent'``.
+
+        boundary_smoothing : bool, optional
+            Smooth the points on the boundary edges.  Otherwise, they
+            stay in place.
+
+        inplace : bool, optional
+            Updates mesh in-place.
+
+        Returns
+        -------
+        mesh : pyvista.PolyData
+            Smoothed mesh.
+
+        Examples
+        --------
+        Taubin smoothing shrinks a sphere much less than Laplacian
+        smoothing.
+
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere()
+        >>> taubin = sphere.smooth_taubin(n_iter=50)
+        >>> laplacian = sphere.smooth_laplacian(n_iter=50, relaxation_factor=0.5)
+        >>> print(f'{taubin.volume/sphere.volume:.2f} {laplacian.volume/sphere.volume:.2f}')
+        1.04 0.38
+
+        """
+        if not 0 < relaxation_factor < 1:
+            raise ValueError('`relaxation_factor` must be between 0 and 1.')
+        inflation = 1/(pass_band - 1/relaxation_factor)
+        return _smooth_points(poly_data, (relaxation_factor, inflation), n_iter, weights,
+                              boundary_smoothing, inplace)
+
+    def diffuse(poly_data, scalars, time=1.0, weights='uniform'):
+        """Diffuse point scalars over this mesh following the heat equation.
+
+        The scalars evolve as ``du/dt = L u`` for ``time``, where ``L``
+        is the Laplacian of :func:`PolyDataFilters.laplacian_operator`.
+        The exponential of the operator is applied with
+        ``scipy.sparse.linalg.expm_multiply``, which only uses sparse
+        matrix products.  Requires ``scipy``.
+
+        Parameters
+        ----------
+        scalars : str or np.ndarray
+            Name of a point array, or values of shape ``(n_points, )``
+            or ``(n_points, n_components)``.
+
+        time : float, optional
+            Diffusion time.  With uniform weights, a time of one spreads
+            values roughly over the direct neighbors of each point.
+
+        weights : str, optional
+            Weights of the Laplacian, ``'uniform'`` or ``'cotangent'``.
+
+        Returns
+        -------
+        np.ndarray
+            Diffused scalars, with the shape of the input scalars.
+
+        Examples
+        --------
+        Spread a unit value from the first point of a sphere.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere()
+        >>> values = np.zeros(sphere.n_points)
+        >>> values[0] = 1
+        >>> diffused = sphere.diffuse(values, time=2.0)
+        >>> print(f'{diffused[0]:.3f}')
+        0.217
+
+        """
+        try:
+            from scipy.sparse.linalg import expm_multiply
+        except ImportError:  # pragma: no cover
+            raise ImportError('scipy must be available to use this filter.')
+
+        if isinstance(scalars, str):
+            scalars = get_array(poly_data, scalars, preference='point', err=True)
+        scalars = np.asarray(scalars, dtype=float)
+        if scalars.shape[0] != poly_data.n_points:
+            raise ValueError('`scalars` must have one value per point.')
+        operator = _laplacian(poly_data, weights)[0]
+        return expm_multiply(time*operator, scalars)
+
+    def heat_kernel(poly_data, sources, time=1.0, weights='uniform'):
+        """Compute the heat kernel of this mesh from source points.
+
+        Each row is the temperature of every point after ``time``,
+        starting from a unit amount of heat at one source, that is a
+        temperature of the inverse of the source mass.  The heat
+        kernel is symmetric, so ``kernel[i, sources[j]]`` equals
+        ``kernel[j, sources[i]]``.  The rows are computed together with
+        sparse matrix products, see :func:`PolyDataFilters.diffuse`.
+        Requires ``scipy``.
+
+        Parameters
+        ----------
+        sources : int or sequence of int
+            Indices of the source points.
+
+        time : float, optional
+            Diffusion time.
+
+        weights : str, optional
+            Weights of the Laplacian, ``'uniform'`` or ``'cotangent'``.
+
+        Returns
+        -------
+        np.ndarray
+            Heat kernel of shape ``(n_sources, n_points)``.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere()
+        >>> kernel = sphere.heat_kernel([0, 1], time=4.0)
+        >>> kernel.shape == (2, sphere.n_points)
+        True
+
+        """
+        try:
+            from scipy.sparse.linalg import expm_multiply
+        except ImportError:  # pragma: no cover
+            raise ImportError('scipy must be available to use this filter.')
+
+        sources = np.asarray(sources, dtype=pyvista.ID_TYPE).ravel()
+        if sources.size and (sources.min() < 0 or sources.max() > poly_data.n_points - 1):
+            raise IndexError('Invalid indices.')
+        operator, mass = _laplacian(poly_data, weights)
+        impulses = np.zeros((poly_data.n_points, sources.size))
+        with np.errstate(divide='ignore'):
+            impulses[sources, np.arange(sources.size)] = np.where(mass[sources] > 0,
+                                                                  1/mass[sources], 0.0)
+        return expm_multiply(time*operator, impulses).T
+
     def decimate_pro(poly_data, reduction, feature_angle=45.0, split_angle=75.0, splitting=True,
                      pre_split_mesh=False, preserve_topology=False, inplace=False):
         """Reduce the number of triangles in a triangular mesh.
@@ -3973,6 +5684,102 @@ class PolyDataFilters(DataSetFilters):
         else:
             return mesh
 
+    def build_lod(poly_data, levels=(0.5, 0.75, 0.9, 0.97), method='quadric', **kwargs):
+        """Build progressively decimated levels of detail of this mesh.
+
+        Each level is decimated from the previous one rather than from
+        the full resolution mesh, and the levels are cached on the mesh
+        until its points or connectivity change, so serving the same
+        mesh at several resolutions decimates it only once.
+
+        Parameters
+        ----------
+        levels : sequence(float), optional
+            Increasing fractions of the triangles of this mesh to
+            remove at each level, between 0 and 1.
+
+        method : str, optional
+            ``'quadric'`` to decimate with :func:`PolyDataFilters.decimate`
+            or ``'pro'`` with :func:`PolyDataFilters.decimate_pro`.
+
+        **kwargs : dict, optional
+            Additional arguments of the decimation filter.
+
+        Returns
+        -------
+        list(pyvista.PolyData)
+            One mesh per level.  Each has a ``'vtkOriginalPointIds'``
+            point array with the index of a point of this mesh for each
+            of its points: the point it was kept from with ``'pro'``,
+            which does not move points, and the closest point with
+            ``'quadric'``.  Point data can be transferred by indexing
+            with it.
+
+        Examples
+        --------
+        Build the levels of a sphere and transfer its point data.
+
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere(theta_resolution=60, phi_resolution=60)
+        >>> sphere['height'] = sphere.points[:, 2]
+        >>> lods = sphere.build_lod([0.5, 0.9])
+        >>> [lod.n_cells for lod in lods]
+        [3480, 696]
+        >>> ids = lods[1]['vtkOriginalPointIds']
+        >>> lods[1]['height'] = sphere['height'][ids]
+
+        """
+        levels = [float(level) for level in levels]
+        if any(not 0 <= level < 1 for level in levels) or np.any(np.diff(levels) <= 0):
+            raise ValueError('`levels` must increase between 0 and 1.')
+        if method == 'quadric':
+            decimate = PolyDataFilters.decimate
+        elif method == 'pro':
+            decimate = PolyDataFilters.decimate_pro
+        else:
+            raise ValueError(f'Decimation method `{method}` not understood.')
+        for key in ('inplace', 'target_reduction', 'reduction'):
+            if key in kwargs:
+                raise TypeError(f'`{key}` is not a valid argument of `build_lod`.')
+
+        key = (_topology_key(poly_data) + _points_key(poly_data),
+               tuple(levels), method, tuple(sorted(kwargs.items())))
+        cache = getattr(poly_data, '_lod', None)
+        if cache is not None and cache[0] == key:
+            return list(cache[1])
+
+        lods = []
+        previous = poly_data
+        if method == 'pro':
+            # decimate_pro keeps a subset of the points with their data
+            previous = poly_data.copy(deep=False)
+            previous.point_arrays['vtkOriginalPointIds'] = np.arange(
+                poly_data.n_points, dtype=pyvista.ID_TYPE)
+        else:
+            try:
+                from scipy.spatial import cKDTree
+                closest_points = cKDTree(poly_data.points).query
+            except ImportError:  # pragma: no cover
+                locator = _vtk.vtkStaticPointLocator()
+                locator.SetDataSet(poly_data)
+                locator.BuildLocator()
+
+                def closest_points(points):
+                    return None, [locator.FindClosestPoint(point) for point in points]
+
+        removed = 0.0
+        for level in levels:
+            # fraction of the previous level removed to reach this level
+            lod = decimate(previous, 1 - (1 - level)/(1 - removed), **kwargs)
+            if method == 'quadric':
+                lod.point_arrays['vtkOriginalPointIds'] = np.asarray(
+                    closest_points(lod.points)[1], dtype=pyvista.ID_TYPE)
+            lods.append(lod)
+            previous = lod
+            removed = level
+        poly_data._lod = (key, lods)
+        return list(lods)
+
     def compute_normals(poly_data, cell_normals=True, point_normals=True,
                         split_vertices=False, flip_normals=False,
                         consistent_normals=True,
@@ -4406,12 +6213,130 @@ class PolyDataFilters(DataSetFilters):
         Length is 0.812
 
         """
-        path = poly_data.geodesic(start_vertex, end_vertex)
-        sizes = path.compute_cell_sizes(length=True, area=False, volume=False)
-        distance = np.sum(sizes['Length'])
-        del path
-        del sizes
-        return distance
+        try:
+            import scipy  # noqa: F401
+        except ImportError:  # pragma: no cover
+            path = poly_data.geodesic(start_vertex, end_vertex)
+            sizes = path.compute_cell_sizes(length=True, area=False, volume=False)
+            distance = np.sum(sizes['Length'])
+            del path
+            del sizes
+            return distance
+
+        if start_vertex < 0 or end_vertex > poly_data.n_points - 1:
+            raise IndexError('Invalid indices.')
+        if not poly_data.is_all_triangles():
+            raise NotAllTrianglesError("Input mesh for geodesic path must be all triangles.")
+        distances = PolyDataFilters.geodesic_distance_field(poly_data, start_vertex)
+        return distances[end_vertex]
+
+    def geodesic_distance_field(poly_data, sources, nearest=True):
+        """Calculate the geodesic distance from source vertices to every vertex.
+
+        Distances are measured along the edges of the mesh, like
+        :func:`PolyDataFilters.geodesic_distance`, but from all the
+        sources to all the vertices in a single run of Dijkstra's
+        algorithm.  The edge graph is cached on the mesh, so repeated
+        queries only pay for the search.  Requires ``scipy``.
+
+        Parameters
+        ----------
+        sources : int or sequence of int
+            Indices of the source vertices.
+
+        nearest : bool, optional
+            Return the distance to the nearest source.  Otherwise, the
+            distances to each source are returned.
+
+        Returns
+        -------
+        distances : np.ndarray
+            Distance of each vertex to the nearest source, or array of
+            shape ``(n_sources, n_points)`` when ``nearest`` is
+            ``False``.  Vertices that cannot be reached are ``inf``.
+
+        Examples
+        --------
+        Compute the distance to the closest of two poles of a sphere.
+
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere()
+        >>> distances = sphere.geodesic_distance_field([0, 1])
+        >>> print(f'Largest distance is {distances.max():.3f}')
+        Largest distance is 0.758
+
+        """
+        try:
+            from scipy.sparse import csgraph
+        except ImportError:  # pragma: no cover
+            raise ImportError('scipy must be available to use this filter.')
+
+        sources = np.asarray(sources, dtype=pyvista.ID_TYPE).ravel()
+        if not sources.size:
+            raise ValueError('At least one source vertex is required.')
+        if sources.min() < 0 or sources.max() > poly_data.n_points - 1:
+            raise IndexError('Invalid indices.')
+        graph = _edge_graph(poly_data)
+        if nearest:
+            return csgraph.dijkstra(graph, indices=sources, min_only=True)
+        return csgraph.dijkstra(graph, indices=sources)
+
+    def geodesic_paths(poly_data, pairs):
+        """Calculate the geodesic paths between many pairs of vertices.
+
+        Pairs sharing a start vertex share a single run of Dijkstra's
+        algorithm over the cached edge graph of the mesh.  Requires
+        ``scipy``.
+
+        Parameters
+        ----------
+        pairs : sequence
+            Start and end vertex of each path, as an array of shape
+            ``(n_pairs, 2)``.
+
+        Returns
+        -------
+        paths : list of pyvista.PolyData
+            Path of each pair, as a poly line from the end vertex to the
+            start vertex with a ``vtkOriginalPointIds`` point array, like
+            the output of :func:`PolyDataFilters.geodesic`.  The path of
+            a pair whose vertices are not connected is empty, and the
+            path from a vertex to itself is a single point without cells.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere()
+        >>> paths = sphere.geodesic_paths([(0, 100), (0, 200), (1, 100)])
+        >>> [path.n_points for path in paths]
+        [16, 4, 15]
+
+        """
+        try:
+            from scipy.sparse import csgraph
+        except ImportError:  # pragma: no cover
+            raise ImportError('scipy must be available to use this filter.')
+
+        pairs = np.asarray(pairs, dtype=pyvista.ID_TYPE).reshape(-1, 2)
+        if pairs.size and (pairs.min() < 0 or pairs.max() > poly_data.n_points - 1):
+            raise IndexError('Invalid indices.')
+        starts, rows = np.unique(pairs[:, 0], return_inverse=True)
+        if starts.size:
+            _, predecessors = csgraph.dijkstra(_edge_graph(poly_data), indices=starts,
+                                               return_predecessors=True)
+        paths = []
+        for row, (start, end) in zip(rows, pairs):
+            ids = [end]
+            while ids[-1] != start and ids[-1] >= 0:
+                ids.append(predecessors[row, ids[-1]])
+            ids = np.array(ids if ids[-1] >= 0 else [], dtype=pyvista.ID_TYPE)
+            path = pyvista.PolyData()
+            path.points = poly_data.points[ids]
+            if ids.size > 1:
+                path.lines = np.hstack(([ids.size], np.arange(ids.size)))
+            path.point_arrays['vtkOriginalPointIds'] = ids
+            paths.append(path)
+        return paths
 
     def ray_trace(poly_data, origin, end_point, first_point=False, plot=False,
                   off_screen=False):
@@ -4492,17 +6417,24 @@ class PolyDataFilters(DataSetFilters):
 
         return intersection_points, intersection_cells
 
-    def multi_ray_trace(poly_data, origins, directions, first_point=False, retry=False):
+    def multi_ray_trace(poly_data, origins, directions, first_point=False, retry=False,
+                        method=None, return_distances=False):
         """Perform multiple ray trace calculations.
 
         This requires a mesh with only triangular faces,
         an array of origin points and an equal sized array of
         direction vectors to trace along.
 
+        Rays are traced with trimesh and embree when they are installed
+        and otherwise with a built-in vectorized ray caster, which
+        traverses a bounding volume hierarchy of the triangles cached on
+        the mesh.  The tree is only rebuilt when the points or faces of
+        the mesh change, so repeated calls on the same mesh are cheap.
+
         The embree library used for vectorisation of the ray traces is known to occasionally
         return no intersections where the VTK implementation would return an intersection.
         If the result appears to be missing some intersection points, set retry=True to run a second pass over rays
-        that returned no intersections, using the VTK ray_trace implementation.
+        that returned no intersections, using the built-in ray caster.
 
 
         Parameters
@@ -4517,7 +6449,18 @@ class PolyDataFilters(DataSetFilters):
             Returns intersection of first point only.
 
         retry : bool, optional
-            Will retry rays that return no intersections using the ray_trace
+            Will retry rays that return no intersections using the
+            built-in ray caster.  Only used with ``method='trimesh'``.
+
+        method : str, optional
+            ``'trimesh'`` traces the rays with trimesh, rtree and
+            pyembree and ``'native'`` with the built-in ray caster.
+            Defaults to ``'trimesh'`` when these libraries are
+            installed and ``'native'`` otherwise.
+
+        return_distances : bool, optional
+            Also return the distance from the origin of the ray to
+            each intersection point.
 
         Returns
         -------
@@ -4533,53 +6476,70 @@ class PolyDataFilters(DataSetFilters):
             Indices of the intersection cells.  Empty array if no
             intersections.
 
+        intersection_distances : np.ndarray
+            Distance along the ray of each intersection point.  Only
+            returned when ``return_distances=True``.
+
         Examples
         --------
         Compute the intersection between rays from the origin in
         directions ``[1, 0, 0]``, ``[0, 1, 0]`` and ``[0, 0, 1]``, and
         a sphere with radius 0.5 centered at the origin
 
-        >>> import pyvista as pv # doctest: +SKIP
-        ... sphere = pv.Sphere()
-        ... points, rays, cells = sphere.multi_ray_trace([[0, 0, 0]]*3, [[1, 0, 0], [0, 1, 0], [0, 0, 1]], first_point=True)
-        ... string = ", ".join([f"({point[0]:.3f}, {point[1]:.3f}, {point[2]:.3f})" for point in points])
-        ... print(f'Rays intersected at {string}')
+        >>> import pyvista as pv
+        >>> sphere = pv.Sphere()
+        >>> points, rays, cells = sphere.multi_ray_trace([[0, 0, 0]]*3, [[1, 0, 0], [0, 1, 0], [0, 0, 1]], first_point=True, method='native')
+        >>> string = ", ".join([f"({point[0]:.3f}, {point[1]:.3f}, {point[2]:.3f})" for point in points])
+        >>> print(f'Rays intersected at {string}')
         Rays intersected at (0.499, 0.000, 0.000), (0.000, 0.497, 0.000), (0.000, 0.000, 0.500)
         """
         if not poly_data.is_all_triangles():
             raise NotAllTrianglesError
 
-        try:
-            import trimesh, rtree, pyembree
-        except (ModuleNotFoundError, ImportError):
-            raise ImportError(
-                "To use multi_ray_trace please install trimesh, rtree and pyembree with:\n"
-                "\tconda install trimesh rtree pyembree"
+        if method is None:
+            try:
+                import trimesh, rtree, pyembree
+                method = 'trimesh'
+            except (ModuleNotFoundError, ImportError):
+                method = 'native'
+
+        origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+        if method == 'native':
+            locations, index_ray, index_tri, distances = _cast_rays(poly_data, origins,
+                                                                    directions, first_point)
+        elif method == 'trimesh':
+            try:
+                import trimesh, rtree, pyembree
+            except (ModuleNotFoundError, ImportError):
+                raise ImportError(
+                    "To use multi_ray_trace please install trimesh, rtree and pyembree with:\n"
+                    "\tconda install trimesh rtree pyembree"
+                )
+
+            faces_as_array = poly_data.faces.reshape((poly_data.n_faces, 4))[:, 1:]
+            tmesh = trimesh.Trimesh(poly_data.points, faces_as_array)
+            locations, index_ray, index_tri = tmesh.ray.intersects_location(
+                origins, directions, multiple_hits=not first_point
             )
+            if retry:
+                missing = np.setdiff1d(np.arange(len(origins)), index_ray)
+                locs, rays, cells, _ = _cast_rays(poly_data, origins[missing],
+                                                  directions[missing], first_point)
+                locations = np.concatenate([np.reshape(locations, (-1, 3)), locs])
+                index_ray = np.concatenate([index_ray, missing[rays]]).astype(int)
+                index_tri = np.concatenate([index_tri, cells]).astype(int)
+                order = np.argsort(index_ray, kind='stable')
+                locations = locations[order]
+                index_ray = index_ray[order]
+                index_tri = index_tri[order]
+            distances = np.linalg.norm(np.reshape(locations, (-1, 3)) - origins[index_ray],
+                                       axis=1)
+        else:
+            raise ValueError(f'Method `{method}` not understood.')
 
-        faces_as_array = poly_data.faces.reshape((poly_data.n_faces, 4))[:, 1:]
-        tmesh = trimesh.Trimesh(poly_data.points, faces_as_array)
-        locations, index_ray, index_tri = tmesh.ray.intersects_location(
-            origins, directions, multiple_hits=not first_point
-        )
-        if retry:
-            ray_tuples = [(id_r, l, id_t) for id_r, l, id_t in zip(index_ray, locations, index_tri)]
-            for id_r in range(len(origins)):
-                if id_r not in index_ray:
-                    origin = np.array(origins[id_r])
-                    vector = np.array(directions[id_r])
-                    unit_vector = vector / np.sqrt(np.sum(np.power(vector, 2)))
-                    second_point = origin + (unit_vector * poly_data.length)
-                    locs, indexes = poly_data.ray_trace(origin, second_point, first_point=first_point)
-                    if locs.any():
-                        if first_point:
-                            locs = locs.reshape([1, 3])
-                        for loc, id_t in zip(locs, indexes):
-                            ray_tuples.append((id_r, loc, id_t))
-            sorted_results = sorted(ray_tuples, key=lambda x: x[0])
-            locations = np.array([loc for id_r, loc, id_t in sorted_results])
-            index_ray = np.array([id_r for id_r, loc, id_t in sorted_results])
-            index_tri = np.array([id_t for id_r, loc, id_t in sorted_results])
+        if return_distances:
+            return locations, index_ray, index_tri, distances
         return locations, index_ray, index_tri
 
     def plot_boundaries(poly_data, edge_color="red", **kwargs):
@@ -5406,6 +7366,123 @@ class UniformGridFilters(DataSetFilters):
         _update_alg(alg, progress_bar, 'Performing Gaussian Smoothing')
         return _get_output(alg)
 
+    def slice(dataset, normal='x', origin=None, generate_triangles=False,
+              contour=False, return_image=False, pass_arrays=None):
+        """Slice a uniform grid by a plane at the specified origin and normal.
+
+        Axis-aligned planes only cut the two voxel layers that bracket
+        the plane.  With ``return_image=True`` no cutting is performed
+        at all and the slice is returned as a 2D ``UniformGrid``.
+
+        Parameters
+        ----------
+        normal : tuple(float) or str
+            Length 3 tuple for the normal vector direction. Can also be
+            specified as a string conventional direction such as ``'x'`` for
+            ``(1,0,0)`` or ``'-x'`` for ``(-1,0,0)```, etc.
+
+        origin : tuple(float)
+            The center (x,y,z) coordinate of the plane on which the slice occurs
+
+        generate_triangles: bool, optional
+            If this is enabled (``False`` by default), the output will be
+            triangles otherwise, the output will be the intersection polygons.
+
+        contour : bool, optional
+            If True, apply a ``contour`` filter after slicing
+
+        return_image : bool, optional
+            Return the slice as a 2D ``pyvista.UniformGrid`` rather than
+            ``pyvista.PolyData``.  Requires an axis-aligned ``normal``.
+            When the plane lies on a voxel layer the point data is taken
+            from that layer without interpolation (as a view of the
+            parent arrays for ``z`` normals), otherwise it is linearly
+            interpolated between the two bracketing layers.
+
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
+        Examples
+        --------
+        Extract the center ``z`` layer of a volume as an image.
+
+        >>> from pyvista import examples
+        >>> grid = examples.load_uniform()
+        >>> image = grid.slice(normal='z', return_image=True)
+        >>> image.dimensions
+        [10, 10, 1]
+
+        """
+        dataset = _select_arrays(dataset, pass_arrays)
+        axis, flip = _axis_aligned_normal(normal)
+        if origin is None:
+            origin = dataset.center
+        if return_image:
+            if axis is None:
+                raise ValueError('``return_image`` requires an axis-aligned normal.')
+            output = _image_layer(dataset, axis, origin[axis], flip)
+        elif axis is not None and min(dataset.dimensions) > 1:
+            slab = _image_slab(dataset, axis, origin[axis], flip)
+            output = DataSetFilters.slice(slab, normal=normal, origin=origin,
+                                          generate_triangles=generate_triangles)
+        else:
+            output = DataSetFilters.slice(dataset, normal=normal, origin=origin,
+                                          generate_triangles=generate_triangles)
+        if contour:
+            return output.contour()
+        return output
+
+    def slice_orthogonal(dataset, x=None, y=None, z=None,
+                         generate_triangles=False, contour=False,
+                         return_image=False, pass_arrays=None):
+        """Create three orthogonal slices through the uniform grid.
+
+        Yields a MutliBlock dataset of the three slices.
+
+        Parameters
+        ----------
+        x : float
+            The X location of the YZ slice
+
+        y : float
+            The Y location of the XZ slice
+
+        z : float
+            The Z location of the XY slice
+
+        generate_triangles: bool, optional
+            If this is enabled (``False`` by default), the output will be
+            triangles otherwise, the output will be the intersection polygons.
+
+        contour : bool, optional
+            If True, apply a ``contour`` filter after slicing
+
+        return_image : bool, optional
+            Return each slice as a 2D ``pyvista.UniformGrid``.  See
+            :func:`UniformGridFilters.slice`.
+
+        pass_arrays : str or list(str), optional
+            Names of the point, cell and field arrays to pass to
+            the output.  Defaults to all the arrays.
+
+        """
+        if not return_image:
+            return DataSetFilters.slice_orthogonal(dataset, x=x, y=y, z=z,
+                                                   generate_triangles=generate_triangles,
+                                                   contour=contour,
+                                                   pass_arrays=pass_arrays)
+        dataset = _select_arrays(dataset, pass_arrays)
+        center = list(dataset.center)
+        for i, value in enumerate((x, y, z)):
+            if value is not None:
+                center[i] = value
+        output = pyvista.MultiBlock()
+        for i, (normal, name) in enumerate(zip('xyz', ('YZ', 'XZ', 'XY'))):
+            output[i, name] = dataset.slice(normal=normal, origin=center,
+                                            return_image=True)
+        return output
+
     def extract_subset(dataset, voi, rate=(1, 1, 1), boundary=False):
         """Select piece (e.g., volume of interest).
 
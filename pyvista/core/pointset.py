@@ -19,6 +19,8 @@ from pyvista.utilities.cells import (CellArray, numpy_to_idarr,
 from .dataset import DataSet
 from .filters import (PolyDataFilters, UnstructuredGridFilters,
                       StructuredGridFilters, _get_output)
+from ._mesh_kernels import (_homogeneous_cell_geometry, _surface_volume, _CELL_DIMENSIONS,
+                            _edge_table)
 from ..utilities.fileio import get_ext
 from .errors import DeprecationError
 
@@ -397,6 +399,12 @@ class PolyData(_vtk.vtkPolyData, PointSet, PolyDataFilters):
             Total area of the mesh.
 
         """
+        geometry = _homogeneous_cell_geometry(self, ['size'])
+        if geometry is not None:
+            celltype, values = geometry
+            if _CELL_DIMENSIONS[celltype] != 2:
+                return 0.0
+            return np.sum(values['size'])
         areas = self.compute_cell_sizes(length=False, area=True, volume=False,)["Area"]
         return np.sum(areas)
 
@@ -412,6 +420,9 @@ class PolyData(_vtk.vtkPolyData, PointSet, PolyDataFilters):
             Total volume of the mesh.
 
         """
+        volume = _surface_volume(self)
+        if volume is not None:
+            return volume
         mprop = _vtk.vtkMassProperties()
         mprop.SetInputData(self.triangulate())
         return mprop.GetVolume()
@@ -452,7 +463,16 @@ class PolyData(_vtk.vtkPolyData, PointSet, PolyDataFilters):
 
     @property
     def n_open_edges(self):
-        """Return the number of open edges on this mesh."""
+        """Return the number of open edges on this mesh.
+
+        Open edges are the boundary and non-manifold edges of the
+        polygons.  They are counted from the table of unique edges
+        cached on the mesh, unless it has triangle strips.
+
+        """
+        if not self.GetNumberOfStrips():
+            face_offsets = _edge_table(self)[1]
+            return int(np.count_nonzero(np.diff(face_offsets) != 2))
         alg = _vtk.vtkFeatureEdges()
         alg.FeatureEdgesOff()
         alg.BoundaryEdgesOn()
@@ -0,0 +1,418 @@
+"""Private numpy helpers for the cells, points and data arrays of meshes."""
+
+import zlib
+
+import numpy as np
+
+import pyvista
+from pyvista import _vtk
+from .cells import CellArray, numpy_to_idarr
+
+
+def _take_attributes(source, target, ind):
+    """Copy the tuples at ``ind`` of each array in ``source`` to ``target``."""
+    for i in range(source.GetNumberOfArrays()):
+        array = source.GetArray(i)
+        if array is None:  # skip string and other abstract arrays
+            continue
+        values = _vtk.vtk_to_numpy(array)[ind]
+        vtk_array = _vtk.numpy_to_vtk(values, deep=True,
+                                      array_type=array.GetDataType())
+        vtk_array.SetName(array.GetName())
+        target.AddArray(vtk_array)
+    _copy_active_attributes(source, target)
+
+
+def _copy_active_attributes(source, target):
+    """Activate the arrays of ``target`` that are active in ``source``."""
+    for attribute in range(_vtk.vtkDataSetAttributes.NUM_ATTRIBUTES):
+        array = source.GetAbstractAttribute(attribute)
+        if array is not None and array.GetName() is not None:
+            target.SetActiveAttribute(array.GetName(), attribute)
+
+
+def _cell_array_to_numpy(cell_array):
+    """Return the offsets and connectivity of a ``vtkCellArray``."""
+    if _vtk.VTK9:
+        offsets = _vtk.vtk_to_numpy(cell_array.GetOffsetsArray())
+        connectivity = _vtk.vtk_to_numpy(cell_array.GetConnectivityArray())
+        return offsets, connectivity
+    # legacy padded layout ``[n0, p0_0, ..., n1, p1_0, ...]``
+    cells = _vtk.vtk_to_numpy(cell_array.GetData())
+    n_cells = cell_array.GetNumberOfCells()
+    starts = np.empty(n_cells, dtype=pyvista.ID_TYPE)
+    loc = 0
+    for i in range(n_cells):  # pragma: no cover
+        starts[i] = loc
+        loc += cells[loc] + 1
+    sizes = cells[starts]
+    offsets = np.zeros(n_cells + 1, dtype=pyvista.ID_TYPE)
+    np.cumsum(sizes, out=offsets[1:])
+    mask = np.ones(cells.size, dtype=bool)
+    mask[starts] = False
+    return offsets, cells[mask]
+
+
+def _gather_cells(offsets, connectivity, cell_ids):
+    """Gather the connectivity of ``cell_ids`` from offsets and connectivity.
+
+    Returns the offsets and connectivity of the gathered cells.
+
+    """
+    starts = offsets[cell_ids]
+    sizes = offsets[cell_ids + 1] - starts
+    if sizes.size and sizes.min() == sizes.max():
+        # cells of a single size, like all hexahedra, gather as a block
+        size = sizes[0]
+        new_offsets = np.arange(cell_ids.size + 1, dtype=pyvista.ID_TYPE)*size
+        ind = (starts.reshape(-1, 1) + np.arange(size)).ravel()
+        return new_offsets, connectivity[ind]
+    new_offsets = np.zeros(cell_ids.size + 1, dtype=pyvista.ID_TYPE)
+    np.cumsum(sizes, out=new_offsets[1:])
+    ind = (np.repeat(starts - new_offsets[:-1], sizes) +
+           np.arange(new_offsets[-1]))
+    return new_offsets, connectivity[ind]
+
+
+def _numpy_to_cell_array(offsets, connectivity):
+    """Create a ``vtkCellArray`` from offsets and connectivity arrays."""
+    if _vtk.VTK9:
+        cell_array = _vtk.vtkCellArray()
+        cell_array.SetData(numpy_to_idarr(offsets, deep=True),
+                           numpy_to_idarr(connectivity, deep=True))
+        return cell_array
+    # legacy padded layout ``[n0, p0_0, ..., n1, p1_0, ...]``
+    sizes = np.diff(offsets)
+    padded = np.empty(sizes.size + connectivity.size, dtype=pyvista.ID_TYPE)
+    locs = offsets[:-1] + np.arange(sizes.size)
+    mask = np.ones(padded.size, dtype=bool)
+    mask[locs] = False
+    padded[locs] = sizes
+    padded[mask] = connectivity
+    return CellArray(padded, sizes.size, deep=True)
+
+
+def _renumber_points(connectivity, n_points):
+    """Renumber the points of a connectivity array by first appearance.
+
+    This matches the point ordering of VTK filters that extract cells,
+    like ``vtkThreshold``.  Returns the original ids of the kept points
+    and the renumbered connectivity.
+
+    """
+    # assigning in reverse leaves the first position of each point, as
+    # the last assignment to a repeated index wins
+    size = connectivity.size
+    first = np.full(n_points, size, dtype=pyvista.ID_TYPE)
+    first[connectivity[::-1]] = np.arange(size - 1, -1, -1, dtype=pyvista.ID_TYPE)
+    point_ids = np.flatnonzero(first < size)
+    point_ids = point_ids[np.argsort(first[point_ids])]
+    new_ids = np.empty(n_points, dtype=pyvista.ID_TYPE)
+    new_ids[point_ids] = np.arange(point_ids.size, dtype=pyvista.ID_TYPE)
+    return point_ids, new_ids[connectivity]
+
+
+def _group_rows(keys):
+    """Group identical rows of an ``(n, 3)`` integer array.
+
+    Rows are combined into a single 64 bit key, exactly when their
+    range allows it and by hashing otherwise, then grouped with one
+    sort.  Hash collisions are detected and resolved by sorting the
+    rows lexicographically.
+
+    Returns
+    -------
+    first : np.ndarray
+        Index of the first row of each group, in increasing order.
+
+    inverse : np.ndarray
+        Group of each row, numbered by order of first appearance.
+
+    """
+    lower = keys.min(axis=0)
+    ranges = keys.max(axis=0).astype(float) - lower + 1
+    # differences of bit patterns may wrap around, which keeps them distinct
+    keys = keys - lower
+    exact = np.prod(ranges) < 2.0**63
+    if exact:
+        combined = (keys[:, 0]*int(ranges[1]) + keys[:, 1])*int(ranges[2]) + keys[:, 2]
+    else:
+        # chain the columns through the splitmix64 finalizer, which also
+        # spreads the zero low bits of coordinates converted from float32
+        columns = keys.view(np.uint64)
+        combined = np.zeros(len(keys), dtype=np.uint64)
+        for axis in range(3):
+            combined ^= columns[:, axis]
+            combined ^= combined >> np.uint64(30)
+            combined *= np.uint64(0xBF58476D1CE4E5B9)
+            combined ^= combined >> np.uint64(27)
+            combined *= np.uint64(0x94D049BB133111EB)
+            combined ^= combined >> np.uint64(31)
+
+    def group(order, new):
+        starts = np.flatnonzero(new)
+        first = np.minimum.reduceat(order, starts)
+        inverse = np.empty(order.size, dtype=pyvista.ID_TYPE)
+        inverse[order] = np.cumsum(new) - 1
+        return first, inverse
+
+    order = np.argsort(combined)
+    ordered = combined[order]
+    new = np.ones(order.size, dtype=bool)
+    np.not_equal(ordered[1:], ordered[:-1], out=new[1:])
+    first, inverse = group(order, new)
+    if not exact and not np.array_equal(keys[first][inverse], keys):
+        order = np.lexsort(keys.T[::-1])
+        ordered = keys[order]
+        np.any(ordered[1:] != ordered[:-1], axis=1, out=new[1:])
+        first, inverse = group(order, new)
+
+    # number the groups by first appearance
+    order = np.argsort(first)
+    rank = np.empty(order.size, dtype=pyvista.ID_TYPE)
+    rank[order] = np.arange(order.size, dtype=pyvista.ID_TYPE)
+    return first[order], rank[inverse]
+
+
+def _copy_cells_data(source, target, point_ids, cell_ids):
+    """Copy the point, cell and field data of the cells and points kept."""
+    _take_attributes(source.GetPointData(), target.GetPointData(), point_ids)
+    _take_attributes(source.GetCellData(), target.GetCellData(), cell_ids)
+    target.GetFieldData().ShallowCopy(source.GetFieldData())
+    target.copy_meta_from(source)
+
+
+def _append_attributes(sources, target, segments, size, ind=None):
+    """Append the arrays shared by all ``sources`` to ``target``.
+
+    An array is appended when every source has an array of that name
+    with the same number of components, in the order of the first
+    source.  Values are cast to the common type of the sources and
+    filled in place from ``segments``, the ``(source, start, stop)``
+    ranges of tuples in output order.  ``ind`` optionally gathers the
+    appended tuples.
+
+    """
+    def numeric(array):
+        return array is not None and not isinstance(array, _vtk.vtkBitArray)
+
+    first = sources[0]
+    for i in range(first.GetNumberOfArrays()):
+        array = first.GetArray(i)
+        if not numeric(array) or array.GetName() is None:
+            continue
+        name = array.GetName()
+        arrays = [source.GetArray(name) for source in sources]
+        n_components = array.GetNumberOfComponents()
+        if not all(numeric(other) and other.GetNumberOfComponents() == n_components
+                   for other in arrays):
+            continue
+        values = [_vtk.vtk_to_numpy(other) for other in arrays]
+        appended = np.empty((size,) + values[0].shape[1:], dtype=np.result_type(*values))
+        position = 0
+        for source, start, stop in segments:
+            appended[position:position + stop - start] = values[source][start:stop]
+            position += stop - start
+        if ind is not None:
+            appended = appended[ind]
+        vtk_array = _vtk.numpy_to_vtk(appended)
+        vtk_array.SetName(name)
+        target.AddArray(vtk_array)
+    _copy_active_attributes(first, target)
+
+
+def _poly_data_cell_types(k, sizes):
+    """Return the cell types of the cells of a ``PolyData`` cell array.
+
+    ``k`` is the index of the cell array among the verts, lines, polys
+    and strips, and ``sizes`` the number of points of each cell.
+
+    """
+    if k == 0:
+        return np.where(sizes == 1, _vtk.VTK_VERTEX, _vtk.VTK_POLY_VERTEX).astype(np.uint8)
+    if k == 1:
+        return np.where(sizes == 2, _vtk.VTK_LINE, _vtk.VTK_POLY_LINE).astype(np.uint8)
+    if k == 2:
+        cell_types = np.full(sizes.size, _vtk.VTK_POLYGON, dtype=np.uint8)
+        cell_types[sizes == 3] = _vtk.VTK_TRIANGLE
+        cell_types[sizes == 4] = _vtk.VTK_QUAD
+        return cell_types
+    return np.full(sizes.size, _vtk.VTK_TRIANGLE_STRIP, dtype=np.uint8)
+
+
+def _append_datasets(datasets, merge_points=False, main_has_priority=True,
+                     unstructured=False):
+    """Append datasets in a single pass using numpy.
+
+    The output arrays are allocated once from the sizes of the inputs
+    and filled in place, rather than copying the merged data again
+    for every input.  The output is a ``PolyData`` when all the inputs
+    are ``PolyData`` and ``unstructured`` is false, and an
+    ``UnstructuredGrid`` otherwise.  Empty inputs are skipped, and
+    only the arrays shared by all the other inputs are kept (see
+    ``_append_attributes``).
+
+    With ``merge_points``, points with exactly the same coordinates
+    are merged and keep the point data of their first occurrence, or
+    of their last one when ``main_has_priority`` is false.
+
+    """
+    datasets = [ds for ds in datasets if ds.n_points or ds.n_cells]
+    as_poly_data = not unstructured and all(isinstance(ds, _vtk.vtkPolyData)
+                                            for ds in datasets)
+    if not as_poly_data:
+        datasets = [ds if isinstance(ds, (_vtk.vtkPolyData, _vtk.vtkUnstructuredGrid))
+                    else ds.cast_to_unstructured_grid() for ds in datasets]
+        if any(np.any(ds.celltypes == _vtk.VTK_POLYHEDRON) for ds in datasets
+               if isinstance(ds, _vtk.vtkUnstructuredGrid)):
+            # polyhedra store their faces outside of the cell connectivity.
+            # vtkAppendFilter keeps the point data of the last occurrence
+            alg = _vtk.vtkAppendFilter()
+            alg.SetMergePoints(merge_points)
+            for ds in (datasets[::-1] if main_has_priority else datasets):
+                alg.AddInputData(ds)
+            alg.Update()
+            return pyvista.core.filters._get_output(alg)
+    if not datasets:
+        return pyvista.PolyData() if as_poly_data else pyvista.UnstructuredGrid()
+
+    n_points = np.array([ds.n_points for ds in datasets], dtype=pyvista.ID_TYPE)
+    point_starts = np.zeros(n_points.size + 1, dtype=pyvista.ID_TYPE)
+    np.cumsum(n_points, out=point_starts[1:])
+    points = np.empty((point_starts[-1], 3),
+                      dtype=np.result_type(*[ds.points.dtype for ds in datasets]))
+    for ds, start, stop in zip(datasets, point_starts[:-1], point_starts[1:]):
+        points[start:stop] = ds.points
+    point_map = point_ids = None
+    if merge_points and points.shape[0]:
+        # adding zero turns -0.0 into 0.0 before comparing bit patterns
+        keys = np.asarray(points, dtype=float) + 0.0
+        first, point_map = _group_rows(keys.view(np.int64))
+        point_ids = first
+        if not main_has_priority:
+            # the last assignment to a repeated index wins
+            point_ids = np.empty(first.size, dtype=pyvista.ID_TYPE)
+            point_ids[point_map] = np.arange(point_map.size, dtype=pyvista.ID_TYPE)
+        points = points[first]
+
+    # the cell arrays of each input, with the input cell id of their
+    # first cell.  PolyData order their cells by cell array, so the
+    # appended PolyData takes the verts of all the inputs first
+    slots = []
+    for ds in datasets:
+        if isinstance(ds, _vtk.vtkPolyData):
+            arrays = [_cell_array_to_numpy(cell_array) for cell_array in
+                      (ds.GetVerts(), ds.GetLines(), ds.GetPolys(), ds.GetStrips())]
+        else:
+            arrays = [_cell_array_to_numpy(ds.GetCells())]
+        first_cells = np.cumsum([0] + [offsets.size - 1 for offsets, _ in arrays])
+        slots.append(list(zip(arrays, first_cells)))
+    if as_poly_data:
+        groups = [[(i, k) for i in range(len(datasets))] for k in range(4)]
+    else:
+        groups = [[(i, k) for i in range(len(datasets)) for k in range(len(slots[i]))]]
+
+    cells = []
+    cell_segments = []
+    for group in groups:
+        n_group_cells = sum(slots[i][k][0][0].size - 1 for i, k in group)
+        offsets = np.zeros(n_group_cells + 1, dtype=pyvista.ID_TYPE)
+        connectivity = np.empty(sum(slots[i][k][0][1].size for i, k in group),
+                                dtype=pyvista.ID_TYPE)
+        cell_types = None if as_poly_data else np.empty(n_group_cells, dtype=np.uint8)
+        cell_position = connectivity_position = 0
+        for i, k in group:
+            (piece_offsets, piece_connectivity), first_cell = slots[i][k]
+            size = piece_offsets.size - 1
+            cell_stop = cell_position + size
+            connectivity_stop = connectivity_position + piece_connectivity.size
+            offsets[cell_position + 1:cell_stop + 1] = piece_offsets[1:] + connectivity_position
+            np.add(piece_connectivity, point_starts[i],
+                   out=connectivity[connectivity_position:connectivity_stop])
+            if cell_types is not None:
+                if isinstance(datasets[i], _vtk.vtkPolyData):
+                    piece_types = _poly_data_cell_types(k, np.diff(piece_offsets))
+                else:
+                    piece_types = datasets[i].celltypes
+                cell_types[cell_position:cell_stop] = piece_types
+            cell_segments.append((i, first_cell, first_cell + size))
+            cell_position, connectivity_position = cell_stop, connectivity_stop
+        if point_map is not None:
+            connectivity = point_map[connectivity]
+        cells.append((offsets, connectivity, cell_types))
+    n_cells = sum(stop - start for _, start, stop in cell_segments)
+
+    if as_poly_data:
+        output = pyvista.PolyData()
+        output.points = points
+        cell_arrays = [_numpy_to_cell_array(offsets, connectivity)
+                       for offsets, connectivity, _ in cells]
+        output.SetVerts(cell_arrays[0])
+        output.SetLines(cell_arrays[1])
+        output.SetPolys(cell_arrays[2])
+        output.SetStrips(cell_arrays[3])
+    else:
+        offsets, connectivity, cell_types = cells[0]
+        output = pyvista.UnstructuredGrid()
+        output.points = points
+        vtk_cell_types = _vtk.numpy_to_vtk(cell_types, deep=True)
+        if _vtk.VTK9:
+            output.SetCells(vtk_cell_types, _numpy_to_cell_array(offsets, connectivity))
+        else:  # pragma: no cover
+            locations = offsets[:-1] + np.arange(n_cells)
+            output.SetCells(vtk_cell_types, numpy_to_idarr(locations, deep=True),
+                            _numpy_to_cell_array(offsets, connectivity))
+
+    point_segments = [(i, 0, size) for i, size in enumerate(n_points)]
+    _append_attributes([ds.GetPointData() for ds in datasets], output.GetPointData(),
+                       point_segments, int(point_starts[-1]), point_ids)
+    _append_attributes([ds.GetCellData() for ds in datasets], output.GetCellData(),
+                       cell_segments, n_cells)
+    output.GetFieldData().ShallowCopy(datasets[0].GetFieldData())
+    output.copy_meta_from(datasets[0])
+    return output
+
+
+def _topology_key(dataset):
+    """Return a key that changes whenever the connectivity of ``dataset`` does."""
+    key = (dataset.GetNumberOfPoints(), dataset.GetNumberOfCells())
+    if isinstance(dataset, _vtk.vtkPolyData):
+        cell_arrays = [dataset.GetVerts(), dataset.GetLines(),
+                       dataset.GetPolys(), dataset.GetStrips()]
+        return key + tuple(carr.GetMTime() for carr in cell_arrays)
+    if isinstance(dataset, (_vtk.vtkUnstructuredGrid, _vtk.vtkExplicitStructuredGrid)):
+        return key + (dataset.GetCells().GetMTime(), )
+    return key + tuple(dataset.GetDimensions())
+
+
+def _points_key(dataset):
+    """Return a key that changes whenever the points of ``dataset`` do.
+
+    Editing the points in place through a numpy view of them does not
+    modify their ``vtkPoints``, so the key also holds the address and
+    a checksum of the point buffer.
+
+    """
+    points = dataset.GetPoints() if isinstance(dataset, _vtk.vtkPointSet) else None
+    if points is None:
+        return (dataset.GetMTime(), )
+    array = _vtk.vtk_to_numpy(points.GetData())
+    return (points.GetMTime(), array.__array_interface__['data'][0],
+            zlib.crc32(np.ascontiguousarray(array)))
+
+
+def _dot(a, b):
+    """Dot products of two arrays of vectors of shape ``(3, n)``."""
+    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
+
+
+def _cross(a, b):
+    """Cross products of two arrays of vectors of shape ``(3, n)``."""
+    return np.array([a[1]*b[2] - a[2]*b[1],
+                     a[2]*b[0] - a[0]*b[2],
+                     a[0]*b[1] - a[1]*b[0]])
+
+
+def _norm(a):
+    """Lengths of an array of vectors of shape ``(3, n)``."""
+    return np.sqrt(_dot(a, a))
@@ -0,0 +1,355 @@
+"""Private ray casting kernels for triangle surfaces."""
+
+import numpy as np
+
+import pyvista
+from pyvista import _vtk
+from ._mesh_arrays import _cell_array_to_numpy, _cross, _dot, _points_key, _topology_key
+
+
+def _vertical_ray_triangles(surface):
+    """Prepare the triangles of ``surface`` for casting rays along ``z``.
+
+    Rays passing exactly through edges or vertices are resolved with a
+    top-left fill rule evaluated with exactly antisymmetric edge
+    functions, so every ray crosses a closed surface an even number of
+    times on either side of any shared edge.
+
+    Returns
+    -------
+    triangles : np.ndarray
+        Corners of the triangles, shape ``(n, 3, 3)``, with their
+        projection on the xy plane oriented counterclockwise.
+
+    rays : tuple
+        Per triangle data consumed by :func:`_vertical_ray_heights`.
+
+    """
+    if not surface.is_all_triangles():
+        surface = surface.triangulate()
+    _, connectivity = _cell_array_to_numpy(surface.GetPolys())
+    triangles = np.asarray(surface.points, dtype=float)[connectivity.reshape(-1, 3)]
+
+    # orient the projection of every triangle counterclockwise
+    first, second, third = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    normals = np.cross(second - first, third - first)
+    flip = normals[:, 2] < 0
+    second[flip], third[flip] = third[flip].copy(), second[flip].copy()
+    normals[flip] *= -1
+    # vertical triangles are never crossed
+    crossable = normals[:, 2] != 0
+    normals[~crossable, 2] = 1
+
+    # edge functions are computed from the lexicographically smallest
+    # end point so shared edges give exactly opposite values
+    starts = triangles[:, :, :2]
+    ends = np.roll(starts, -1, axis=1)
+    swap = (starts[..., 0] > ends[..., 0]) | ((starts[..., 0] == ends[..., 0]) &
+                                              (starts[..., 1] > ends[..., 1]))
+    origins = np.where(swap[..., np.newaxis], ends, starts)
+    directions = np.where(swap[..., np.newaxis], starts - ends, ends - starts)
+    signs = np.where(swap, -1.0, 1.0)
+    delta = ends - starts
+    inclusive = (delta[..., 1] < 0) | ((delta[..., 1] == 0) & (delta[..., 0] < 0))
+    return triangles, (first, normals, crossable, origins, directions, signs, inclusive)
+
+
+def _vertical_ray_heights(rays, triangle_ids, xy):
+    """Intersect vertical lines at ``xy`` with triangles ``triangle_ids``.
+
+    Returns a mask of the pairs that intersect and the height of each
+    intersection.
+
+    """
+    first, normals, crossable, origins, directions, signs, inclusive = rays
+    hit = crossable[triangle_ids]
+    for edge in range(3):
+        origin = origins[triangle_ids, edge]
+        direction = directions[triangle_ids, edge]
+        value = signs[triangle_ids, edge]*(direction[:, 0]*(xy[:, 1] - origin[:, 1]) -
+                                           direction[:, 1]*(xy[:, 0] - origin[:, 0]))
+        hit &= (value > 0) | ((value == 0) & inclusive[triangle_ids, edge])
+    triangle_ids = triangle_ids[hit]
+    xy = xy[hit]
+    normal = normals[triangle_ids]
+    corner = first[triangle_ids]
+    heights = corner[:, 2] - (normal[:, 0]*(xy[:, 0] - corner[:, 0]) +
+                              normal[:, 1]*(xy[:, 1] - corner[:, 1]))/normal[:, 2]
+    return hit, heights
+
+
+def _enclosed_points_mask(points, surface, tolerance=0.0, chunk_size=65536):
+    """Return which ``points`` lie inside a closed ``surface``.
+
+    Each point casts a ray along ``+z`` and is inside when the ray
+    crosses the surface an odd number of times.  Triangles are binned
+    on a regular grid over the xy plane so each point is only tested
+    against the triangles of its bin, and every test is vectorized
+    over chunks of ``chunk_size`` points.  Points within the absolute
+    distance ``tolerance`` of the surface are inside.
+
+    """
+    points = np.asarray(points, dtype=float)
+    inside = np.zeros(points.shape[0], dtype=bool)
+    triangles, rays = _vertical_ray_triangles(surface)
+    n_triangles = triangles.shape[0]
+    if not n_triangles or not points.size:
+        return inside
+    crossable = rays[2]
+
+    # bin the triangles by their xy bounds
+    lower = triangles.min(axis=1) - tolerance
+    upper = triangles.max(axis=1) + tolerance
+    grid_lower = lower[:, :2].min(axis=0)
+    extent = upper[:, :2].max(axis=0) - grid_lower
+    size = np.mean(upper[:, :2] - lower[:, :2])/2
+    size = max(size, np.sqrt(extent.prod()/(16*n_triangles)), extent.max()/4096)
+    if size <= 0:
+        size = 1.0
+    n_bins = (extent//size).astype(int) + 1
+    bin_lower = ((lower[:, :2] - grid_lower)//size).astype(int)
+    bin_upper = np.minimum(((upper[:, :2] - grid_lower)//size).astype(int), n_bins - 1)
+    widths = bin_upper - bin_lower + 1
+    counts = widths.prod(axis=1)
+    pair_triangles = np.repeat(np.arange(n_triangles), counts)
+    local = np.arange(pair_triangles.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    bin_x = bin_lower[pair_triangles, 0] + local % widths[pair_triangles, 0]
+    bin_y = bin_lower[pair_triangles, 1] + local//widths[pair_triangles, 0]
+    bins = bin_y*n_bins[0] + bin_x
+    order = np.argsort(bins, kind='stable')
+    bin_triangles = pair_triangles[order]
+    bin_offsets = np.zeros(n_bins.prod() + 1, dtype=int)
+    np.cumsum(np.bincount(bins, minlength=n_bins.prod()), out=bin_offsets[1:])
+
+    # only points below the top of the surface and within its xy
+    # bounds can be inside
+    candidates = np.all((points[:, :2] >= grid_lower) &
+                        (points[:, :2] <= grid_lower + extent), axis=1)
+    candidates &= points[:, 2] <= upper[:, 2].max()
+    candidates = np.flatnonzero(candidates)
+    # visit the points bin by bin so the triangle data stays in cache
+    candidate_bins = np.minimum(((points[candidates, :2] - grid_lower)//size).astype(int),
+                                n_bins - 1)
+    candidate_bins = candidate_bins[:, 1]*n_bins[0] + candidate_bins[:, 0]
+    order = np.argsort(candidate_bins, kind='stable')
+    candidates = candidates[order]
+    candidate_bins = candidate_bins[order]
+    near = []
+    for i in range(0, candidates.size, chunk_size):
+        point_ids = candidates[i:i + chunk_size]
+        chunk = points[point_ids]
+        point_bins = candidate_bins[i:i + chunk_size]
+        n_candidates = bin_offsets[point_bins + 1] - bin_offsets[point_bins]
+        pair_points = np.repeat(np.arange(point_ids.size), n_candidates)
+        local = np.arange(pair_points.size) - np.repeat(np.cumsum(n_candidates) - n_candidates,
+                                                        n_candidates)
+        pair_triangles = bin_triangles[bin_offsets[point_bins][pair_points] + local]
+        pair_xyz = chunk[pair_points]
+
+        if tolerance > 0:
+            close = np.all((pair_xyz >= lower[pair_triangles]) &
+                           (pair_xyz <= upper[pair_triangles]), axis=1)
+            near.append(point_ids[np.unique(pair_points[close])])
+
+        # discard triangles below the points or apart from them in xy
+        keep = crossable[pair_triangles]
+        keep &= pair_xyz[:, 2] < upper[pair_triangles, 2]
+        for axis in range(2):
+            keep &= pair_xyz[:, axis] >= lower[pair_triangles, axis]
+            keep &= pair_xyz[:, axis] <= upper[pair_triangles, axis]
+        pair_points = pair_points[keep]
+        pair_triangles = pair_triangles[keep]
+        pair_xyz = pair_xyz[keep]
+
+        hit, heights = _vertical_ray_heights(rays, pair_triangles, pair_xyz)
+        above = heights > pair_xyz[hit, 2]
+        crossings = np.bincount(pair_points[hit][above], minlength=point_ids.size)
+        inside[point_ids] = crossings % 2 == 1
+
+    if near:
+        near = np.concatenate(near)
+        distances = _vtk.vtkDoubleArray()
+        _implicit_distance(surface).FunctionValue(pyvista.convert_array(points[near]),
+                                                  distances)
+        inside[near[np.abs(pyvista.convert_array(distances)) <= tolerance]] = True
+    return inside
+
+
+def _implicit_distance(surface):
+    """Return the cached signed distance function of a surface.
+
+    ``vtkImplicitPolyDataDistance`` triangulates the surface, computes
+    its normals and builds a cell locator whenever it is created, so
+    the function is stored on ``surface`` and rebuilt only when its
+    points or cells change.  The external surface of datasets other
+    than ``PolyData`` is used.
+
+    """
+    key = _topology_key(surface) + _points_key(surface)
+    cache = getattr(surface, '_implicit_distance', None)
+    if cache is not None and cache[0] == key:
+        return cache[1]
+
+    function = _vtk.vtkImplicitPolyDataDistance()
+    if isinstance(surface, _vtk.vtkPolyData):
+        function.SetInput(surface)
+    else:
+        function.SetInput(pyvista.DataSetFilters.extract_geometry(surface))
+    surface._implicit_distance = (key, function)
+    return function
+
+
+def _ray_tree(surface, leaf_size=8):
+    """Return the cached bounding volume hierarchy of a triangle ``surface``.
+
+    Triangles are sorted along a Morton curve of their centroids and
+    grouped in leaves of ``leaf_size`` triangles.  The leaves are the
+    last level of a binary tree stored level by level, where node
+    ``i`` of a level has children ``2*i`` and ``2*i + 1`` on the next
+    one.  The tree is stored on ``surface`` and rebuilt only when its
+    points or faces change.
+
+    """
+    key = _topology_key(surface) + _points_key(surface) + (leaf_size, )
+    cache = getattr(surface, '_ray_tree', None)
+    if cache is not None and cache[0] == key:
+        return cache[1]
+
+    _, connectivity = _cell_array_to_numpy(surface.GetPolys())
+    triangles = np.asarray(surface.points, dtype=float)[connectivity.reshape(-1, 3)]
+    lower = triangles.min(axis=1)
+    upper = triangles.max(axis=1)
+
+    # sort the triangles along a 30 bit Morton curve of their centroids
+    centers = (lower + upper)/2
+    span = np.ptp(centers, axis=0)
+    span[span == 0] = 1
+    quantized = ((centers - centers.min(axis=0))/span*1023).astype(np.uint64)
+    codes = np.zeros(len(quantized), np.uint64)
+    for bit in range(10):
+        for axis in range(3):
+            codes |= (((quantized[:, axis] >> np.uint64(bit)) & np.uint64(1)) <<
+                      np.uint64(3*bit + axis))
+    cell_ids = np.argsort(codes, kind='stable')
+    triangles = triangles[cell_ids]
+
+    # widen the boxes slightly so rays grazing flat boxes are kept
+    pad = 1e-9*max(surface.length, 1.0)
+    starts = np.arange(0, len(cell_ids), leaf_size)
+    levels = [(np.minimum.reduceat(lower[cell_ids], starts) - pad,
+               np.maximum.reduceat(upper[cell_ids], starts) + pad)]
+    while len(levels[0][0]) > 1:
+        starts = np.arange(0, len(levels[0][0]), 2)
+        levels.insert(0, (np.minimum.reduceat(levels[0][0], starts),
+                          np.maximum.reduceat(levels[0][1], starts)))
+
+    # store coordinates by axis so gathers and arithmetic stay contiguous
+    levels = [(np.ascontiguousarray(lower.T), np.ascontiguousarray(upper.T))
+              for lower, upper in levels]
+    corners = triangles[:, 0]
+    edges = [np.ascontiguousarray((triangles[:, i] - corners).T) for i in (1, 2)]
+    tree = (levels, np.ascontiguousarray(corners.T), edges[0], edges[1], cell_ids, leaf_size)
+    surface._ray_tree = (key, tree)
+    return tree
+
+
+def _cast_rays(surface, origins, directions, first_point=False, chunk_size=4096):
+    """Intersect rays with the triangles of ``surface``.
+
+    Rays descend the tree of :func:`_ray_tree` one level at a time as
+    arrays of ``(ray, node)`` pairs and the pairs reaching the leaves
+    are tested with the Moller-Trumbore algorithm, all vectorized over
+    chunks of ``chunk_size`` rays.
+
+    Returns
+    -------
+    points : np.ndarray
+        Intersection points sorted by ray and then by distance.
+
+    ray_ids : np.ndarray
+        Index of the ray of each intersection.
+
+    cell_ids : np.ndarray
+        Index of the cell of each intersection.
+
+    distances : np.ndarray
+        Distance from the origin of the ray to each intersection.
+
+    """
+    origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+    directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+    if origins.shape != directions.shape:
+        raise ValueError('`origins` and `directions` must have the same shape.')
+    lengths = np.linalg.norm(directions, axis=1)
+    traced = np.flatnonzero(lengths > 0)
+    if not traced.size or not surface.n_faces:
+        return np.empty((0, 3)), np.empty(0, int), np.empty(0, int), np.empty(0)
+    directions = directions/np.where(lengths > 0, lengths, 1)[:, np.newaxis]
+    # axis parallel rays get a huge but finite inverse to avoid 0*inf
+    inverse = np.ascontiguousarray(1/np.where(directions == 0, 1e-300, directions).T)
+    origins_t = np.ascontiguousarray(origins.T)
+    directions_t = np.ascontiguousarray(directions.T)
+
+    levels, corners, edges1, edges2, cell_ids, leaf_size = _ray_tree(surface)
+    n_triangles = len(cell_ids)
+
+    hits = []
+    for i in range(0, traced.size, chunk_size):
+        pair_rays = traced[i:i + chunk_size]
+        pair_nodes = np.zeros(pair_rays.size, int)
+        for depth, (lower, upper) in enumerate(levels):
+            if depth:
+                pair_rays = np.repeat(pair_rays, 2)
+                pair_nodes = (2*pair_nodes[:, np.newaxis] + [0, 1]).ravel()
+                keep = pair_nodes < lower.shape[1]
+                pair_rays = pair_rays[keep]
+                pair_nodes = pair_nodes[keep]
+            near = np.zeros(pair_rays.size)
+            far = np.full(pair_rays.size, np.inf)
+            for axis in range(3):
+                origin = origins_t[axis][pair_rays]
+                inv = inverse[axis][pair_rays]
+                first = (lower[axis][pair_nodes] - origin)*inv
+                second = (upper[axis][pair_nodes] - origin)*inv
+                np.maximum(near, np.minimum(first, second), out=near)
+                np.minimum(far, np.maximum(first, second), out=far)
+            keep = near <= far
+            pair_rays = pair_rays[keep]
+            pair_nodes = pair_nodes[keep]
+
+        pair_triangles = (leaf_size*pair_nodes[:, np.newaxis] + np.arange(leaf_size)).ravel()
+        pair_rays = np.repeat(pair_rays, leaf_size)
+        keep = pair_triangles < n_triangles
+        pair_rays = pair_rays[keep]
+        pair_triangles = pair_triangles[keep]
+
+        direction = directions_t[:, pair_rays]
+        edge1 = edges1[:, pair_triangles]
+        edge2 = edges2[:, pair_triangles]
+        offset = origins_t[:, pair_rays] - corners[:, pair_triangles]
+        normal = _cross(direction, edge2)
+        cross = _cross(offset, edge1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inv_det = 1/_dot(edge1, normal)
+            u = _dot(offset, normal)*inv_det
+            v = _dot(direction, cross)*inv_det
+            t = _dot(edge2, cross)*inv_det
+            hit = np.isfinite(inv_det) & (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0)
+        pair_rays = pair_rays[hit]
+        pair_triangles = pair_triangles[hit]
+        t = t[hit]
+
+        order = np.lexsort((pair_triangles, t, pair_rays))
+        pair_rays = pair_rays[order]
+        pair_triangles = pair_triangles[order]
+        t = t[order]
+        if first_point:
+            first = np.flatnonzero(np.diff(pair_rays, prepend=-1))
+            pair_rays = pair_rays[first]
+            pair_triangles = pair_triangles[first]
+            t = t[first]
+        hits.append((pair_rays, pair_triangles, t))
+
+    ray_ids, triangle_ids, distances = (np.concatenate(arrays) for arrays in zip(*hits))
+    points = origins[ray_ids] + distances[:, np.newaxis]*directions[ray_ids]
+    return points, ray_ids, cell_ids[triangle_ids], distances
@@ -1,15 +1,31 @@
 """Module containing geometry helper functions."""
 
 import ctypes
+import itertools
 
 import numpy as np
 
 import pyvista
+from pyvista import _vtk
+from ._mesh_arrays import _renumber_points
+from ._raycast import _vertical_ray_heights, _vertical_ray_triangles
 
 
-def voxelize(mesh, density=None, check_surface=True):
+def voxelize(mesh, density=None, check_surface=True, output='unstructured'):
     """Voxelize mesh to UnstructuredGrid.
 
+    The voxels lie on a lattice starting at the lower bounds of the
+    mesh with a spacing of ``density``.  A voxel is kept when any of
+    its corners is inside or on the surface of the mesh, or when it
+    contains a point of the surface of the mesh.
+
+    The lattice points inside the surface are found one lattice column
+    at a time by intersecting the column with the triangles of the
+    surface and filling between pairs of crossings, so the memory used
+    is a single byte per lattice point.  Only the voxels that are kept
+    are converted to hexahedra, and only when ``output`` is
+    ``'unstructured'``.
+
     Parameters
     ----------
     density : float or list
@@ -23,10 +39,21 @@ def voxelize(mesh, density=None, check_surface=True):
         manifold. If the surface is not closed and manifold, a runtime
         error is raised.
 
+    output : str, optional
+        Type of the output.
+
+        * ``'unstructured'``: an ``UnstructuredGrid`` of hexahedra.
+        * ``'uniform'``: a ``UniformGrid`` spanning the lattice with
+          the ``uint8`` cell array ``'Occupancy'``.
+        * ``'mask'``: the ``uint8`` occupancy array of shape ``(nx,
+          ny, nz)`` indexed along x, y and z.
+        * ``'sparse'``: the ``(n, 3)`` array of the ``(i, j, k)``
+          indices of the voxels kept.
+
     Returns
     -------
-    vox : pyvista.core.pointset.UnstructuredGrid
-        voxelized unstructured grid for original mesh
+    vox : pyvista.UnstructuredGrid, pyvista.UniformGrid or np.ndarray
+        Voxelized mesh in the format given by ``output``.
 
     Examples
     --------
@@ -44,7 +71,16 @@ def voxelize(mesh, density=None, check_surface=True):
     >>> mesh = pv.PolyData(ex.load_uniform().points)
     >>> vox = pv.voxelize(mesh, density=[0.5, 0.9, 1.4])
 
+    This example creates an occupancy grid of a sphere.
+
+    >>> import pyvista as pv
+    >>> grid = pv.voxelize(pv.Sphere(), density=0.05, output='uniform')
+    >>> grid['Occupancy'].dtype
+    dtype('uint8')
+
     """
+    if output not in ['unstructured', 'uniform', 'mask', 'sparse']:
+        raise ValueError(f'Output `{output}` not understood.')
     if not pyvista.is_pyvista_dataset(mesh):
         mesh = pyvista.wrap(mesh)
     if density is None:
@@ -53,26 +89,125 @@ def voxelize(mesh, density=None, check_surface=True):
         density_x, density_y, density_z = [density] * 3
     if isinstance(density, (list, set, tuple)):
         density_x, density_y, density_z = density
-        
+
     x_min, x_max, y_min, y_max, z_min, z_max = mesh.bounds
     x = np.arange(x_min, x_max, density_x)
     y = np.arange(y_min, y_max, density_y)
     z = np.arange(z_min, z_max, density_z)
-    x, y, z = np.meshgrid(x, y, z)
 
-    # Create unstructured grid from the structured grid
-    grid = pyvista.StructuredGrid(x, y, z)
-    ugrid = pyvista.UnstructuredGrid(grid)
+    surface = mesh.extract_surface()
+    if check_surface and surface.n_open_edges > 0:
+        raise RuntimeError("Surface is not closed. Please read the warning in the "
+                           "documentation for this function and either pass "
+                           "`check_surface=False` or repair the surface.")
+    inside = _lattice_inside_surface(surface, x, y, z)
+
+    # keep the voxels with any corner inside
+    occupancy = np.zeros([max(n - 1, 0) for n in inside.shape], dtype=np.uint8)
+    for i, j, k in itertools.product([0, 1], repeat=3):
+        occupancy |= inside[i:inside.shape[0] - 1 + i,
+                            j:inside.shape[1] - 1 + j,
+                            k:inside.shape[2] - 1 + k]
+
+    if output == 'mask':
+        return occupancy
+    if output == 'sparse':
+        return np.argwhere(occupancy)
+    if output == 'uniform':
+        grid = pyvista.UniformGrid(inside.shape, (density_x, density_y, density_z),
+                                   (x_min, y_min, z_min))
+        grid.cell_arrays['Occupancy'] = occupancy.ravel(order='F')
+        return grid
+
+    # convert the voxels kept to hexahedra of the lattice points
+    n_x, n_y, n_z = inside.shape
+    i, j, k = np.unravel_index(np.flatnonzero(occupancy), occupancy.shape)
+    corners = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+                        [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]])
+    corners = corners @ [n_y*n_z, n_z, 1]
+    lattice_ids = ((i*n_y + j)*n_z + k)[:, np.newaxis] + corners
+    point_ids, connectivity = _renumber_points(lattice_ids.ravel(), inside.size)
+    i, j, k = np.unravel_index(point_ids, inside.shape)
+    points = np.column_stack((x[i], y[j], z[k]))
+    cells = np.empty((lattice_ids.shape[0], 9), dtype=pyvista.ID_TYPE)
+    cells[:, 0] = 8
+    cells[:, 1:] = connectivity.reshape(-1, 8)
+    celltypes = np.full(cells.shape[0], _vtk.VTK_HEXAHEDRON, dtype=np.uint8)
+    return pyvista.UnstructuredGrid(cells.ravel(), celltypes, points)
+
+
+def _lattice_inside_surface(surface, x, y, z, chunk_size=1048576):
+    """Return which points of a rectilinear lattice are inside ``surface``.
+
+    Each column of the lattice along z is intersected with the
+    triangles whose bounds contain it.  Points are inside when an odd
+    number of crossings lies above them, or when a crossing lies
+    exactly on them.
+
+    Returns
+    -------
+    inside : np.ndarray
+        ``uint8`` array of shape ``(x.size, y.size, z.size)``.
 
-    # get part of the mesh within the mesh's bounding surface.
-    selection = ugrid.select_enclosed_points(mesh.extract_surface(),
-                                             tolerance=0.0,
-                                             check_surface=check_surface)
-    mask = selection.point_arrays['SelectedPoints'].view(np.bool_)
+    """
+    inside = np.zeros((x.size, y.size, z.size), dtype=np.uint8)
+    if not inside.size:
+        return inside
+    triangles, rays = _vertical_ray_triangles(surface)
+    lower = triangles.min(axis=1)
+    upper = triangles.max(axis=1)
+    i_start = np.searchsorted(x, lower[:, 0], 'left')
+    i_stop = np.searchsorted(x, upper[:, 0], 'right')
+    j_start = np.searchsorted(y, lower[:, 1], 'left')
+    j_stop = np.searchsorted(y, upper[:, 1], 'right')
+    widths = np.maximum(i_stop - i_start, 0)
+    counts = widths*np.maximum(j_stop - j_start, 0)
+
+    columns = []
+    heights = []
+    # split the triangles so each chunk tests about ``chunk_size`` columns
+    bounds = np.searchsorted(np.cumsum(counts), np.arange(0, counts.sum(), chunk_size),
+                             'right')
+    bounds = np.unique(np.append(bounds, counts.size))
+    start = 0
+    for stop in bounds:
+        chunk_counts = counts[start:stop]
+        triangle_ids = np.repeat(np.arange(start, stop), chunk_counts)
+        local = np.arange(triangle_ids.size) - np.repeat(np.cumsum(chunk_counts) - chunk_counts,
+                                                         chunk_counts)
+        i = i_start[triangle_ids] + local % widths[triangle_ids]
+        j = j_start[triangle_ids] + local//widths[triangle_ids]
+        hit, chunk_heights = _vertical_ray_heights(rays, triangle_ids,
+                                                   np.column_stack((x[i], y[j])))
+        columns.append(i[hit]*y.size + j[hit])
+        heights.append(chunk_heights)
+        start = stop
+    columns = np.concatenate(columns)
+    heights = np.concatenate(heights)
+
+    # toggle the points below each crossing and accumulate from the top
+    below = np.searchsorted(z, heights, 'left')
+    flat = inside.reshape(-1, z.size)
+    toggle = below > 0
+    np.bitwise_xor.at(flat, (columns[toggle], below[toggle] - 1), 1)
+    flat[:, ::-1] = np.bitwise_xor.accumulate(flat[:, ::-1], axis=1)
+
+    # points on the surface are inside
+    on_surface = below < z.size
+    on_surface[on_surface] = z[below[on_surface]] == heights[on_surface]
+    flat[columns[on_surface], below[on_surface]] = 1
+
+    # as well as the points of the surface lying on the lattice
+    points = surface.points
+    index = np.column_stack([np.searchsorted(values, points[:, axis])
+                             for axis, values in enumerate((x, y, z))])
+    valid = np.all(index < inside.shape, axis=1)
+    index = index[valid]
+    on_lattice = np.column_stack((x[index[:, 0]], y[index[:, 1]], z[index[:, 2]]))
+    index = index[np.all(on_lattice == points[valid], axis=1)]
+    inside[index[:, 0], index[:, 1], index[:, 2]] = 1
+    return inside
 
-    # extract cells from point indices
-    vox = ugrid.extract_points(mask)
-    return vox
 
 def create_grid(dataset, dimensions=(101, 101, 101)):
     """Create a uniform grid surrounding the given dataset.
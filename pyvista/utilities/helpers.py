@@ -16,6 +16,7 @@ from pyvista import _vtk
 import pyvista
 from .fileio import from_meshio
 from . import transformations
+from ._mesh_arrays import _append_datasets
 
 
 class FieldAssociation(enum.Enum):
@@ -718,6 +719,113 @@ def fit_plane_to_points(points, return_meta=False):
     return plane
 
 
+def merge(datasets, merge_points=True, main_has_priority=True):
+    """Merge several datasets into one in a single pass.
+
+    The points, cells and arrays of all the datasets are copied once
+    into preallocated arrays, rather than copying all the previously
+    merged data at every step as ``mesh_a + mesh_b + ...`` does.
+
+    Parameters
+    ----------
+    datasets : sequence of pyvista.DataSet
+        Datasets to merge.  Empty datasets are ignored.
+
+    merge_points : bool, optional
+        Merge points with exactly the same coordinates.
+
+    main_has_priority : bool, optional
+        When this parameter is true and ``merge_points`` is true,
+        merged points keep the point data of the first dataset they
+        belong to.  Otherwise they keep the point data of the last
+        one.
+
+    Returns
+    -------
+    merged : pyvista.PolyData or pyvista.UnstructuredGrid
+        Merged dataset.  ``PolyData`` is returned when all the datasets
+        are ``PolyData`` and ``UnstructuredGrid`` otherwise.
+
+    Notes
+    -----
+    Only the arrays found in all the non-empty datasets with the same
+    name and number of components are kept, cast to their common
+    type.  The field data and the active arrays are taken from the
+    first non-empty dataset.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> spheres = [pyvista.Sphere(center=(x, 0, 0)) for x in range(3)]
+    >>> merged = pyvista.merge(spheres)
+    >>> merged.n_points, merged.n_cells
+    (2526, 5040)
+
+    """
+    datasets = list(datasets)
+    for dataset in datasets:
+        if not isinstance(dataset, _vtk.vtkDataSet):
+            raise TypeError(f'Expected a sequence of pyvista.DataSet, not {type(dataset)}.')
+    datasets = [wrap(dataset) for dataset in datasets]
+    return _append_datasets(datasets, merge_points=merge_points,
+                            main_has_priority=main_has_priority)
+
+
+def transform_meshes(meshes, transformations, transform_all_input_vectors=False,
+                     inplace=False):
+    """Transform each mesh of a sequence by its own 4x4 transformation.
+
+    Parameters
+    ----------
+    meshes : sequence of pyvista.DataSet
+        Meshes to transform.
+
+    transformations : sequence or np.ndarray
+        One transformation per mesh, either as an array of shape
+        ``(n_meshes, 4, 4)`` or as a sequence of 4x4 arrays,
+        ``vtk.vtkMatrix4x4`` or ``vtk.vtkTransform``.
+
+    transform_all_input_vectors : bool, optional
+        When ``True``, all input vectors are transformed. Otherwise,
+        only the points, normals and active vectors are transformed.
+
+    inplace : bool, optional
+        Transform the meshes in-place.
+
+    Returns
+    -------
+    transformed : list
+        Transformed meshes, the input meshes themselves when
+        ``inplace`` is ``True``.
+
+    Examples
+    --------
+    Translate three spheres along the x axis.
+
+    >>> import numpy as np
+    >>> import pyvista
+    >>> spheres = [pyvista.Sphere() for _ in range(3)]
+    >>> matrices = np.tile(np.eye(4), (3, 1, 1))
+    >>> matrices[:, 0, 3] = [0, 1, 2]
+    >>> spheres = pyvista.transform_meshes(spheres, matrices)
+    >>> [round(sphere.center[0], 6) for sphere in spheres]
+    [0.0, 1.0, 2.0]
+
+    """
+    meshes = list(meshes)
+    if isinstance(transformations, np.ndarray):
+        if transformations.ndim != 3 or transformations.shape[1:] != (4, 4):
+            raise ValueError('Transformation array must be of shape (n_meshes, 4, 4).')
+    transformations = list(transformations)
+    if len(transformations) != len(meshes):
+        raise ValueError(f'Number of transformations ({len(transformations)}) '
+                         f'must match the number of meshes ({len(meshes)}).')
+    return [mesh.transform(transformation,
+                           transform_all_input_vectors=transform_all_input_vectors,
+                           inplace=inplace)
+            for mesh, transformation in zip(meshes, transformations)]
+
+
 def raise_not_matching(scalars, mesh):
     """Raise exception about inconsistencies."""
     if isinstance(mesh, _vtk.vtkTable):
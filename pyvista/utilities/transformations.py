@@ -20,6 +20,10 @@ def reflection(normal, point=None):
 def apply_transformation_to_points(transformation, points, inplace=False):
     """Apply a given transformation matrix (3x3 or 4x4) to a set of points.
 
+    The points are transformed by chunks, so that no full size
+    temporary array is allocated, and keep their floating point type.
+    ``transformation`` is left unchanged.
+
     Parameters
     ----------
     transformation : np.ndarray
@@ -34,7 +38,8 @@ def apply_transformation_to_points(transformation, points, inplace=False):
     Returns
     -------
     new_points : np.ndarray
-        Transformed points.
+        Transformed points, of the same type as ``points`` when it is
+        a floating point array and double precision otherwise.
 
     Examples
     --------
@@ -51,32 +56,47 @@ def apply_transformation_to_points(transformation, points, inplace=False):
     >>> pyvista.transformations.apply_transformation_to_points(tf, points, inplace=True)
     >>> assert np.all(np.isclose(points, scale_factor * points_orig))
     """
-    transformation_shape = transformation.shape
-    if transformation_shape not in ((3, 3), (4, 4)):
+    transformation = np.asarray(transformation)
+    if transformation.shape not in ((3, 3), (4, 4)):
         raise ValueError('`transformation` must be of shape (3, 3) or (4, 4).')
 
-    if points.shape[1] != 3:
+    if points.ndim != 2 or points.shape[1] != 3:
         raise ValueError('`points` must be of shape (N, 3).')
 
-    if transformation_shape[0] == 4:
-        # Divide by scale factor when homogeneous
-        transformation /= transformation[3, 3]
+    translation = None
+    if transformation.shape[0] == 4:
+        # Divide by scale factor when homogeneous, without modifying
+        # the caller's matrix
+        transformation = transformation / transformation[3, 3]
+        translation = transformation[:3, 3]
+
+    if inplace:
+        _transform_array(transformation[:3, :3], points, points, translation)
+        return
 
-        # Add the homogeneous coordinate
-        # `points_2` is a copy of the data, not a view
-        points_2 = np.empty((len(points), 4))
-        points_2[:, :-1] = points
-        points_2[:, -1] = 1
-    else:
-        points_2 = points
+    dtype = points.dtype if np.issubdtype(points.dtype, np.floating) else np.float64
+    new_points = np.empty(points.shape, dtype=dtype)
+    _transform_array(transformation[:3, :3], points, new_points, translation)
+    return new_points
 
-    # Paged matrix multiplication. For arrays with ndim > 2, matmul assumes
-    # that the matrices to be multiplied lie in the last two dimensions.
-    points_2 = (transformation[np.newaxis, :, :] @ points_2.T)[0, :3, :].T
 
-    # If inplace, set the points
-    if inplace:
-        points[:] = points_2
-    else:
-        # otherwise return the new points
-        return points_2
+def _transform_array(matrix, array, out, translation=None, normalize=False,
+                     chunk_size=8192):
+    """Compute ``array @ matrix.T + translation`` into ``out`` by chunks.
+
+    Each chunk is computed in double precision and then cast to the
+    type of ``out``, so only a chunk sized temporary is allocated and
+    ``out`` may be ``array`` itself.  ``normalize`` scales the
+    resulting rows to unit length, like VTK does for normals.
+
+    """
+    matrix = np.asarray(matrix, dtype=float).T
+    for start in range(0, len(array), chunk_size):
+        chunk = array[start:start + chunk_size] @ matrix
+        if translation is not None:
+            chunk += translation
+        if normalize:
+            norm = np.sqrt(np.einsum('ij,ij->i', chunk, chunk))
+            norm[norm == 0] = 1
+            chunk /= norm[:, np.newaxis]
+        out[start:start + chunk_size] = chunk
@@ -409,3 +409,15 @@ def test_multi_block_data_range():
     mi, ma = slices.get_data_range(volume.active_scalars_name)
     assert mi is not None
     assert ma is not None
+
+
+def test_combine_filter_merge_points():
+    sphere = pyvista.Sphere()
+    multi = pyvista.MultiBlock([sphere, pyvista.MultiBlock([sphere.copy(), None])])
+    geom = multi.combine()
+    assert isinstance(geom, pyvista.UnstructuredGrid)
+    assert geom.n_points == 2*sphere.n_points
+    assert geom.n_cells == 2*sphere.n_cells
+    geom = multi.combine(merge_points=True)
+    assert geom.n_points == sphere.n_points
+    assert np.allclose(geom.points, sphere.points)
@@ -5,6 +5,7 @@ import itertools
 
 import numpy as np
 import pytest
+import vtk
 from vtk import VTK_QUADRATIC_HEXAHEDRON
 
 from pyvista._vtk import VTK9
@@ -169,6 +170,52 @@ def test_implicit_distance():
     assert "implicit_distance" in dataset.point_arrays
 
 
+def test_distance_to():
+    sphere = pyvista.Sphere(radius=0.5)
+    larger = pyvista.Sphere(radius=0.55)
+    distances, summary = sphere.distance_to(larger, signed=True)
+    expected = sphere.compute_implicit_distance(larger)['implicit_distance']
+    assert np.allclose(distances, expected)
+    assert np.all(distances < 0)
+    assert summary['hausdorff'] == pytest.approx(np.abs(expected).max())
+    assert summary['mean'] == pytest.approx(np.abs(expected).mean())
+    assert summary['rms'] == pytest.approx(np.sqrt(np.mean(expected**2)))
+
+    # the locator is reused until the target changes
+    function = larger._implicit_distance[1]
+    distances, _ = sphere.distance_to(larger)
+    assert np.allclose(distances, np.abs(expected))
+    assert larger._implicit_distance[1] is function
+    larger.points *= 2
+    larger.GetPoints().Modified()
+    sphere.distance_to(larger)
+    assert larger._implicit_distance[1] is not function
+
+    # in place edits through a view of the points are also followed
+    view = larger.points
+    view *= 0.5
+    expected = sphere.compute_implicit_distance(larger.copy())['implicit_distance']
+    assert np.allclose(sphere.compute_implicit_distance(larger)['implicit_distance'],
+                       expected)
+    assert np.allclose(sphere.distance_to(larger, signed=True)[0], expected)
+
+    # the symmetric distance also covers the points of the target
+    cube = pyvista.Cube()
+    _, one_way = sphere.distance_to(cube)
+    _, both_ways = sphere.distance_to(cube, both_ways=True)
+    assert both_ways['hausdorff'] > one_way['hausdorff']
+    assert both_ways['hausdorff'] == pytest.approx(np.sqrt(3)/2 - 0.5, rel=1e-2)
+
+    distances, summary = sphere.distance_to(larger, n_samples=20, seed=0)
+    assert np.count_nonzero(np.isfinite(distances)) == 20
+    assert summary['hausdorff'] == np.nanmax(distances)
+
+    with pytest.raises(ValueError):
+        sphere.distance_to(larger, n_samples=0)
+    with pytest.raises(ValueError):
+        sphere.distance_to(pyvista.PolyData())
+
+
 def test_slice_filter():
     """This tests the slice filter on all datatypes available filters"""
     for i, dataset in enumerate(DATASETS):
@@ -183,6 +230,44 @@ def test_slice_filter():
     assert result.n_points < 1
 
 
+@pytest.mark.parametrize('normal', ['x', 'y', '-z'])
+@pytest.mark.parametrize('location', [3.0, 4.5])
+def test_slice_uniform_return_image(uniform, normal, location):
+    axis = 'xyz'.index(normal[-1])
+    origin = list(uniform.center)
+    origin[axis] = location
+    image = uniform.slice(normal=normal, origin=origin, return_image=True)
+    assert isinstance(image, pyvista.UniformGrid)
+    assert image.dimensions[axis] == 1
+    assert image.bounds[axis*2] == location
+
+    # values match the interpolated values of the general cutter
+    expected = pyvista.core.filters.DataSetFilters.slice(uniform, normal=normal,
+                                                         origin=origin)
+    sampled = expected.sample(image)
+    assert np.allclose(sampled['Spatial Point Data'],
+                       expected['Spatial Point Data'])
+    assert np.allclose(np.sort(image.cell_arrays['Spatial Cell Data']),
+                       np.sort(expected.cell_arrays['Spatial Cell Data']))
+
+    # axis-aligned slices returning PolyData match the general cutter
+    slc = uniform.slice(normal=normal, origin=origin)
+    assert slc.n_cells == expected.n_cells
+    assert np.allclose(slc.bounds, expected.bounds)
+    assert np.allclose(np.sort(slc.cell_arrays['Spatial Cell Data']),
+                       np.sort(expected.cell_arrays['Spatial Cell Data']))
+
+
+def test_slice_uniform_return_image_view(uniform):
+    image = uniform.slice(normal='z', origin=(0, 0, 3), return_image=True)
+    assert np.shares_memory(image['Spatial Point Data'],
+                            uniform['Spatial Point Data'])
+    with pytest.raises(ValueError):
+        uniform.slice(normal=(1, 1, 0), return_image=True)
+    with pytest.raises(ValueError):
+        uniform.slice(normal='z', origin=(0, 0, 100), return_image=True)
+
+
 @skip_py2_nobind
 def test_slice_filter_composite():
     # Now test composite data structures
@@ -202,6 +287,15 @@ def test_slice_orthogonal_filter():
             assert isinstance(slc, pyvista.PolyData)
 
 
+def test_slice_orthogonal_return_image(uniform):
+    slices = uniform.slice_orthogonal(x=2.5, return_image=True)
+    assert slices.keys() == ['YZ', 'XZ', 'XY']
+    for axis, slc in enumerate(slices):
+        assert isinstance(slc, pyvista.UniformGrid)
+        assert slc.dimensions[axis] == 1
+    assert slices['YZ'].bounds[0] == 2.5
+
+
 @skip_py2_nobind
 def test_slice_orthogonal_filter_composite():
     # Now test composite data structures
@@ -225,6 +319,27 @@ def test_slice_along_axis():
         dataset.slice_along_axis(axis='u')
 
 
+@pytest.mark.parametrize('dataset', DATASETS)
+@pytest.mark.parametrize('generate_triangles', [False, True])
+def test_slice_along_axis_matches_slice(dataset, generate_triangles):
+    n, ax = 4, 2
+    bounds = dataset.bounds
+    tol = (bounds[ax*2 + 1] - bounds[ax*2])*0.01
+    rng = np.linspace(bounds[ax*2] + tol, bounds[ax*2 + 1] - tol, n)
+    slices = dataset.slice_along_axis(n=n, axis='z',
+                                      generate_triangles=generate_triangles)
+    for value, slc in zip(rng, slices):
+        origin = list(dataset.center)
+        origin[ax] = value
+        expected = dataset.slice(normal='z', origin=origin,
+                                 generate_triangles=generate_triangles)
+        assert slc.n_cells == expected.n_cells
+        assert slc.array_names == expected.array_names
+        if expected.n_points:
+            assert np.allclose(slc.bounds, expected.bounds)
+            assert np.isclose(slc.area, expected.area)
+
+
 @skip_py2_nobind
 def test_slice_along_axis_composite():
     # Now test composite data structures
@@ -232,6 +347,59 @@ def test_slice_along_axis_composite():
     assert output.n_blocks == COMPOSITE.n_blocks
 
 
+@pytest.mark.parametrize('method, kwargs', [
+    ('clip', {}),
+    ('clip_box', {}),
+    ('clip_scalar', {'scalars': 'first', 'value': 0.5}),
+    ('slice', {}),
+    ('slice_along_line', {'line': pyvista.Spline([(0, 0, 0), (4, 5, 6), (9, 9, 9)], 10)}),
+    ('threshold', {'value': 0.5, 'scalars': 'first', 'preference': 'point'}),
+    ('threshold_percent', {'percent': 0.5, 'scalars': 'first', 'preference': 'point'}),
+    ('contour', {'isosurfaces': 3, 'scalars': 'first'}),
+    ('extract_geometry', {}),
+    ('extract_surface', {}),
+    ('extract_cells', {'ind': [0, 1, 2]}),
+    ('extract_points', {'ind': [0, 1, 2]}),
+    ('cell_centers', {}),
+    ('triangulate', {}),
+    ('shrink', {'shrink_factor': 0.5}),
+])
+def test_pass_arrays(method, kwargs):
+    grid = pyvista.UniformGrid((10, 10, 10)).cast_to_unstructured_grid()
+    grid.point_arrays['first'] = np.linspace(0, 1, grid.n_points)
+    grid.point_arrays['second'] = np.arange(grid.n_points)
+    grid.cell_arrays['third'] = np.arange(grid.n_cells)
+    grid.field_arrays['fourth'] = [1.0]
+
+    full = getattr(grid, method)(**kwargs)
+    names = set(grid.array_names)
+    kept = getattr(grid, method)(pass_arrays=['second', 'third'], **kwargs)
+    assert set(grid.array_names) == names
+    assert kept.n_points == full.n_points
+    assert kept.n_cells == full.n_cells
+    assert 'first' not in kept.point_arrays or 'scalars' in kwargs
+    assert 'fourth' not in kept.field_arrays
+    for name in ['second', 'third']:
+        if name in full.array_names:
+            assert np.array_equal(kept[name], full[name])
+
+
+def test_pass_arrays_slices():
+    grid = pyvista.UniformGrid((10, 10, 10))
+    grid.point_arrays['first'] = np.arange(grid.n_points)
+    grid.point_arrays['second'] = np.arange(grid.n_points)
+    for slices in [grid.slice_orthogonal(pass_arrays='first'),
+                   grid.slice_along_axis(pass_arrays='first'),
+                   grid.cast_to_unstructured_grid().slice_along_axis(pass_arrays='first')]:
+        for block in slices:
+            assert block.n_points
+            assert block.array_names == ['first']
+    assert grid.slice(return_image=True, pass_arrays='first').array_names == ['first']
+
+    with pytest.raises(KeyError):
+        grid.clip(pass_arrays='not an array')
+
+
 def test_threshold():
     for i, dataset in enumerate(DATASETS[0:3]):
         thresh = dataset.threshold()
@@ -264,6 +432,75 @@ def test_threshold():
         DATASETS[0].threshold([10, 500], scalars='Spatial Point Data',
                               all_scalars=True)
 
+@pytest.mark.parametrize('preference', ['point', 'cell'])
+@pytest.mark.parametrize('all_scalars', [False, True])
+@pytest.mark.parametrize('continuous', [False, True])
+def test_threshold_ranges(hexbeam, preference, all_scalars, continuous):
+    if preference == 'point':
+        hexbeam.point_arrays['data'] = hexbeam.points[:, 2]
+    else:
+        hexbeam.cell_arrays['data'] = hexbeam.cell_centers().points[:, 2]
+    ranges = [(0.5, 2.5), (2.0, 4.0), (100, 200)]
+    blocks = hexbeam.threshold_ranges(ranges, scalars='data', preference=preference,
+                                      all_scalars=all_scalars, continuous=continuous)
+    assert isinstance(blocks, pyvista.MultiBlock)
+    assert blocks.n_blocks == len(ranges)
+    field = 0 if preference == 'point' else 1
+    for rng, block in zip(ranges, blocks):
+        alg = vtk.vtkThreshold()
+        alg.SetInputData(hexbeam)
+        alg.SetInputArrayToProcess(0, 0, 0, field, 'data')
+        alg.SetAllScalars(all_scalars)
+        alg.SetUseContinuousCellRange(continuous)
+        alg.ThresholdBetween(*rng)
+        alg.Update()
+        expected = pyvista.wrap(alg.GetOutput())
+        assert isinstance(block, pyvista.UnstructuredGrid)
+        assert block.n_cells == expected.n_cells
+        assert np.array_equal(block.points, expected.points)
+        assert np.array_equal(block.cells, expected.cells)
+        assert np.array_equal(block['data'], expected['data'])
+
+    labels = hexbeam.threshold_ranges(ranges, scalars='data', preference=preference,
+                                      all_scalars=all_scalars, continuous=continuous,
+                                      labels=True)
+    assert labels.shape == (hexbeam.n_cells,)
+    assert np.sum(labels == 0) == blocks[0].n_cells
+    assert np.sum(labels == 2) == 0
+
+
+@pytest.mark.parametrize('grid', [examples.load_uniform(), examples.load_rectilinear(),
+                                  examples.load_structured()])
+def test_threshold_ranges_structured(grid):
+    grid.cell_arrays['data'] = np.arange(grid.n_cells, dtype=float)
+    grid.point_arrays['other'] = np.arange(grid.n_points)
+    ranges = [(0, grid.n_cells/3), (grid.n_cells/2, grid.n_cells)]
+    blocks = grid.threshold_ranges(ranges, scalars='data')
+    for rng, block in zip(ranges, blocks):
+        expected = grid.threshold(rng, scalars='data')
+        assert np.array_equal(block.celltypes, expected.celltypes)
+        assert np.array_equal(block.cells, expected.cells)
+        assert np.allclose(block.points, expected.points)
+        assert np.array_equal(block['other'], expected['other'])
+
+
+def test_threshold_ranges_components(hexbeam):
+    hexbeam.cell_arrays['vectors'] = np.random.random((hexbeam.n_cells, 3))
+    vectors = hexbeam.cell_arrays['vectors']
+    inside = (vectors >= 0.2) & (vectors <= 0.8)
+    for mode, expected in [('selected', inside[:, 1]),
+                           ('all', inside.all(axis=1)),
+                           ('any', inside.any(axis=1))]:
+        blocks = hexbeam.threshold_ranges([(0.2, 0.8)], scalars='vectors',
+                                          component_mode=mode, component=1)
+        assert blocks[0].n_cells == expected.sum()
+
+    with pytest.raises(ValueError):
+        hexbeam.threshold_ranges([(0.2, 0.8)], component_mode='invalid')
+    with pytest.raises(ValueError):
+        hexbeam.threshold_ranges([0.2, 0.8])
+
+
 def test_threshold_percent():
     percents = [25, 50, [18.0, 85.0], [19.0, 80.0], 0.70]
     inverts = [False, True, False, True, False]
@@ -358,6 +595,24 @@ def test_contour(uniform, method):
     assert iso is not None
 
 
+@pytest.mark.parametrize('dataset', [examples.load_uniform(),
+                                     examples.load_rectilinear(),
+                                     examples.load_uniform().cast_to_structured_grid(),
+                                     examples.load_hexbeam()])
+def test_contour_auto(dataset):
+    dataset = dataset.copy()
+    dataset['data'] = dataset.points[:, 0]*dataset.points[:, 1]
+    # offset the isovalues so they do not coincide with point values
+    isosurfaces = np.percentile(dataset['data'], [30, 60]) + 1E-3
+    kwargs = dict(isosurfaces=isosurfaces, scalars='data', compute_normals=True)
+    iso = dataset.contour(method='auto', **kwargs)
+    ref = dataset.contour(method='contour', **kwargs)
+    assert iso.n_points == ref.n_points
+    assert iso.n_cells == ref.n_cells
+    assert 'Normals' in iso.point_arrays
+    assert np.allclose(np.unique(iso['data']), np.unique(ref['data']))
+
+
 def test_contour_errors(uniform):
     with pytest.raises(TypeError):
         uniform.contour(scalars='Spatial Cell Data')
@@ -462,6 +717,41 @@ def test_compute_cell_sizes():
     assert np.allclose(grid.volume, volume)
 
 
+def _homogeneous_meshes():
+    rng = np.random.default_rng(0)
+    hexbeam = examples.load_hexbeam()
+    hexbeam.points = hexbeam.points + rng.normal(scale=0.05, size=hexbeam.points.shape)
+    plane = pyvista.Plane(i_resolution=4, j_resolution=3)
+    plane.points = plane.points + rng.normal(scale=0.05, size=plane.points.shape)
+    return [pyvista.Sphere(), plane, plane.extract_all_edges(), hexbeam,
+            hexbeam.triangulate()]
+
+
+@pytest.mark.parametrize('mesh', _homogeneous_meshes())
+def test_cell_sizes_centers_homogeneous(mesh):
+    alg = vtk.vtkCellSizeFilter()
+    alg.SetInputData(mesh)
+    alg.SetComputeVertexCount(False)
+    alg.Update()
+    expected = pyvista.wrap(alg.GetOutput())
+    sizes = mesh.compute_cell_sizes()
+    assert sorted(sizes.array_names) == sorted(expected.array_names)
+    for name in ['Length', 'Area', 'Volume']:
+        assert np.allclose(sizes[name], expected[name])
+
+    alg = vtk.vtkCellCenters()
+    alg.SetInputData(mesh)
+    alg.SetVertexCells(True)
+    alg.Update()
+    expected = pyvista.wrap(alg.GetOutput())
+    centers = mesh.cell_centers()
+    assert np.allclose(centers.points, expected.points)
+    assert centers.n_cells == expected.n_cells
+    assert centers.point_arrays.keys() == expected.point_arrays.keys()
+    assert centers.cell_arrays.keys() == expected.cell_arrays.keys()
+    assert mesh.cell_centers(vertex=False).n_cells == 0
+
+
 @skip_py2_nobind
 def test_compute_cell_sizes_composite():
     # Now test composite data structures
@@ -541,6 +831,74 @@ def test_split_and_connectivity():
         assert np.allclose(body.volume, volumes[i], rtol=0.1)
 
 
+def test_split_bodies_label():
+    grid = pyvista.UniformGrid((10, 10, 10))
+    mask = np.random.RandomState(0).random_sample(grid.n_cells) < 0.2
+    fragments = grid.extract_cells(np.flatnonzero(mask))
+    bodies = fragments.split_bodies(label=True)
+    region_ids, region_sizes = fragments.connected_regions()
+    assert bodies.n_blocks == region_sizes.size
+    for i, body in enumerate(bodies):
+        assert body.n_cells == region_sizes[i]
+        assert np.all(body.cell_arrays['RegionId'] == i)
+        assert np.all(body.point_arrays['RegionId'] == i)
+        cell_ids = body.cell_arrays['vtkOriginalCellIds']
+        assert np.array_equal(cell_ids, fragments['vtkOriginalCellIds'][region_ids == i])
+    assert 'RegionId' not in fragments.split_bodies()[0].array_names
+
+
+def test_connected_regions():
+    grid = pyvista.UniformGrid((12, 12, 12))
+    mask = np.random.RandomState(1).random_sample(grid.n_cells) < 0.3
+    fragments = grid.extract_cells(np.flatnonzero(mask))
+    region_ids, region_sizes = fragments.connected_regions()
+    expected = fragments.connectivity().cell_arrays['RegionId']
+    assert np.array_equal(region_ids, expected)
+    assert np.array_equal(region_sizes, np.bincount(expected))
+
+    mesh = pyvista.Sphere() + pyvista.Sphere(center=(2, 0, 0))
+    mesh.verts = np.array([1, 0])
+    region_ids, region_sizes = mesh.connected_regions()
+    # the vertex cell comes first and belongs to the first sphere
+    assert region_ids[0] == 0
+    assert region_sizes.tolist() == [1681, 1680]
+
+    region_ids, region_sizes = pyvista.PolyData().connected_regions()
+    assert region_ids.size == region_sizes.size == 0
+
+
+@pytest.mark.parametrize('as_poly_data', [True, False])
+def test_split_by_label(as_poly_data):
+    mesh = pyvista.Plane(i_resolution=4, j_resolution=4)
+    mesh.point_arrays['point_values'] = np.arange(mesh.n_points)
+    mesh.cell_arrays['cell_values'] = np.arange(mesh.n_cells)
+    if not as_poly_data:
+        mesh = mesh.cast_to_unstructured_grid()
+    labels = np.arange(mesh.n_cells) % 3 - 1
+    mesh.cell_arrays['labels'] = labels
+
+    pieces = mesh.split_by_label('labels', n_labels=3)
+    assert pieces.n_blocks == 3
+    assert pieces[2].n_cells == 0
+    for i in range(2):
+        piece = pieces[i]
+        assert isinstance(piece, pyvista.PolyData) == as_poly_data
+        cell_ids = np.flatnonzero(labels == i)
+        assert np.array_equal(piece.cell_arrays['cell_values'], cell_ids)
+        # the points of each cell are kept with their data
+        expected = mesh.extract_cells(cell_ids)
+        assert piece.n_points == expected.n_points
+        assert np.allclose(np.sort(piece.points, axis=0), np.sort(expected.points, axis=0))
+        assert np.allclose(mesh.points[piece.point_arrays['point_values']], piece.points)
+
+    assert [piece.n_cells for piece in mesh.split_by_label(labels)] == [5, 5]
+
+    with pytest.raises(ValueError):
+        mesh.split_by_label(labels[1:])
+    with pytest.raises(TypeError):
+        mesh.split_by_label(labels.astype(float))
+
+
 def test_warp_by_scalar():
     data = examples.load_uniform()
     warped = data.warp_by_scalar()
@@ -626,6 +984,70 @@ def test_point_data_to_cell_data_composite():
     assert output.n_blocks == COMPOSITE.n_blocks
 
 
+@pytest.mark.parametrize('dataset', DATASETS)
+def test_average_arrays(dataset):
+    pytest.importorskip('scipy')
+    dataset = dataset.copy()
+    dataset.clear_arrays()
+    dataset.cell_arrays['scalars'] = np.random.random(dataset.n_cells)
+    dataset.cell_arrays['vectors'] = np.random.random((dataset.n_cells, 3)).astype(np.float32)
+    dataset.cell_arrays['ids'] = np.arange(dataset.n_cells) - 10
+    dataset.point_arrays['scalars'] = np.random.random(dataset.n_points)
+    dataset.point_arrays['ids'] = np.arange(dataset.n_points, dtype=np.int32)
+
+    for preference, vtk_output in [('cell', dataset.ctp()), ('point', dataset.ptc())]:
+        converted = dataset.average_arrays(preference=preference)
+        assert len(converted) == (3 if preference == 'cell' else 2)
+        for name, array in converted.items():
+            assert array.dtype == vtk_output[name].dtype
+            assert np.allclose(array, vtk_output[name], atol=1e-6)
+
+    converted = dataset.average_arrays('scalars')
+    assert list(converted) == ['scalars']
+
+    operator = dataset.averaging_operator()
+    assert operator.shape == (dataset.n_points, dataset.n_cells)
+    # the operator is cached until the connectivity changes
+    assert dataset.averaging_operator() is operator
+    assert dataset.averaging_operator('point').shape == (dataset.n_cells, dataset.n_points)
+    with pytest.raises(ValueError):
+        dataset.averaging_operator('invalid')
+
+    dataset.cell_arrays['strings'] = np.array(['a']*dataset.n_cells)
+    assert 'strings' not in dataset.average_arrays()
+    with pytest.raises(TypeError):
+        dataset.average_arrays('strings')
+
+
+def test_average_arrays_connectivity_change():
+    pytest.importorskip('scipy')
+    mesh = pyvista.Plane(i_resolution=2, j_resolution=1)
+    operator = mesh.averaging_operator()
+    mesh.faces = np.array([4, 0, 1, 4, 3])
+    new_operator = mesh.averaging_operator()
+    assert new_operator is not operator
+    assert new_operator.shape == (mesh.n_points, 1)
+
+
+@pytest.mark.parametrize('inplace_filter', ['cell_data_to_point_data',
+                                            'point_data_to_cell_data'])
+def test_cell_point_data_inplace(inplace_filter):
+    pytest.importorskip('scipy')
+    dataset = examples.load_uniform()
+    expected = getattr(dataset, inplace_filter)()
+    output = getattr(dataset, inplace_filter)(inplace=True)
+    assert output is dataset
+    assert sorted(dataset.array_names) == sorted(expected.array_names)
+    assert dataset.active_scalars_name == expected.active_scalars_name
+    for name in expected.array_names:
+        assert np.allclose(dataset[name], expected[name])
+
+    composite = COMPOSITE.copy()
+    getattr(composite, inplace_filter)(inplace=True)
+    for block, expected_block in zip(composite, getattr(COMPOSITE, inplace_filter)()):
+        assert sorted(block.array_names) == sorted(expected_block.array_names)
+
+
 def test_triangulate():
     data = examples.load_uniform()
     tri = data.triangulate()
@@ -725,6 +1147,40 @@ def test_streamlines(uniform_vec):
         uniform_vec.streamlines('vectors', step_unit='not valid')
 
 
+@pytest.mark.parametrize('interpolator_type', ['point', 'cell'])
+def test_streamlines_from_source(uniform_vec, interpolator_type):
+    grid = uniform_vec.cast_to_unstructured_grid()
+    seeds = pyvista.Line((-0.5, -0.5, 0.1), (0.5, 0.5, 0.1), resolution=9)
+    mtime = grid.GetMTime()
+    stream = grid.streamlines_from_source(seeds, 'vectors',
+                                          interpolator_type=interpolator_type)
+    assert all([stream.n_points, stream.n_cells])
+    assert grid.GetMTime() == mtime
+    assert set(np.unique(stream['SeedIds'])) <= set(range(seeds.n_points))
+    assert 'ReasonForTermination' in stream.cell_arrays
+
+    # arrays of points are seeds as well and give the same lines
+    again = grid.streamlines_from_source(seeds.points, 'vectors',
+                                         interpolator_type=interpolator_type)
+    assert np.allclose(again.points, stream.points)
+
+    with pytest.raises(KeyError):
+        grid.streamlines_from_source(seeds, 'not an array')
+
+
+def test_streamline_batches(uniform_vec):
+    seeds = pyvista.Line((-0.5, -0.5, 0.1), (0.5, 0.5, 0.1), resolution=9)
+    stream = uniform_vec.streamlines_from_source(seeds, 'vectors')
+    batches = list(uniform_vec.streamline_batches(seeds, 4, 'vectors'))
+    assert len(batches) == 3
+    seed_ids = np.concatenate([batch['SeedIds'] for batch in batches])
+    assert np.array_equal(np.sort(seed_ids), np.sort(stream['SeedIds']))
+    assert sum(batch.n_points for batch in batches) == stream.n_points
+
+    with pytest.raises(ValueError):
+        next(uniform_vec.streamline_batches(seeds, 0, 'vectors'))
+
+
 def test_sample_over_line():
     """Test that we get a sampled line."""
     name = 'values'
@@ -746,6 +1202,52 @@ def test_sample_over_line():
     assert isinstance(sampled_from_sphere, pyvista.PolyData)
 
 
+def test_sample_over_lines():
+    name = 'values'
+    uniform = examples.load_uniform()
+    uniform[name] = uniform.points[:, 2]
+
+    segments = np.random.uniform(0, 9, (20, 2, 3))
+    sampled = uniform.sample_over_lines(segments, resolution=4)
+    assert isinstance(sampled, pyvista.PolyData)
+    assert sampled.n_cells == 20
+    assert sampled.n_points == 20*5
+    for i, (pointa, pointb) in enumerate(segments):
+        expected = uniform.sample_over_line(pointa, pointb, 4)
+        line = sampled['LineIndex'] == i
+        assert np.allclose(sampled.points[line], expected.points)
+        assert np.allclose(sampled[name][line], expected[name])
+        assert np.allclose(sampled['Distance'][line], expected['Distance'], atol=1e-5)
+
+    # default resolution matches sample_over_line
+    sampled = uniform.sample_over_lines(segments[:2])
+    assert sampled.n_points == 2*(uniform.n_cells + 1)
+
+    # polylines of different lengths are sampled at their points
+    arc = pyvista.CircularArc([0, 0, 9], [9, 0, 0], [0, 0, 0], resolution=10)
+    polyline = np.array([[1, 1, 1], [2, 2, 2], [3, 1, 1]])
+    sampled = uniform.sample_over_lines([arc.points, polyline])
+    assert np.allclose(sampled.points, np.vstack((arc.points, polyline)))
+    assert np.array_equal(sampled['LineIndex'], [0]*11 + [1]*3)
+    expected = uniform.sample_over_circular_arc([0, 0, 9], [9, 0, 0], [0, 0, 0], 10)
+    assert np.allclose(sampled[name][:11], expected[name])
+
+    # the default resolution does not depend on the type of container
+    as_list = uniform.sample_over_lines([list(segment) for segment in segments[:2]])
+    assert np.allclose(as_list.points, uniform.sample_over_lines(segments[:2]).points)
+    sampled = uniform.sample_over_lines(np.array([polyline, polyline + 1]))
+    assert sampled.n_points == 6
+
+    sampled = uniform.sample_over_lines([polyline], resolution=2)
+    assert sampled.n_points == 5
+    assert np.isclose(sampled['Distance'][-1], 2*np.sqrt(3))
+
+    with pytest.raises(ValueError):
+        uniform.sample_over_lines(segments, resolution=0)
+    with pytest.raises(ValueError):
+        uniform.sample_over_lines([[0, 0, 0]])
+
+
 def test_plot_over_line(tmpdir):
     """this requires matplotlib"""
     pytest.importorskip('matplotlib')
@@ -979,6 +1481,106 @@ def test_interpolate():
     assert interp.n_arrays
 
 
+@pytest.mark.parametrize('preference', ['point', 'cell'])
+@pytest.mark.parametrize('dataset', [examples.load_uniform(),
+                                     examples.load_hexbeam()])
+def test_build_sampling_operator_probe(dataset, preference):
+    pytest.importorskip('scipy')
+    dataset = dataset.copy()
+    dataset.clear_arrays()
+    dataset.point_arrays['point_values'] = np.random.random((dataset.n_points, 3))
+    dataset.cell_arrays['cell_values'] = np.random.random((dataset.n_cells, 3))
+    name = f'{preference}_values'
+    bounds = np.array(dataset.bounds).reshape(3, 2)
+    shift = 0.1*(bounds[:, 1] - bounds[:, 0])
+    points = np.random.uniform(bounds[:, 0] - shift, bounds[:, 1] + shift,
+                               (500, 3))
+
+    operator = dataset.build_sampling_operator(points, preference=preference)
+    assert operator.shape[0] == 500
+    sampled = operator @ dataset.get_array(name, preference=preference)
+
+    probed = dataset.probe(pyvista.PolyData(points))
+    # points near the boundary depend on the tolerance
+    inside = np.all((points > bounds[:, 0] + 1e-3) &
+                    (points < bounds[:, 1] - 1e-3), axis=1)
+    outside = np.any((points < bounds[:, 0] - 1e-3) |
+                     (points > bounds[:, 1] + 1e-3), axis=1)
+    assert np.all(operator.getnnz(axis=1)[inside] > 0)
+    assert np.all(operator.getnnz(axis=1)[outside] == 0)
+    assert np.allclose(sampled[inside], probed[name][inside])
+
+    operator = pyvista.PolyData(points).build_sampling_operator(dataset)
+    assert operator.shape == (dataset.n_points, 500)
+
+    with pytest.raises(ValueError):
+        dataset.build_sampling_operator(points, preference='invalid')
+
+
+@pytest.mark.parametrize('n_sides', [6, 100])
+def test_build_sampling_operator_polygon(n_sides):
+    pytest.importorskip('scipy')
+    # large polygons are located one point at a time
+    angles = np.linspace(0, 2*np.pi, n_sides, endpoint=False)
+    vertices = np.column_stack((np.cos(angles), np.sin(angles), np.zeros(n_sides)))
+    polygon = pyvista.PolyData(vertices, np.hstack((n_sides, np.arange(n_sides))))
+    polygon.point_arrays['values'] = np.random.random(polygon.n_points)
+    points = np.random.uniform(-0.7, 0.7, (100, 3))
+    points[:, 2] = 0
+    operator = polygon.build_sampling_operator(points)
+    probed = polygon.probe(pyvista.PolyData(points))
+    found = probed['vtkValidPointMask'].astype(bool)
+    assert np.array_equal(operator.getnnz(axis=1) > 0, found)
+    assert np.allclose(operator[found] @ polygon['values'], probed['values'][found])
+
+
+@pytest.mark.parametrize('dataset', [pyvista.Line(resolution=7),
+                                     pyvista.Plane(i_resolution=4, j_resolution=3).triangulate(),
+                                     pyvista.UniformGrid((4, 3, 5)).triangulate(),
+                                     pyvista.UniformGrid((6, 1, 4))])
+def test_build_sampling_operator_cell_types(dataset):
+    pytest.importorskip('scipy')
+    # weights of lines, triangles, tetrahedra and pixels are computed in
+    # closed form, and reproduce linear fields whichever cell is found
+    gradient = np.array([1.0, -2.0, 3.0])
+    bounds = np.array(dataset.bounds).reshape(3, 2)
+    points = np.random.uniform(bounds[:, 0], bounds[:, 1], (500, 3))
+    operator = dataset.build_sampling_operator(points)
+    probed = dataset.probe(pyvista.PolyData(points))
+    found = probed['vtkValidPointMask'].astype(bool)
+    assert found.sum() > 100
+    assert np.array_equal(operator.getnnz(axis=1) > 0, found)
+    assert np.allclose(operator.sum(axis=1).A1[found], 1.0)
+    assert np.allclose(operator[found] @ (dataset.points @ gradient),
+                       points[found] @ gradient)
+
+
+@pytest.mark.parametrize('n_points', [None, 5])
+def test_build_sampling_operator_interpolate(n_points):
+    pytest.importorskip('scipy')
+    pdata = pyvista.PolyData(np.random.random((100, 3)))
+    pdata['scalars'] = np.random.random(100)
+    grid = pyvista.UniformGrid((10, 10, 10), (0.15, 0.15, 0.15), (-0.2, -0.2, -0.2))
+    operator = pdata.build_sampling_operator(grid, method='interpolate',
+                                             radius=0.1, n_points=n_points)
+    assert operator.shape == (grid.n_points, pdata.n_points)
+    interp = grid.interpolate(pdata, radius=0.1, n_points=n_points)
+    assert np.allclose(operator @ pdata['scalars'], interp['scalars'])
+
+    operator = pdata.build_sampling_operator(grid, method='interpolate',
+                                             radius=0.01,
+                                             strategy='closest_point')
+    interp = grid.interpolate(pdata, radius=0.01, strategy='closest_point')
+    assert np.allclose(operator @ pdata['scalars'], interp['scalars'])
+
+    with pytest.raises(ValueError):
+        pdata.build_sampling_operator(grid, method='interpolate', strategy='mask_points')
+    with pytest.raises(ValueError):
+        pdata.build_sampling_operator(grid, method='interpolate', preference='cell')
+    with pytest.raises(ValueError):
+        pdata.build_sampling_operator(grid, method='invalid')
+
+
 def test_select_enclosed_points(uniform, hexbeam):
     surf = pyvista.Sphere(center=uniform.center, radius=uniform.length/2.)
     result = uniform.select_enclosed_points(surf)
@@ -1001,6 +1603,41 @@ def test_select_enclosed_points(uniform, hexbeam):
         result = mesh.select_enclosed_points(hexbeam, check_surface=True)
 
 
+@pytest.mark.parametrize('surface', [pyvista.Sphere(), pyvista.Cube().clean(),
+                                     pyvista.Cylinder(resolution=12).triangulate().clean()])
+def test_select_enclosed_points_parity(surface):
+    bounds = np.array(surface.bounds).reshape(3, 2)
+    points = np.random.uniform(bounds[:, 0] - 0.2, bounds[:, 1] + 0.2, (2000, 3))
+    # rays through the vertices and edges of the surface
+    lattice = np.meshgrid(*[np.linspace(low - 0.25, high + 0.25, 11)
+                            for low, high in bounds], indexing='ij')
+    points = np.vstack((points, np.stack(lattice, axis=-1).reshape(-1, 3)))
+    mesh = pyvista.PolyData(points)
+
+    expected = mesh.select_enclosed_points(surface, tolerance=0.0)
+    result = mesh.select_enclosed_points(surface, tolerance=0.0, method='parity')
+    assert result['SelectedPoints'].dtype == np.uint8
+    assert np.array_equal(result['SelectedPoints'], expected['SelectedPoints'])
+
+    result = mesh.select_enclosed_points(surface, tolerance=0.0, method='parity',
+                                         inside_out=True)
+    assert np.array_equal(result['SelectedPoints'], 1 - expected['SelectedPoints'])
+
+
+def test_select_enclosed_points_parity_tolerance():
+    surface = pyvista.Cube().clean()
+    mesh = pyvista.PolyData([[0.0, 0.0, 0.501], [0.501, 0.0, 0.0],
+                             [0.0, 0.0, 0.6], [0.0, 0.0, 0.0]])
+    result = mesh.select_enclosed_points(surface, tolerance=0.0, method='parity')
+    assert np.array_equal(result['SelectedPoints'], [0, 0, 0, 1])
+    result = mesh.select_enclosed_points(surface, tolerance=0.01/surface.length,
+                                         method='parity')
+    assert np.array_equal(result['SelectedPoints'], [1, 1, 0, 1])
+
+    with pytest.raises(ValueError):
+        mesh.select_enclosed_points(surface, method='invalid')
+
+
 def test_decimate_boundary():
     mesh = examples.load_uniform()
     boundary = mesh.decimate_boundary()
@@ -1069,6 +1706,47 @@ def test_merge_general():
     assert isinstance(merged, pyvista.PolyData)
 
 
+@pytest.mark.parametrize('tolerance', [0.0, 1e-6])
+def test_merge_points(tolerance):
+    sphere = pyvista.Sphere()
+    sphere.point_arrays['ids'] = np.arange(sphere.n_points)
+    sphere.cell_arrays['cell_ids'] = np.arange(sphere.n_cells)
+    faces = sphere.faces.reshape(-1, 4)[:, 1:]
+    soup = pyvista.PolyData(sphere.points[faces.ravel()],
+                            np.insert(np.arange(faces.size).reshape(-1, 3), 0, 3, axis=1))
+    soup.point_arrays['ids'] = sphere.point_arrays['ids'][faces.ravel()]
+    soup.cell_arrays['cell_ids'] = sphere.cell_arrays['cell_ids']
+
+    merged, point_map = soup.merge_points(tolerance)
+    assert isinstance(merged, pyvista.PolyData)
+    assert merged.n_points == sphere.n_points
+    assert merged.n_cells == sphere.n_cells
+    assert np.array_equal(merged.points[point_map], soup.points)
+    assert np.array_equal(merged.point_arrays['ids'][point_map], soup.point_arrays['ids'])
+    assert np.array_equal(merged.cell_arrays['cell_ids'], soup.cell_arrays['cell_ids'])
+    # points keep the order of their first appearance
+    assert np.array_equal(point_map[np.sort(np.unique(point_map, return_index=True)[1])],
+                          np.arange(merged.n_points))
+    assert np.allclose(merged.area, sphere.area)
+
+    grid, grid_map = soup.cast_to_unstructured_grid().merge_points(tolerance)
+    assert isinstance(grid, pyvista.UnstructuredGrid)
+    assert np.array_equal(grid_map, point_map)
+    assert np.array_equal(grid.cells, merged.cast_to_unstructured_grid().cells)
+
+
+def test_merge_points_tolerance():
+    points = np.array([[0, 0, 0], [0.05, 0, 0], [1, 0, 0], [1, 1e-9, 0], [-0.0, 0, 0]])
+    merged, point_map = pyvista.PolyData(points).merge_points()
+    assert np.array_equal(point_map, [0, 1, 2, 3, 0])
+    merged, point_map = pyvista.PolyData(points).merge_points(0.1)
+    assert np.array_equal(point_map, [0, 0, 1, 1, 0])
+    assert np.array_equal(merged.points, points[[0, 2]])
+    assert merged.n_cells == points.shape[0]
+    with pytest.raises(ValueError):
+        pyvista.PolyData(points).merge_points(-1)
+
+
 def test_compute_cell_quality():
     mesh = pyvista.ParametricEllipsoid().decimate(0.8)
     qual = mesh.compute_cell_quality()
@@ -1077,6 +1755,34 @@ def test_compute_cell_quality():
         qual = mesh.compute_cell_quality(quality_measure='foo')
 
 
+@pytest.mark.parametrize('triangulate', [False, True])
+def test_compute_cell_quality_measures(triangulate):
+    mesh = examples.load_hexbeam()
+    rng = np.random.default_rng(0)
+    mesh.points = mesh.points + rng.normal(scale=0.05, size=mesh.points.shape)
+    if triangulate:
+        mesh = mesh.triangulate()
+    measures = ['volume', 'jacobian', 'scaled_jacobian', 'aspect_ratio', 'radius_ratio',
+                'aspect_frobenius', 'min_angle', 'max_edge_ratio', 'diagonal', 'stretch',
+                'skew', 'taper', 'shape']
+    qual, summary = mesh.compute_cell_quality(measures=measures, return_summary=True)
+    assert 'CellQuality' not in qual.array_names
+    for measure in measures:
+        alg = vtk.vtkCellQuality()
+        alg.SetInputData(mesh)
+        getattr(alg, 'SetQualityMeasureTo' + measure.title().replace('_', ''))()
+        alg.Update()
+        expected = pyvista.wrap(alg.GetOutput())['CellQuality']
+        assert np.allclose(qual[measure], expected)
+        defined = expected[expected != -1]
+        if defined.size:
+            assert np.isclose(summary[measure]['min'], defined.min())
+            assert np.isclose(summary[measure]['mean'], defined.mean())
+
+    single = mesh.compute_cell_quality('volume')
+    assert np.allclose(single['CellQuality'], qual['volume'])
+
+
 def test_compute_derivatives():
     mesh = examples.load_random_hills()
     vector = np.zeros((mesh.n_points, 3))
@@ -1330,6 +2036,48 @@ def test_transform_mesh_and_vectors(dataset, num_cell_arrays, num_point_arrays):
         assert dataset.point_arrays['P%d' % i][:, 1] == pytest.approx( transformed.point_arrays['P%d' % i][:, 2])
 
 
+@pytest.mark.parametrize('transform_all_input_vectors', [False, True])
+@pytest.mark.parametrize('inplace', [False, True])
+@pytest.mark.parametrize('dataset', [examples.load_hexbeam(), examples.load_structured(),
+                                     pyvista.Sphere().compute_normals(cell_normals=True)])
+def test_transform_point_set_matches_vtk(dataset, inplace, transform_all_input_vectors):
+    dataset = dataset.copy()
+    dataset.point_arrays['vectors'] = np.random.random((dataset.n_points, 3)).astype(np.float32)
+    dataset.point_arrays['integers'] = np.random.randint(0, 100, (dataset.n_points, 3))
+    dataset.cell_arrays['cell_vectors'] = np.random.random((dataset.n_cells, 3))
+    dataset.set_active_vectors('vectors')
+    tf = pyvista.transformations.axis_angle_rotation((1, 2, 3), 33)
+    tf[:3, :3] *= [[1], [2], [0.5]]
+    tf[:3, 3] = [1, 2, 3]
+    tf_orig = tf.copy()
+
+    trans = vtk.vtkTransform()
+    trans.SetMatrix(pyvista.vtkmatrix_from_array(tf))
+    alg = vtk.vtkTransformFilter()
+    alg.SetInputData(dataset)
+    alg.SetTransform(trans)
+    alg.SetTransformAllInputVectors(transform_all_input_vectors)
+    alg.Update()
+    expected = pyvista.wrap(alg.GetOutput())
+
+    original = dataset.copy()
+    transformed = dataset.transform(tf, transform_all_input_vectors=transform_all_input_vectors,
+                                    inplace=inplace)
+    assert np.array_equal(tf, tf_orig)
+    assert (transformed is dataset) == inplace
+    if not inplace:
+        assert np.array_equal(dataset.points, original.points)
+        assert np.array_equal(dataset.point_arrays['vectors'], original.point_arrays['vectors'])
+    assert transformed.points.dtype == expected.points.dtype
+    assert np.allclose(transformed.points, expected.points, atol=1e-5)
+    for expected_arrays, arrays in ((expected.point_arrays, transformed.point_arrays),
+                                    (expected.cell_arrays, transformed.cell_arrays)):
+        for name, array in expected_arrays.items():
+            assert arrays[name].dtype == array.dtype
+            assert np.allclose(arrays[name], array, atol=1e-5)
+    assert transformed.active_vectors_name == 'vectors'
+
+
 @pytest.mark.parametrize('dataset', [
     examples.load_uniform(),  # UniformGrid
     examples.load_rectilinear(),  # RectilinearGrid
@@ -1443,3 +2191,55 @@ def test_extrude_rotate_inplace():
     poly.extrude_rotate(resolution=resolution, inplace=True)
     assert poly.n_cells == old_line.n_points - 1
     assert poly.n_points == (resolution + 1)*old_line.n_points
+
+
+def test_bind_filter():
+    mesh = pyvista.Sphere()
+    mesh.point_arrays['height'] = mesh.points[:, 2]
+    clipper = mesh.bind_filter('clip', normal='x')
+    output = clipper.output
+    assert clipper.name == 'clip'
+    assert clipper.parameters == {'normal': 'x'}
+    for x in [-0.3, 0.0, 0.3]:
+        assert clipper.update(origin=(x, 0, 0)) is output
+        expected = mesh.clip(normal='x', origin=(x, 0, 0))
+        assert output.n_cells == expected.n_cells
+        assert np.allclose(output.points, expected.points)
+        assert np.allclose(output['height'], expected['height'])
+    assert output.active_scalars_name == 'height'
+
+    # no rerun without new parameters or an input change
+    mtime = output.GetMTime()
+    clipper.update()
+    assert output.GetMTime() == mtime
+    mesh.points[:, 0] += 1.0
+    mesh.Modified()
+    clipper.update()
+    assert output.GetMTime() > mtime
+    assert output.bounds[0] > 0.5
+
+    both = mesh.bind_filter('clip', normal='x', origin=(1, 0, 0), return_clipped=True)
+    outputs = both.output
+    assert both.update(origin=(1.2, 0, 0)) is outputs
+    assert sum(part.n_points for part in outputs) > mesh.n_points
+
+    slices = mesh.bind_filter('slice_orthogonal')
+    blocks = slices.output
+    first = blocks[0]
+    assert slices.update(x=1.2) is blocks
+    # plotters map each block, so the blocks are refreshed in place
+    assert blocks[0] is first
+    assert np.isclose(first.bounds[0], 1.2)
+
+    along = mesh.bind_filter('slice_along_axis', n=3)
+    with pytest.raises(TypeError):
+        along.update(n=4)
+
+    with pytest.raises(ValueError):
+        mesh.bind_filter('not_a_filter')
+    with pytest.raises(ValueError):
+        mesh.bind_filter('clip', inplace=True)
+    with pytest.raises(TypeError):
+        mesh.bind_filter('find_closest_point', point=(0, 0, 0))
+    with pytest.raises(TypeError):
+        clipper.update(return_clipped=True)
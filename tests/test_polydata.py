@@ -4,6 +4,7 @@ from math import pi
 
 import numpy as np
 import pytest
+import vtk
 
 import pyvista
 from pyvista import examples
@@ -219,6 +220,58 @@ def test_geodesic_distance(sphere):
     distance = sphere.geodesic_distance(0, sphere.n_points - 1)
     assert isinstance(distance, float)
 
+    # the cached edge graph follows in place edits of the points
+    mesh = pyvista.Sphere()
+    distance = mesh.geodesic_distance(0, 100)
+    points = mesh.points
+    points *= 2
+    assert mesh.geodesic_distance(0, 100) == pytest.approx(2*distance)
+
+
+def test_geodesic_distance_field(sphere):
+    pytest.importorskip('scipy')
+    sources = [0, 10, 100]
+    targets = [1, 50, sphere.n_points - 1]
+    field = sphere.geodesic_distance_field(sources, nearest=False)
+    assert field.shape == (len(sources), sphere.n_points)
+    for i, source in enumerate(sources):
+        assert field[i, source] == 0
+        for target in targets:
+            path = sphere.geodesic(source, target)
+            length = np.sum(path.compute_cell_sizes()['Length'])
+            assert field[i, target] == pytest.approx(length)
+    nearest = sphere.geodesic_distance_field(sources)
+    assert np.allclose(nearest, field.min(axis=0))
+
+    # the cached edge graph follows the points
+    sphere.points *= 2
+    assert np.allclose(sphere.geodesic_distance_field(sources), 2*nearest)
+
+    with pytest.raises(IndexError):
+        sphere.geodesic_distance_field([0, sphere.n_points])
+    with pytest.raises(ValueError):
+        sphere.geodesic_distance_field([])
+
+
+def test_geodesic_paths(sphere):
+    pytest.importorskip('scipy')
+    pairs = [(0, 100), (0, sphere.n_points - 1), (5, 5)]
+    paths = sphere.geodesic_paths(pairs)
+    assert len(paths) == len(pairs)
+    assert paths[-1].n_points == 1
+    assert paths[-1].n_cells == 0
+    for (start, end), path in zip(pairs[:-1], paths[:-1]):
+        ids = path.point_arrays['vtkOriginalPointIds']
+        assert ids[0] == end and ids[-1] == start
+        assert np.allclose(path.points, sphere.points[ids])
+        assert path.n_cells == 1
+        expected = sphere.geodesic(start, end)
+        assert np.sum(path.compute_cell_sizes()['Length']) == pytest.approx(
+            np.sum(expected.compute_cell_sizes()['Length']))
+
+    with pytest.raises(IndexError):
+        sphere.geodesic_paths([(-1, 0)])
+
 
 def test_ray_trace():
     sphere = SPHERE.copy()
@@ -250,6 +303,43 @@ def test_multi_ray_trace():
     assert np.any(ind_t)
 
 
+@pytest.mark.parametrize('first_point', [True, False])
+def test_multi_ray_trace_native(first_point):
+    sphere = SPHERE.copy()
+    rng = np.random.default_rng(0)
+    origins = rng.uniform(-1, 1, (50, 3))
+    directions = rng.normal(size=(50, 3))
+    points, ind_r, ind_t, dist = sphere.multi_ray_trace(origins, directions,
+                                                        first_point=first_point,
+                                                        method='native',
+                                                        return_distances=True)
+    assert np.all(np.diff(ind_r) >= 0)
+    assert np.allclose(np.linalg.norm(points - origins[ind_r], axis=1), dist)
+    for i, (origin, direction) in enumerate(zip(origins, directions)):
+        end_point = origin + direction/np.linalg.norm(direction)*sphere.length
+        expected, cells = sphere.ray_trace(origin, end_point, first_point=first_point)
+        assert np.allclose(points[ind_r == i].ravel(), np.ravel(expected))
+        assert np.array_equal(ind_t[ind_r == i], cells)
+
+    # the cached tree follows changes of the points
+    sphere.points *= 2
+    points, ind_r, ind_t = sphere.multi_ray_trace([[0, 0, 0]], [[1, 0, 0]],
+                                                  first_point=True, method='native')
+    expected, _ = sphere.ray_trace([0, 0, 0], [2, 0, 0], first_point=True)
+    assert np.allclose(points, expected)
+
+    # in place edits through a view of the points are also followed
+    view = sphere.points
+    view += [0.5, 0, 0]
+    points, _, _ = sphere.multi_ray_trace([[0, 0, 0]], [[1, 0, 0]],
+                                          first_point=True, method='native')
+    expected, _ = sphere.ray_trace([0, 0, 0], [3, 0, 0], first_point=True)
+    assert np.allclose(points, expected)
+
+    with pytest.raises(ValueError):
+        sphere.multi_ray_trace(origins, directions, method='not a method')
+
+
 @pytest.mark.skipif(not system_supports_plotting(), reason="Requires system to support plotting")
 def test_plot_curvature():
     sphere = SPHERE.copy()
@@ -330,6 +420,66 @@ def test_boolean_difference():
     assert sub_mesh.n_cells
 
 
+@pytest.mark.parametrize('operation', ['union', 'difference', 'intersection'])
+def test_boolean_culling_matches_vtk(operation):
+    from pyvista.core._mesh_kernels import _vtk_boolean
+    big = pyvista.Sphere(theta_resolution=30, phi_resolution=30)
+    small = pyvista.Sphere(center=(0.45, 0, 0), radius=0.1)
+    if operation == 'intersection':
+        output = big.boolean_cut(small, tolerance=1e-6)
+    else:
+        output = getattr(big, f'boolean_{operation}')(small)
+    expected = _vtk_boolean(big, small, operation, 1e-6)
+    assert output.n_cells == expected.n_cells
+    assert output.n_points == expected.n_points
+    assert output.area == pytest.approx(expected.area)
+    assert output.volume == pytest.approx(expected.volume)
+    assert np.array_equal(np.bincount(output.cell_arrays['CellSource']),
+                          np.bincount(expected.cell_arrays['CellSource']))
+    assert 'Normals' in output.point_arrays
+    assert sorted(output.point_arrays) == sorted(expected.point_arrays)
+    assert sorted(output.cell_arrays) == sorted(expected.cell_arrays)
+    for association in ['point', 'cell']:
+        distances = output.get_array('Distance', association)
+        expected_distances = expected.get_array('Distance', association)
+        assert np.allclose(np.sort(distances), np.sort(expected_distances), atol=1e-5)
+
+
+def test_boolean_culling_disjoint():
+    sphere = pyvista.Sphere()
+    far = pyvista.Sphere(center=(3, 0, 0))
+    union = sphere.boolean_union(far)
+    assert union.n_cells == sphere.n_cells + far.n_cells
+    assert union.volume == pytest.approx(sphere.volume + far.volume)
+    difference = sphere.boolean_difference(far)
+    assert difference.n_cells == sphere.n_cells
+    assert difference.volume == pytest.approx(sphere.volume)
+    assert not sphere.boolean_cut(far).n_cells
+
+
+def test_intersection_culling():
+    sphere = pyvista.Sphere(theta_resolution=30, phi_resolution=30)
+    small = pyvista.Sphere(center=(0.45, 0, 0), radius=0.1)
+    intersection, first, second = sphere.intersection(small)
+    assert intersection.n_cells
+    assert first.n_open_edges == 0
+    assert first.area == pytest.approx(sphere.area)
+    assert second.area == pytest.approx(small.area)
+    assert first.point_arrays['BoundaryPoints'].sum() == intersection.n_points
+    # the cell ids refer to the whole meshes
+    alg = vtk.vtkIntersectionPolyDataFilter()
+    alg.SetInputDataObject(0, sphere)
+    alg.SetInputDataObject(1, small)
+    alg.Update()
+    expected = pyvista.wrap(alg.GetOutput())
+    for name in ['Input0CellID', 'Input1CellID']:
+        assert np.array_equal(np.sort(intersection.cell_arrays[name]),
+                              np.sort(expected.cell_arrays[name]))
+    segments = intersection.points[intersection.lines.reshape(-1, 3)[:, 1]]
+    ids = intersection.cell_arrays['NewCell0ID'][:, 0]
+    assert np.allclose(first.cell_centers().points[ids], segments, atol=0.1)
+
+
 def test_intersection():
     sphere = SPHERE.copy()
     sphere_shifted = SPHERE_SHIFTED.copy()
@@ -445,6 +595,74 @@ def test_extract_feature_edges():
     assert mesh.n_points == more_edges.n_points
 
 
+def _vtk_feature_edges(mesh, feature_angle, boundary_edges, non_manifold_edges,
+                       feature_edges, manifold_edges):
+    alg = vtk.vtkFeatureEdges()
+    alg.SetInputData(mesh)
+    alg.SetFeatureAngle(feature_angle)
+    alg.SetBoundaryEdges(boundary_edges)
+    alg.SetNonManifoldEdges(non_manifold_edges)
+    alg.SetFeatureEdges(feature_edges)
+    alg.SetManifoldEdges(manifold_edges)
+    alg.SetColoring(False)
+    alg.Update()
+    return pyvista.wrap(alg.GetOutput())
+
+
+@pytest.mark.parametrize('flags', [(True, True, True, True), (True, False, False, False),
+                                   (False, True, False, False), (False, False, True, False),
+                                   (False, False, False, True)])
+def test_extract_feature_edges_matches_vtk(flags):
+    # a hill with a boundary, two sharp folds and a non-manifold fin
+    mesh = pyvista.Plane(i_resolution=6, j_resolution=6).triangulate()
+    mesh.points[:, 2] = np.abs(mesh.points[:, 0]) > 0.2
+    mesh.faces = np.hstack([mesh.faces, [3, 8, 9, 40]])
+    mesh.point_arrays['values'] = np.arange(mesh.n_points)
+    mesh.cell_arrays['values'] = np.arange(mesh.n_cells)
+    edges = mesh.extract_feature_edges(30, *flags)
+    expected = _vtk_feature_edges(mesh, 30, *flags)
+    assert edges.n_cells == expected.n_cells
+    assert np.array_equal(edges.lines, expected.lines)
+    assert np.allclose(edges.points, expected.points)
+    assert np.array_equal(edges.point_arrays['values'], expected.point_arrays['values'])
+    assert np.array_equal(edges.cell_arrays['values'], expected.cell_arrays['values'])
+
+    # the edge table is cached until the points move
+    table = mesh._edge_table
+    mesh.extract_feature_edges(30, *flags)
+    assert mesh._edge_table is table
+    mesh.points *= 2
+    mesh.extract_feature_edges(30, *flags)
+    assert mesh._edge_table[2] is table[2]
+    assert mesh._edge_table[5] is not table[5]
+
+
+def test_edge_table_queries():
+    cube = pyvista.Cube()
+    assert cube.n_open_edges == 24
+    # coincident points of the separate faces are merged
+    edges = cube.extract_feature_edges()
+    assert edges.n_points == 8
+    assert edges.n_cells == 24
+
+    cube = cube.clean().triangulate()
+    assert cube.n_open_edges == 0
+    assert cube.extract_all_edges().n_cells == 18
+    assert cube.edge_mask(45).all()
+    assert not cube.edge_mask(95).any()
+    assert 'point_ind' not in cube.point_arrays
+
+    # dihedral angles follow in place edits of the points
+    points = cube.points.view(np.ndarray)
+    points[np.argmax(points[:, 2])] *= 0.1
+    assert cube.extract_feature_edges(45).n_cells == cube.copy().extract_feature_edges(45).n_cells
+
+    # triangle strips fall back to vtkFeatureEdges
+    strips = SPHERE.strip()
+    assert strips.extract_feature_edges(10).n_cells == SPHERE.extract_feature_edges(10).n_cells
+    assert strips.n_open_edges == 0
+
+
 def test_decimate():
     sphere = SPHERE.copy()
     mesh = sphere.copy()
@@ -469,6 +687,47 @@ def test_decimate_pro():
     assert mesh.n_faces < sphere.n_faces
 
 
+@pytest.mark.parametrize('method', ['quadric', 'pro'])
+def test_build_lod(method):
+    sphere = pyvista.Sphere(theta_resolution=40, phi_resolution=40)
+    levels = [0.5, 0.75, 0.9]
+    lods = sphere.build_lod(levels, method=method)
+    assert len(lods) == len(levels)
+    n_cells = [lod.n_cells for lod in lods]
+    assert n_cells == sorted(n_cells, reverse=True)
+    for level, lod in zip(levels, lods):
+        assert lod.n_cells == pytest.approx((1 - level)*sphere.n_cells, rel=0.05)
+        ids = lod.point_arrays['vtkOriginalPointIds']
+        assert ids.max() < sphere.n_points
+        if method == 'pro':
+            assert np.allclose(sphere.points[ids], lod.points)
+        else:
+            assert np.allclose(sphere.points[ids], lod.points, atol=0.05)
+    assert 'vtkOriginalPointIds' not in sphere.point_arrays
+
+    # cached until the mesh changes
+    assert sphere.build_lod(levels, method=method)[0] is lods[0]
+    lods = sphere.build_lod(levels[:2], method=method)
+    assert lods[0] is not sphere.build_lod(levels, method=method)[0]
+    sphere.points *= 2
+    assert sphere.build_lod(levels, method=method)[0] is not lods[0]
+    # including in place edits through a raw view of the points
+    lods = sphere.build_lod(levels, method=method)
+    sphere.points.view(np.ndarray)[:] *= 2
+    assert sphere.build_lod(levels, method=method)[0] is not lods[0]
+
+
+def test_build_lod_raises(sphere):
+    with pytest.raises(ValueError):
+        sphere.build_lod([0.9, 0.5])
+    with pytest.raises(ValueError):
+        sphere.build_lod([0.5, 1.0])
+    with pytest.raises(ValueError):
+        sphere.build_lod(method='clustering')
+    with pytest.raises(TypeError):
+        sphere.build_lod(inplace=True)
+
+
 def test_compute_normals():
     sphere = SPHERE.copy()
     sphere_normals = SPHERE.copy()
@@ -543,6 +802,13 @@ def test_volume():
     ideal_volume = (4/3.0)*pi*radius**3
     assert np.isclose(dense_sphere.volume, ideal_volume, rtol=1E-3)
 
+    # quads, and an open surface handled by vtkMassProperties
+    assert np.isclose(pyvista.Cube(x_length=2).clean().volume, 2)
+    hemisphere = dense_sphere.clip()
+    mprop = vtk.vtkMassProperties()
+    mprop.SetInputData(hemisphere)
+    assert np.isclose(hemisphere.volume, mprop.GetVolume())
+
 
 @pytest.mark.skipif(not system_supports_plotting(), reason="Requires system to support plotting")
 def test_plot_boundaries():
@@ -662,6 +928,82 @@ def test_smooth_inplace(sphere):
     assert not np.allclose(orig_pts, sphere.points)
 
 
+@pytest.mark.parametrize('weights', ['uniform', 'cotangent'])
+def test_laplacian_operator(sphere, weights):
+    pytest.importorskip('scipy')
+    operator = sphere.laplacian_operator(weights)
+    assert operator.shape == (sphere.n_points, sphere.n_points)
+    assert np.allclose(operator @ np.ones(sphere.n_points), 0)
+    # cached until the points or the connectivity change
+    assert sphere.laplacian_operator(weights) is operator
+    sphere.points *= 2
+    assert (sphere.laplacian_operator(weights) is operator) == (weights == 'uniform')
+    # including in place edits through a raw view of the points
+    operator = sphere.laplacian_operator(weights)
+    sphere.points.view(np.ndarray)[0] *= 1.1
+    assert (sphere.laplacian_operator(weights) is operator) == (weights == 'uniform')
+
+    with pytest.raises(ValueError):
+        sphere.laplacian_operator('mean')
+    with pytest.raises(NotAllTrianglesError):
+        pyvista.Plane().laplacian_operator('cotangent')
+
+
+def test_smooth_laplacian(sphere):
+    pytest.importorskip('scipy')
+    smoothed = sphere.smooth_laplacian(n_iter=10, relaxation_factor=0.5)
+    assert smoothed is not sphere
+    assert smoothed.volume < sphere.volume
+
+    taubin = sphere.smooth_taubin(n_iter=10, weights='cotangent')
+    assert abs(taubin.volume - sphere.volume) < sphere.volume - smoothed.volume
+
+    plane = pyvista.Plane(i_resolution=10, j_resolution=10)
+    plane.points += np.random.random(plane.points.shape)*0.01
+    # the points on the edges of the plane
+    on_edges = np.isclose(np.abs(plane.points[:, :2]), 0.5, atol=0.02).any(axis=1)
+    boundary_ids = np.nonzero(on_edges)[0]
+    assert boundary_ids.size == 40
+    orig_pts = plane.points.copy()
+    plane.smooth_taubin(boundary_smoothing=False, inplace=True)
+    assert np.allclose(plane.points[boundary_ids], orig_pts[boundary_ids])
+    assert not np.allclose(plane.points, orig_pts)
+
+    with pytest.raises(ValueError):
+        sphere.smooth_taubin(relaxation_factor=1.5)
+
+
+@pytest.mark.parametrize('weights', ['uniform', 'cotangent'])
+def test_diffuse(sphere, weights):
+    pytest.importorskip('scipy')
+    values = np.zeros((sphere.n_points, 2))
+    values[:, 0] = 1
+    values[0, 1] = 1
+    diffused = sphere.diffuse(values, time=2.0, weights=weights)
+    assert diffused.shape == values.shape
+    assert np.allclose(diffused[:, 0], 1)
+    mass = sphere._laplacians[weights][2]
+    assert np.dot(mass, diffused[:, 1]) == pytest.approx(mass[0])
+    assert 0 < diffused[0, 1] < 1
+
+    sphere['values'] = values[:, 1]
+    assert np.allclose(sphere.diffuse('values', time=2.0, weights=weights), diffused[:, 1])
+    with pytest.raises(ValueError):
+        sphere.diffuse(values[1:])
+
+
+def test_heat_kernel(sphere):
+    pytest.importorskip('scipy')
+    sources = [0, 10, 100]
+    kernel = sphere.heat_kernel(sources, time=4.0, weights='cotangent')
+    assert kernel.shape == (len(sources), sphere.n_points)
+    assert np.allclose(kernel[:, sources], kernel[:, sources].T)
+    assert np.all(kernel[np.arange(3), sources] == kernel.max(axis=1))
+
+    with pytest.raises(IndexError):
+        sphere.heat_kernel([sphere.n_points])
+
+
 def test_delaunay_2d():
     n = 20
     x = np.linspace(-200, 200, num=n) + np.random.uniform(-5, 5, size=n)
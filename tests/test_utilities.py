@@ -235,6 +235,41 @@ def test_voxelize_throws_when_density_is_not_length_3():
         vox = pyvista.voxelize(mesh, [0.5, 0.3])
     assert "not enough values to unpack" in str(e.value)
 
+@pytest.mark.parametrize('density', [0.1, [0.1, 0.15, 0.2]])
+def test_voxelize_output(density):
+    mesh = pyvista.Sphere()
+    vox = pyvista.voxelize(mesh, density)
+    assert isinstance(vox, pyvista.UnstructuredGrid)
+    assert np.all(vox.celltypes == vtk.VTK_HEXAHEDRON)
+    assert np.allclose(vox.compute_cell_sizes()['Volume'], np.prod(density*np.ones(3)))
+
+    mask = pyvista.voxelize(mesh, density, output='mask')
+    assert mask.dtype == np.uint8
+    assert mask.sum() == vox.n_cells
+
+    sparse = pyvista.voxelize(mesh, density, output='sparse')
+    assert sparse.shape == (vox.n_cells, 3)
+    assert np.all(mask[tuple(sparse.T)])
+
+    grid = pyvista.voxelize(mesh, density, output='uniform')
+    assert isinstance(grid, pyvista.UniformGrid)
+    assert grid.n_cells == mask.size
+    assert np.array_equal(grid['Occupancy'], mask.ravel(order='F'))
+    occupied = grid.extract_cells(np.flatnonzero(grid['Occupancy']))
+    assert np.allclose(np.sort(occupied.cell_centers().points, axis=0),
+                       np.sort(vox.cell_centers().points, axis=0))
+
+    # voxels with a corner inside the sphere
+    centers = sparse*density + np.array(mesh.bounds[::2]) + np.array(density)/2
+    assert np.all(np.linalg.norm(centers, axis=1) < 0.5 + np.linalg.norm(density*np.ones(3)))
+
+
+def test_voxelize_invalid():
+    with pytest.raises(ValueError):
+        pyvista.voxelize(pyvista.Sphere(), 0.1, output='invalid')
+    with pytest.raises(RuntimeError):
+        pyvista.voxelize(pyvista.Plane(), 0.1)
+
 def test_report():
     report = pyvista.Report(gpu=True)
     assert report is not None
@@ -468,3 +503,92 @@ def test_apply_transformation_to_points():
     r = transformations.apply_transformation_to_points(tf, points, inplace=True)
     assert r is None
     assert mesh.points == pytest.approx(2 * points_orig)
+
+    # homogeneous scale, leaving the matrix and points type unchanged
+    tf = np.eye(4)
+    tf[:3, 3] = 1
+    tf[3, 3] = 2
+    tf_orig = tf.copy()
+    points_new = transformations.apply_transformation_to_points(tf, points_orig)
+    assert np.array_equal(tf, tf_orig)
+    assert points_new.dtype == points_orig.dtype
+    assert points_new == pytest.approx(points_orig/2 + 0.5)
+    points_new = transformations.apply_transformation_to_points(tf, points_orig.astype(int))
+    assert points_new.dtype == np.float64
+
+
+def test_merge():
+    sphere = pyvista.Sphere()
+    sphere.cell_arrays['ids'] = np.arange(sphere.n_cells, dtype=float)
+    spline = pyvista.Spline(np.random.random((5, 3)))
+    spline.cell_arrays['ids'] = np.array([-1], dtype=np.int32)
+    spline.point_arrays['only_spline'] = np.arange(spline.n_points)
+    cloud = pyvista.PolyData(np.random.random((4, 3)))
+    cloud.cell_arrays['ids'] = np.arange(4, dtype=float)
+    datasets = [sphere, spline, cloud, pyvista.PolyData()]
+
+    # cells are ordered by type like vtkAppendPolyData
+    merged = pyvista.merge(datasets, merge_points=False)
+    assert isinstance(merged, pyvista.PolyData)
+    append = vtk.vtkAppendPolyData()
+    for dataset in datasets:
+        append.AddInputData(dataset)
+    append.Update()
+    expected = pyvista.wrap(append.GetOutput())
+    assert np.array_equal(merged.points, expected.points)
+    assert np.array_equal(merged.faces, expected.faces)
+    assert np.array_equal(merged.lines, expected.lines)
+    assert np.array_equal(merged.verts, expected.verts)
+    # arrays are cast to their common type and dropped when missing
+    assert merged.cell_arrays['ids'].dtype == np.float64
+    assert merged.cell_arrays['ids'][:5].tolist() == [0, 1, 2, 3, -1]
+    assert 'only_spline' not in merged.point_arrays
+    assert 'Normals' not in merged.point_arrays
+
+    # mixed inputs are appended into an unstructured grid like vtkAppendFilter
+    datasets = [sphere, ex.load_hexbeam(), spline, pyvista.UniformGrid((3, 3, 3))]
+    merged = pyvista.merge(datasets, merge_points=False)
+    assert isinstance(merged, pyvista.UnstructuredGrid)
+    append = vtk.vtkAppendFilter()
+    for dataset in datasets:
+        append.AddInputData(dataset)
+    append.Update()
+    expected = pyvista.wrap(append.GetOutput())
+    assert np.array_equal(merged.celltypes, expected.celltypes)
+    assert np.array_equal(merged.cells, expected.cells)
+    assert np.allclose(merged.points, expected.points)
+
+    with pytest.raises(TypeError):
+        pyvista.merge([sphere, 1])
+
+
+@pytest.mark.parametrize('main_has_priority', [True, False])
+def test_merge_points_priority(main_has_priority):
+    first = pyvista.UniformGrid((3, 3, 1)).extract_surface()
+    second = first.copy()
+    second.translate((2, 0, 0))
+    first.point_arrays['data'] = np.zeros(first.n_points)
+    second.point_arrays['data'] = np.ones(second.n_points)
+    merged = pyvista.merge([first, second], main_has_priority=main_has_priority)
+    assert merged.n_points == first.n_points + second.n_points - 3
+    assert merged.n_cells == first.n_cells + second.n_cells
+    shared = merged.points[:, 0] == 2
+    assert shared.sum() == 3
+    assert np.all(merged.point_arrays['data'][shared] == (not main_has_priority))
+
+
+def test_transform_meshes():
+    spheres = [pyvista.Sphere(), pyvista.Sphere()]
+    matrices = np.tile(np.eye(4), (2, 1, 1))
+    matrices[:, :3, 3] = [[1, 0, 0], [0, 2, 0]]
+    transformed = pyvista.transform_meshes(spheres, matrices)
+    assert transformed[0].points == pytest.approx(spheres[0].points + [1, 0, 0])
+    assert transformed[1].points == pytest.approx(spheres[1].points + [0, 2, 0])
+
+    pyvista.transform_meshes(spheres, list(matrices), inplace=True)
+    assert np.array_equal(spheres[0].points, transformed[0].points)
+
+    with pytest.raises(ValueError):
+        pyvista.transform_meshes(spheres, matrices[:1])
+    with pytest.raises(ValueError):
+        pyvista.transform_meshes(spheres, np.ones((2, 3, 3)))